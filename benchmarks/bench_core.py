@@ -0,0 +1,194 @@
+import itertools
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core import blue_ocean
+from core import bsg
+from core import dynamic_capabilities as dc
+from core import five_forces as ff
+from core import force_weights as fw
+from core.curve_library import CurveIndex
+from core.ksf_recommender import KsfRecommender, load_examples
+from core import generic_strategy as gs
+from core import life_cycle as lc
+from core import pestel
+from core import quiz
+from core import review
+from core import strategic_groups as sg
+from core import strategy_clock as clock
+from core import value_stick as vs
+from core import vrio
+
+# ---------------------------------------------------------
+# MICRO-BENCHMARKS OF THE HEADLESS LOGIC
+# ---------------------------------------------------------
+# name -> zero-argument callable. Inputs are built once, outside the
+# timed call; batch inputs use BATCH_ROWS rows.
+BATCH_ROWS = 100_000
+REVIEW_QUESTIONS = 10_000
+BSG_SCENARIOS = 5_000
+CLOCK_RUNS = 250
+SAVED_CURVES = 50_000
+KSF_SEGMENTS = 200_000
+WEIGHT_SAMPLES = fw.DEFAULT_PARAMS["samples"]
+
+
+def strategy_frame(n):
+    rows = list(itertools.product(gs.LEVELS, gs.LEVELS, gs.SCOPES))
+    return pd.DataFrame([rows[i % len(rows)] for i in range(n)], columns=gs.COLUMNS)
+
+
+def vrio_frame(n):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.choice(["yes", "no"], size=(n, 4)), columns=vrio.COLUMNS)
+
+
+def submission_frame(bank, n):
+    rng = np.random.default_rng(0)
+    rows = rng.integers(len(bank["ids"]), size=n)
+    return pd.DataFrame({
+        "question_id": np.asarray(bank["ids"], dtype=object)[rows],
+        "answer": np.array(["A", "B", "C", ""], dtype=object)[rng.integers(4, size=n)],
+    })
+
+
+def tag_frame(n):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "action": np.asarray(dc.ACTIONS, dtype=object)[rng.integers(len(dc.ACTIONS), size=n)],
+        "tag": np.asarray(dc.TAGS, dtype=object)[rng.integers(len(dc.TAGS), size=n)],
+    })
+
+
+def question_bank(n):
+    pages = ["pestel", "five_forces", "value_stick", "competitors"]
+    return quiz.compile_bank(
+        {
+            "id": f"q_bench_{i}",
+            "page": pages[i % len(pages)],
+            "topic": f"Topic {i % 40}",
+            "difficulty": 1 + i % 3,
+            "question": f"Question {i}",
+            "options": ["A", "B", "C"],
+            "answer": i % 3,
+        }
+        for i in range(n)
+    )
+
+
+def review_history(n, now):
+    # Half the bank seen, a fifth of those answered wrong at least once
+    rng = np.random.default_rng(0)
+    cards = review.new_cards(n)
+    for row in rng.choice(n, size=n // 2, replace=False):
+        quality = review.WRONG_QUALITY if rng.random() < 0.2 else review.RIGHT_QUALITY
+        review.review(cards, row, quality, now - rng.integers(0, 30 * 86400))
+    return cards
+
+
+def curve_index(n, dims):
+    rng = np.random.default_rng(0)
+    index = CurveIndex(dims)
+    for i, vector in enumerate(rng.integers(-4, 5, size=(n, dims)).astype(np.float32)):
+        index.put(f"learner{i}", vector)
+    return index
+
+
+def ksf_history(n):
+    # n distinct segments recorded once each; flushed by its writer thread
+    # into a throwaway database
+    path = Path(tempfile.mkdtemp()) / "ksf.db"
+    recommender = KsfRecommender(path, load_examples(), flush_interval=3600)
+    rng = np.random.default_rng(0)
+    picks = rng.integers(len(recommender.ksfs), size=(n, 3))
+    for i in range(n):
+        recommender.record(None, (f"segment {i} city {i % 500}", [recommender.ksfs[j] for j in picks[i]]))
+    return recommender
+
+
+def cases():
+    rules = pestel.load_rules()
+    classifier = pestel.load_classifier()
+    industries = ff.load_industries()
+    lc_base = lc.industry_parameters(industries)
+    lc_curves = lc.diffusion(lc_base)
+    profile_counts = fw.profile_counts(industries["codes"])
+    weights = (1, 2, 1, 1, 3)
+    weight_sim = fw.simulate(profile_counts, weights, samples=WEIGHT_SAMPLES)
+    airlines = int(fw.profile_ids(industries["codes"][:1])[0])
+    strategies = strategy_frame(BATCH_ROWS)
+    inventory = vrio_frame(BATCH_ROWS)
+    panel = sg.synthetic_panel(BATCH_ROWS)[["Price_level", "Service_level"]].to_numpy(dtype=np.float64)
+    bank = question_bank(BATCH_ROWS)
+    bank_rows = quiz.select(bank)
+    bank_answers = np.random.default_rng(0).integers(-1, 3, size=BATCH_ROWS)
+    submissions = submission_frame(bank, BATCH_ROWS)
+    tags = tag_frame(BATCH_ROWS)
+    now = 1_750_000_000.0
+    cards = review_history(REVIEW_QUESTIONS, now)
+    page_rows = quiz.select(question_bank(REVIEW_QUESTIONS), page="value_stick")
+    canvas = blue_ocean.load_canvas()
+    wine_moves = {"eliminate": ["Aging quality"], "reduce": ["Range of wines"], "create": ["Easy drinking"]}
+    wine_dims = len(canvas["industries"]["Wine"]["factors"])
+    curves = curve_index(SAVED_CURVES, wine_dims)
+    query = blue_ocean.move_vector(canvas, "Wine", wine_moves)
+    ksf = ksf_history(KSF_SEGMENTS)
+    scenarios = bsg.decision_grid(
+        {name: np.linspace(*bsg.DECISION_RANGES[name], 9) for name in ["price", "sq", "marketing"]}
+    )
+    scenarios = np.resize(scenarios, (BSG_SCENARIOS, len(bsg.DECISIONS)))
+
+    return {
+        "value_stick.decompose": lambda: vs.decompose(30, 50, 80, 120),
+        "value_stick.sensitivity_grid[step=5]": lambda: vs.sensitivity_grid(5),
+        "generic_strategy.classify": lambda: gs.classify("Higher", "Similar", "Broad market"),
+        f"generic_strategy.classify_frame[{BATCH_ROWS}]": lambda: gs.classify_frame(strategies),
+        "vrio.outcome": lambda: vrio.outcome(True, True, False, True),
+        f"vrio.outcome_codes[{BATCH_ROWS}]": lambda: vrio.outcome_codes(inventory),
+        "pestel.load_rules": pestel.load_rules,
+        "pestel.evaluate": lambda: pestel.evaluate(rules, "Fast Fashion", "Stricter carbon regulation"),
+        "pestel.impact_frame": lambda: pestel.impact_frame(rules),
+        "pestel.load_classifier": pestel.load_classifier,
+        "pestel.TrendClassifier.scores": lambda: classifier.scores("Stricter EU rules on AI and data privacy"),
+        "pestel.TrendClassifier.suggest[memoized]": lambda: classifier.suggest("AI regulation in the EU"),
+        "five_forces.load_industries": ff.load_industries,
+        "five_forces.search[prefix]": lambda: industries["index"].search("Premium Coffee"),
+        "five_forces.search[fuzzy]": lambda: industries["index"].search("premum cofee"),
+        "five_forces.ranking[50]": lambda: ff.ranking(industries, 50),
+        "force_weights.weighted_ranking": lambda: fw.weighted_ranking(industries, weights),
+        f"force_weights.simulate[{WEIGHT_SAMPLES}]": lambda: fw.simulate(profile_counts, weights, samples=WEIGHT_SAMPLES),
+        f"force_weights.move[{WEIGHT_SAMPLES}]": lambda: fw.move(weight_sim, airlines, 0),
+        f"force_weights.summarize[{WEIGHT_SAMPLES}]": lambda: fw.summarize(weight_sim),
+        "life_cycle.diffusion[all industries]": lambda: lc.diffusion(lc_base, 1.5, 0.75),
+        "life_cycle.position[all industries]": lambda: lc.position(lc_base, lc_curves, 5),
+        "life_cycle.profits[all industries]": lambda: lc.profits(lc_base, lc_curves, 0.3),
+        f"strategic_groups[{BATCH_ROWS}, k=4]": lambda: sg.strategic_groups(panel, 4),
+        "quiz.load_bank": quiz.load_bank,
+        f"quiz.select[page+topic+difficulty, bank={BATCH_ROWS}]": lambda: quiz.select(
+            bank, page="value_stick", topic="Topic 7", difficulty=2
+        ),
+        f"quiz.grade[{BATCH_ROWS}]": lambda: quiz.grade(bank, bank_rows, bank_answers),
+        f"quiz.grade_frame[{BATCH_ROWS}]": lambda: quiz.grade_frame(bank, submissions),
+        f"review.next_questions[{REVIEW_QUESTIONS}]": lambda: review.next_questions(cards, now),
+        f"review.next_questions[{REVIEW_QUESTIONS}, one page]": lambda: review.next_questions(
+            cards, now, 1, page_rows
+        ),
+        "review.review": lambda: review.review(cards, 7, review.RIGHT_QUALITY, now),
+        "bsg.evaluate[1]": lambda: bsg.evaluate(0, scenarios[:1]),
+        f"bsg.evaluate[{BSG_SCENARIOS}]": lambda: bsg.evaluate(0, scenarios),
+        f"strategy_clock.simulate[{CLOCK_RUNS}]": lambda: clock.simulate(CLOCK_RUNS, clock.DEFAULT_PARAMS, 0),
+        "blue_ocean.move_vector": lambda: blue_ocean.move_vector(canvas, "Wine", wine_moves),
+        f"CurveIndex.search[{SAVED_CURVES}]": lambda: curves.search(query, 5, exclude="learner7"),
+        f"CurveIndex.put[{SAVED_CURVES}, update]": lambda: curves.put("learner7", query),
+        f"KsfRecommender.suggest[{KSF_SEGMENTS} segments]": lambda: ksf.suggest("Students in city 42"),
+        "KsfRecommender.record": lambda: ksf.record(
+            ("Students in city 42", ["Price sensitivity"]), ("Students in city 42", ["Local adaptation"])
+        ),
+        "dynamic_capabilities.is_correct_tag": lambda: dc.is_correct_tag(
+            "Run surveys to understand changing customer needs", "Sensing"
+        ),
+        f"dynamic_capabilities.tag_codes[{BATCH_ROWS}]": lambda: dc.tag_codes(tags),
+    }
@@ -0,0 +1,45 @@
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from sections import INSTRUCTOR_PAGES, PAGES
+
+# ---------------------------------------------------------
+# FULL-SCRIPT RERUN TIMINGS PER PAGE
+# ---------------------------------------------------------
+APP_PATH = str(Path(__file__).resolve().parent.parent / "app.py")
+
+
+def cold_start():
+    # First run of a fresh AppTest; only meaningful in a fresh process
+    start = time.perf_counter()
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.run()
+    return time.perf_counter() - start
+
+
+def page_reruns(label, reruns):
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    if label in INSTRUCTOR_PAGES:
+        # Only listed in the sidebar with ?instructor=1
+        at.query_params["instructor"] = "1"
+    at.run()
+    at.sidebar.radio[0].set_value(label)
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{label}: {at.exception[0].message}")
+
+    samples = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - start)
+    return first, samples
+
+
+def cases(reruns):
+    # label -> (first visit seconds, [warm rerun seconds])
+    return {label: page_reruns(label, reruns) for label in PAGES}
@@ -0,0 +1,125 @@
+"""Benchmark the app's headless logic and full-page reruns.
+
+    python benchmarks/run.py                       # both suites
+    python benchmarks/run.py --suite core          # micro-benchmarks only
+    python benchmarks/run.py --compare benchmarks/results/<old>.json
+
+Results are written as JSON to benchmarks/results/<git revision>.json.
+Compare two runs to spot regressions across commits; --compare exits
+with status 1 when a case got slower than --threshold allows.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def time_call(fn, repeat):
+    # Seconds per call: timeit picks a loop count of >= 0.2 s, then we
+    # keep the median of `repeat` such loops.
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    runs = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"median_s": statistics.median(runs), "min_s": min(runs), "loops": number}
+
+
+def run_core(repeat):
+    from benchmarks import bench_core
+
+    results = {}
+    for name, fn in bench_core.cases().items():
+        results[name] = time_call(fn, repeat)
+        print(f"  {name:48s} {results[name]['median_s'] * 1e6:12.1f} µs")
+    return results
+
+
+def run_reruns(reruns):
+    from benchmarks import bench_reruns
+
+    results = {"cold_start": {"median_s": bench_reruns.cold_start()}}
+    print(f"  {'cold start':48s} {results['cold_start']['median_s'] * 1e3:12.1f} ms")
+    for label, (first, samples) in bench_reruns.cases(reruns).items():
+        samples.sort()
+        results[label] = {
+            "first_visit_s": first,
+            "median_s": statistics.median(samples),
+            "p95_s": samples[int(0.95 * (len(samples) - 1))],
+        }
+        print(f"  {label:48s} {results[label]['median_s'] * 1e3:12.1f} ms")
+    return results
+
+
+def compare(current, baseline, threshold):
+    regressions = []
+    for suite, cases in current["suites"].items():
+        for name, result in cases.items():
+            old = baseline.get("suites", {}).get(suite, {}).get(name)
+            if not old:
+                continue
+            ratio = result["median_s"] / old["median_s"]
+            flag = "  <-- slower" if ratio > threshold else ""
+            print(f"  {suite:7s} {name:48s} x{ratio:5.2f}{flag}")
+            if flag:
+                regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=["all", "core", "reruns"], default="all")
+    parser.add_argument("--repeat", type=int, default=5, help="timing loops per micro-benchmark")
+    parser.add_argument("--reruns", type=int, default=20, help="warm reruns per page")
+    parser.add_argument("--out", help="output JSON (default: benchmarks/results/<revision>.json)")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "suites": {},
+    }
+    # Reruns first: the cold start number is only honest in a fresh process
+    if args.suite in ("all", "reruns"):
+        print("Page reruns (AppTest):")
+        report["suites"]["reruns"] = run_reruns(args.reruns)
+    if args.suite in ("all", "core"):
+        print("Core micro-benchmarks:")
+        report["suites"]["core"] = run_core(args.repeat)
+
+    out = Path(args.out) if args.out else RESULTS_DIR / f"{report['revision']}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"wrote {out}")
+
+    if args.compare:
+        print(f"Compared with {args.compare} (ratio = now / then):")
+        baseline = json.loads(Path(args.compare).read_text())
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import functools
+import hashlib
+import inspect
+from pathlib import Path
+
+import streamlit as st
+
+# ---------------------------------------------------------
+# SHARED COURSE CONTENT (one copy per process)
+# ---------------------------------------------------------
+# Course material (reference tables, compiled rules, prebuilt charts) is
+# the same for every learner, so it is built once per process through
+# st.cache_resource and handed to every session as the *same object* –
+# callers must treat it as read-only. Session memory then only grows
+# with the learner's own answers.
+#
+# Entries are keyed on version(), a fingerprint of the files in data/:
+# editing or replacing a data file rebuilds the affected content on the
+# next rerun, without restarting the server. Content written as Python
+# literals is covered by also keying on the builder's own source.
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+
+def version():
+    # stat() only, so this is cheap enough to call on every rerun
+    stamp = hashlib.sha1()
+    for path in sorted(DATA_DIR.iterdir()):
+        info = path.stat()
+        stamp.update(f"{path.name}:{info.st_mtime_ns}:{info.st_size};".encode())
+    return stamp.hexdigest()[:12]
+
+
+def shared(build=None, *, max_entries=1, show_spinner=False):
+    # Usable bare (@content.shared) or with options, like st.cache_resource
+    def decorate(build):
+        def cached(content_version, source_version, *args):
+            return build(*args)
+
+        # Streamlit identifies cached functions by module + qualname + source,
+        # and the source it sees here is this wrapper's, hence source_version
+        cached.__module__ = build.__module__
+        cached.__qualname__ = build.__qualname__
+        cached = st.cache_resource(max_entries=max_entries, show_spinner=show_spinner)(cached)
+        source_version = hashlib.sha1(inspect.getsource(build).encode()).hexdigest()[:12]
+
+        @functools.wraps(build)
+        def get(*args):
+            return cached(version(), source_version, *args)
+
+        get.clear = cached.clear
+        return get
+
+    return decorate(build) if build else decorate
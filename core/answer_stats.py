@@ -0,0 +1,118 @@
+import atexit
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from core.answer_store import connect
+
+# ---------------------------------------------------------
+# COHORT ANSWER COUNTS (incremental, write-behind)
+# ---------------------------------------------------------
+# One counter per (question, option) = how many learners currently have
+# that option selected. record() only adjusts in-memory deltas; a
+# background thread adds them to SQLite in one transaction and reloads
+# the totals, which also picks up other server processes' answers.
+# Reading is O(questions x options), however many answers were logged.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS option_counts (
+    question TEXT NOT NULL,
+    option   TEXT NOT NULL,
+    count    INTEGER NOT NULL,
+    PRIMARY KEY (question, option)
+) WITHOUT ROWID
+"""
+ADD = """
+INSERT INTO option_counts (question, option, count) VALUES (?, ?, ?)
+ON CONFLICT (question, option) DO UPDATE SET count = count + excluded.count
+"""
+
+
+class AnswerStats:
+    def __init__(self, path, flush_interval=2.0):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.flush_interval = flush_interval
+
+        self._conn = connect(self.path)
+        self._conn.execute(SCHEMA)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = Counter()
+        self._in_flight = Counter()   # being written; still counted by reads
+        self._totals = self._load()
+        self._closed = False
+        self._wake = threading.Event()
+        self._writer = threading.Thread(target=self._run, name="answer-stats-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _load(self):
+        rows = self._conn.execute("SELECT question, option, count FROM option_counts").fetchall()
+        return Counter({(question, option): count for question, option, count in rows})
+
+    # -- writes ------------------------------------------------
+    def record(self, question, old, new):
+        # A learner moved from option `old` to `new` (either may be None)
+        if old == new:
+            return
+        with self._lock:
+            if old is not None:
+                self._pending[(question, old)] -= 1
+            if new is not None:
+                self._pending[(question, new)] += 1
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, Counter()
+                self._in_flight = pending
+            rows = [(question, option, delta) for (question, option), delta in pending.items() if delta]
+            try:
+                if rows:
+                    with self._conn:
+                        self._conn.execute("BEGIN")
+                        self._conn.executemany(ADD, rows)
+            except sqlite3.Error:
+                # Put the deltas back so the next flush retries them
+                with self._lock:
+                    self._pending.update(pending)
+                    self._in_flight = Counter()
+                raise
+            totals = self._load()
+            with self._lock:
+                self._totals = totals
+                self._in_flight = Counter()
+            return len(rows)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error:
+                time.sleep(self.flush_interval)
+
+    # -- reads -------------------------------------------------
+    def counts(self):
+        # {question: {option: learners}}, including not-yet-flushed answers
+        with self._lock:
+            merged = Counter(self._totals)
+            merged.update(self._in_flight)
+            merged.update(self._pending)
+        by_question = {}
+        for (question, option), count in merged.items():
+            if count > 0:
+                by_question.setdefault(question, {})[option] = count
+        return by_question
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join(timeout=5)
+        self.flush()
+        self._conn.close()
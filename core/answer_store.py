@@ -0,0 +1,148 @@
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# ---------------------------------------------------------
+# DURABLE LEARNER ANSWERS (SQLite, write-behind)
+# ---------------------------------------------------------
+# put() only updates memory: the latest value per (learner, key) waits in
+# a pending dict, so a burst of keystroke reruns collapses into a single
+# row write. A background thread flushes everything pending in one
+# transaction every `flush_interval` seconds. Reads come from an LRU of
+# whole learners and hit SQLite only on a miss.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    learner TEXT NOT NULL,
+    key     TEXT NOT NULL,
+    value   TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (learner, key)
+) WITHOUT ROWID
+"""
+UPSERT = """
+INSERT INTO answers (learner, key, value, updated) VALUES (?, ?, ?, ?)
+ON CONFLICT (learner, key) DO UPDATE SET value = excluded.value, updated = excluded.updated
+"""
+
+
+def connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+class AnswerStore:
+    def __init__(self, path, flush_interval=1.0, cache_size=2048):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.flush_interval = flush_interval
+        self.cache_size = cache_size
+
+        self._write_conn = connect(self.path)
+        self._write_conn.execute(SCHEMA)
+        self._read_conn = connect(self.path)
+        self._read_lock = threading.Lock()
+
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._in_flight = {}          # being written; still visible to reads
+        self._cache = OrderedDict()   # learner -> {key: value}
+        self._wake = threading.Event()
+        self._closed = False
+        self._flush_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._run, name="answer-store-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    # -- reads -------------------------------------------------
+    def get_all(self, learner):
+        with self._lock:
+            cached = self._cache.get(learner)
+            if cached is not None:
+                self._cache.move_to_end(learner)
+                return dict(cached)
+
+        # The read lock is held until the overlay, so a flush cannot
+        # retire its in-flight rows between our SELECT and the merge
+        with self._read_lock:
+            rows = self._read_conn.execute(
+                "SELECT key, value FROM answers WHERE learner = ?", (learner,)
+            ).fetchall()
+            answers = {key: json.loads(value) for key, value in rows}
+            with self._lock:
+                # Rows being written, then writes queued since, are newer
+                for queued in (self._in_flight, self._pending):
+                    for (queued_learner, key), value in queued.items():
+                        if queued_learner == learner:
+                            answers[key] = json.loads(value)
+                self._remember(learner, answers)
+                return dict(answers)
+
+    def _remember(self, learner, answers):
+        self._cache[learner] = answers
+        self._cache.move_to_end(learner)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # -- writes ------------------------------------------------
+    def put(self, learner, key, value):
+        encoded = json.dumps(value)
+        with self._lock:
+            self._pending[(learner, key)] = encoded
+            cached = self._cache.get(learner)
+            if cached is not None:
+                cached[key] = value
+
+    def put_many(self, learner, values):
+        for key, value in values.items():
+            self.put(learner, key, value)
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._in_flight = pending
+            if not pending:
+                return 0
+            now = time.time()
+            rows = [(learner, key, value, now) for (learner, key), value in pending.items()]
+            try:
+                with self._write_conn:
+                    self._write_conn.execute("BEGIN")
+                    self._write_conn.executemany(UPSERT, rows)
+            except sqlite3.Error:
+                # Put the batch back under anything queued since, so the
+                # next flush retries it
+                with self._lock:
+                    self._pending = {**pending, **self._pending}
+                    self._in_flight = {}
+                raise
+            with self._read_lock, self._lock:
+                self._in_flight = {}
+            return len(rows)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # Keep serving; flush() re-queued the batch
+                time.sleep(self.flush_interval)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join(timeout=5)
+        self.flush()
+        self._write_conn.close()
+        self._read_conn.close()
@@ -0,0 +1,72 @@
+import functools
+
+import numpy as np
+
+from core import dynamic_capabilities as dc
+from core import generic_strategy as gs
+from core import quiz
+from core import vrio
+
+# ---------------------------------------------------------
+# BATCH RULES (headless, see tools/batch.py)
+# ---------------------------------------------------------
+# Every task turns one chunk of rows into result columns plus one int
+# code per row; the codes are counted for the run's summary. Tasks are
+# looked up by name, so a process pool only has to pickle the name and
+# the chunk.
+GRADE_LABELS = {
+    quiz.RIGHT: "right",
+    quiz.WRONG: "wrong",
+    quiz.UNANSWERED: "unanswered",
+    quiz.UNKNOWN: "unknown question",
+}
+TAG_LABELS = {1: "right", 0: "wrong", -1: "invalid input"}
+
+
+@functools.lru_cache(maxsize=1)
+def quiz_bank():
+    # Loaded once per worker process
+    return quiz.load_bank()
+
+
+def labels_of(codes, labels):
+    # codes -> label strings; labels: {code: label}
+    keys = np.array(sorted(labels))
+    values = np.array([labels[k] for k in keys], dtype=object)
+    return values[np.searchsorted(keys, codes)]
+
+
+def grade_quiz(frame):
+    codes = quiz.grade_frame(quiz_bank(), frame)
+    return {"grade": labels_of(codes, GRADE_LABELS)}, codes
+
+
+def tag_actions(frame):
+    codes = dc.tag_codes(frame)
+    return {"expected_tag": dc.expected_tags(frame), "grade": labels_of(codes, TAG_LABELS)}, codes
+
+
+def evaluate_vrio(frame):
+    codes = vrio.outcome_codes(frame)
+    return {"vrio_outcome": np.asarray(vrio.OUTCOMES + [vrio.INVALID], dtype=object)[codes]}, codes
+
+
+def classify_strategy(frame):
+    codes = gs.classify_frame(frame)
+    return {"strategy": gs.strategy_labels(codes)}, codes
+
+
+TASKS = {
+    "quiz": {"run": grade_quiz, "labels": GRADE_LABELS},
+    "dc": {"run": tag_actions, "labels": TAG_LABELS},
+    "vrio": {"run": evaluate_vrio, "labels": dict(enumerate(vrio.OUTCOMES)) | {-1: vrio.INVALID}},
+    "strategy": {"run": classify_strategy, "labels": dict(enumerate(gs.STRATEGIES)) | {-1: gs.INVALID}},
+}
+
+
+def run_chunk(task, frame):
+    # Top-level so a process pool can run it. Returns the chunk with the
+    # result columns appended and {code: rows} for the summary.
+    columns, codes = TASKS[task]["run"](frame)
+    codes, counts = np.unique(codes, return_counts=True)
+    return frame.assign(**columns), dict(zip(codes.tolist(), counts.tolist()))
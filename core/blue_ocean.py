@@ -0,0 +1,64 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+# ---------------------------------------------------------
+# BLUE OCEAN VALUE CURVES
+# ---------------------------------------------------------
+# Each industry has a strategy canvas: the factors it competes on, with
+# the industry's typical offering level (0-5), plus new factors nobody
+# offers yet. A set of ERRC moves (eliminate / reduce / raise / create)
+# turns the industry curve into a new value curve; the move vector (new
+# minus industry curve) is what similarity search compares.
+CANVAS_PATH = Path(__file__).resolve().parent.parent / "data" / "blue_ocean.json"
+
+ACTIONS = ["eliminate", "reduce", "raise", "create"]
+MAX_LEVEL = 5
+STEP = 2             # levels a reduce / raise moves a factor
+CREATE_LEVEL = 4     # level a newly created factor is offered at
+
+
+def load_canvas(path=CANVAS_PATH):
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    industries = {}
+    for name, canvas in spec["industries"].items():
+        factors = list(canvas["factors"]) + list(canvas["new_factors"])
+        industries[name] = {
+            "factors": factors,
+            "existing": list(canvas["factors"]),
+            "new": list(canvas["new_factors"]),
+            "column": {factor: j for j, factor in enumerate(factors)},
+            "baseline": np.array(
+                list(canvas["factors"].values()) + [0] * len(canvas["new_factors"]), dtype=np.float32
+            ),
+        }
+    return {"industries": industries, "references": spec["references"]}
+
+
+def value_curve(canvas, industry, moves):
+    # moves: {action: [factor, ...]}; factors the canvas does not know are ignored
+    spec = canvas["industries"][industry]
+    curve = spec["baseline"].copy()
+    for action in ACTIONS:
+        cols = [spec["column"][f] for f in moves.get(action, ()) if f in spec["column"]]
+        if action == "eliminate":
+            curve[cols] = 0
+        elif action == "reduce":
+            curve[cols] = np.maximum(curve[cols] - STEP, 0)
+        elif action == "raise":
+            curve[cols] = np.minimum(curve[cols] + STEP, MAX_LEVEL)
+        else:
+            curve[cols] = np.maximum(curve[cols], CREATE_LEVEL)
+    return curve
+
+
+def move_vector(canvas, industry, moves):
+    return value_curve(canvas, industry, moves) - canvas["industries"][industry]["baseline"]
+
+
+def describe(moves):
+    return "; ".join(
+        f"{action.capitalize()}: {', '.join(moves[action])}" for action in ACTIONS if moves.get(action)
+    )
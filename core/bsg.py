@@ -0,0 +1,200 @@
+import functools
+import itertools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# ---------------------------------------------------------
+# BSG-STYLE MARKET SIMULATION
+# ---------------------------------------------------------
+# Twelve footwear companies sell in four regions for five years. Company
+# 0 is the learner; the rivals' decisions are fixed per market seed.
+# Every function works on a whole batch of scenarios at once: arrays are
+# (scenarios, companies, regions) and the only Python loop is over years.
+REGIONS = ["North America", "Europe-Africa", "Asia-Pacific", "Latin America"]
+N_COMPANIES = 12
+YEARS = 5
+
+# Thousand pairs demanded in year 1 and yearly growth, per region
+BASE_DEMAND = np.array([12_000, 12_000, 9_000, 6_000], dtype=np.float64)
+DEMAND_GROWTH = np.array([0.04, 0.05, 0.08, 0.07])
+
+# The learner's decision vector (same price / marketing in every region)
+DECISIONS = ["price", "sq", "marketing", "capacity"]
+DECISION_RANGES = {
+    "price": (40.0, 100.0),      # $ per pair
+    "sq": (1.0, 10.0),           # S/Q rating, stars
+    "marketing": (0.0, 20.0),    # $M per region per year
+    "capacity": (1_000.0, 8_000.0),  # thousand pairs per year
+}
+DEFAULT_DECISION = {"price": 60.0, "sq": 5.0, "marketing": 5.0, "capacity": 3_300.0}
+
+# Per scenario, for company 0
+METRICS = ["profit", "revenue", "share", "image", "utilization", "rank"]
+
+# Buyer response (multinomial logit over the companies in a region)
+PRICE_ELASTICITY = 3.0   # utility per log-unit of price vs the regional average
+SQ_WEIGHT = 0.25         # per star above the average
+IMAGE_WEIGHT = 0.02      # per image point above the average
+IMAGE_MEMORY = 0.6       # share of last year's image that carries over
+
+# Costs: $ per pair (base + per star), $ per pair of capacity per year
+BASE_COST = 25.0
+SQ_COST = 2.5
+CAPACITY_COST = 6.0
+
+
+@functools.lru_cache(maxsize=32)
+def market(seed=0):
+    rng = np.random.default_rng(seed)
+    rivals = N_COMPANIES - 1
+    n_regions = len(REGIONS)
+    years = np.arange(YEARS)[:, None]
+    demand = BASE_DEMAND * (1 + DEMAND_GROWTH) ** years
+    fair_capacity = demand[0].sum() / N_COMPANIES
+    return {
+        "seed": seed,
+        "demand": demand,
+        "price": rng.normal(60.0, 6.0, (rivals, n_regions)).clip(45.0, 85.0),
+        "sq": rng.uniform(3.0, 8.0, rivals),
+        "marketing": rng.uniform(2.0, 10.0, (rivals, n_regions)),
+        "capacity": fair_capacity * rng.uniform(0.9, 1.3, rivals),
+    }
+
+
+def _with_rivals(mine, theirs):
+    # Puts company 0's value (one per scenario, same in every region) in
+    # front of the rivals': (scenarios,) + (rivals, ...) -> (scenarios, companies, ...)
+    n = len(mine)
+    mine = np.broadcast_to(mine.reshape((n, 1) + (1,) * (theirs.ndim - 1)), (n, 1) + theirs.shape[1:])
+    return np.concatenate([mine, np.broadcast_to(theirs, (n,) + theirs.shape)], axis=1)
+
+
+def simulate(mkt, decisions, history=False):
+    # decisions: (scenarios, 4) in DECISIONS order
+    decisions = np.atleast_2d(np.asarray(decisions, dtype=np.float64))
+    n = len(decisions)
+    price = _with_rivals(decisions[:, 0], mkt["price"])
+    sq = _with_rivals(decisions[:, 1], mkt["sq"])[:, :, None]
+    marketing = _with_rivals(decisions[:, 2], mkt["marketing"])
+    capacity = _with_rivals(decisions[:, 3], mkt["capacity"])
+
+    # Year-invariant pieces of image and utility
+    relative_marketing = marketing / np.maximum(marketing.mean(axis=1, keepdims=True), 1e-9)
+    image_target = 100 * (0.5 * sq / 10 + 0.5 * np.minimum(relative_marketing, 2.0) / 2)
+    base_utility = (
+        -PRICE_ELASTICITY * np.log(price / price.mean(axis=1, keepdims=True))
+        + SQ_WEIGHT * (sq - sq.mean(axis=1, keepdims=True))
+    )
+    unit_cost = BASE_COST + SQ_COST * sq[:, :, 0]
+    fixed_cost = marketing.sum(axis=2) + CAPACITY_COST * capacity / 1000
+
+    image = np.full(price.shape, 50.0)
+    profit = np.zeros((n, N_COMPANIES))
+    revenue = np.zeros(n)
+    utilization = np.zeros(n)
+    trail = []
+    for year in range(YEARS):
+        image = IMAGE_MEMORY * image + (1 - IMAGE_MEMORY) * image_target
+        utility = base_utility + IMAGE_WEIGHT * (image - image.mean(axis=1, keepdims=True))
+        weight = np.exp(utility - utility.max(axis=1, keepdims=True))
+        share = weight / weight.sum(axis=1, keepdims=True)
+
+        wanted = share * mkt["demand"][year]
+        fill = np.minimum(1.0, capacity / np.maximum(wanted.sum(axis=2), 1e-9))
+        sold = wanted * fill[:, :, None]
+        units = sold.sum(axis=2)
+
+        sales = (price * sold).sum(axis=2) / 1000  # $M
+        profit += sales - unit_cost * units / 1000 - fixed_cost
+        revenue += sales[:, 0]
+        utilization += units[:, 0] / capacity[:, 0]
+        if history:
+            trail.append({
+                "share": sold[:, 0] / sold.sum(axis=1),
+                "image": image[:, 0].copy(),
+                "units": sold[:, 0].copy(),
+                "profit": sales[:, 0] - unit_cost[:, 0] * units[:, 0] / 1000 - fixed_cost[:, 0],
+            })
+
+    result = np.column_stack([
+        profit[:, 0],
+        revenue,
+        units[:, 0] / sold.sum(axis=(1, 2)),
+        image[:, 0].mean(axis=1),
+        utilization / YEARS,
+        1 + (profit[:, 1:] > profit[:, :1]).sum(axis=1),
+    ])
+    return (result, trail) if history else result
+
+
+def evaluate(seed, decisions):
+    # Top-level so a process pool can run it on a chunk of scenarios
+    return simulate(market(seed), decisions)
+
+
+def decision_grid(axes):
+    # axes: {decision: values}; decisions not given keep their default
+    values = [np.atleast_1d(axes.get(name, DEFAULT_DECISION[name])) for name in DECISIONS]
+    return np.array(list(itertools.product(*values)), dtype=np.float64).reshape(-1, len(DECISIONS))
+
+
+def sweep(seed, decisions, cache, executor=None, chunk=2_500):
+    # Serves repeated decision vectors from `cache` and simulates only the
+    # rest, in parallel chunks when an executor is given. Returns the
+    # metrics rows and how many of them were simulated here
+    decisions = np.asarray(decisions, dtype=np.float64)
+    keys = decision_keys(seed, decisions)
+    results = np.empty((len(decisions), len(METRICS)))
+    missing = []
+    for i, row in enumerate(cache.get_many(keys)):
+        if row is None:
+            missing.append(i)
+        else:
+            results[i] = row
+    if missing:
+        todo = decisions[missing]
+        if executor is None or len(todo) <= chunk:
+            fresh = evaluate(seed, todo)
+        else:
+            parts = [todo[i:i + chunk] for i in range(0, len(todo), chunk)]
+            fresh = np.concatenate(list(executor.map(evaluate, itertools.repeat(seed), parts)))
+        results[missing] = fresh
+        # Plain tuples: rows of `fresh` would keep the whole array alive
+        cache.put_many([keys[i] for i in missing], map(tuple, fresh.tolist()))
+    return results, len(missing)
+
+
+def decision_keys(seed, decisions):
+    # Cent-level rounding, so slider float noise maps to the same entry
+    return [(seed, *row) for row in np.round(decisions, 2).tolist()]
+
+
+class ScenarioCache:
+    # Bounded LRU of decision key -> metrics row, shared by all sessions
+    def __init__(self, size=100_000):
+        self.size = size
+        self._rows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys):
+        with self._lock:
+            found = []
+            for key in keys:
+                row = self._rows.get(key)
+                if row is not None:
+                    self._rows.move_to_end(key)
+                found.append(row)
+            return found
+
+    def put_many(self, keys, rows):
+        with self._lock:
+            for key, row in zip(keys, rows):
+                self._rows[key] = row
+                self._rows.move_to_end(key)
+            while len(self._rows) > self.size:
+                self._rows.popitem(last=False)
+
+    def __len__(self):
+        return len(self._rows)
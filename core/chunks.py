@@ -0,0 +1,70 @@
+import io
+import itertools
+import json
+from pathlib import Path
+
+import pandas as pd
+
+# ---------------------------------------------------------
+# CHUNKED TABLE READING
+# ---------------------------------------------------------
+DEFAULT_CHUNKSIZE = 100_000
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def iter_chunks(source, name=None, chunksize=DEFAULT_CHUNKSIZE, columns=None):
+    # Yields (DataFrame, fraction_done) pairs, never holding more than one
+    # chunk of the input in memory. `source` is a path or a binary file
+    # object (e.g. a Streamlit UploadedFile); `name` decides the format.
+    name = str(name or source)
+    if name.endswith(".parquet"):
+        yield from _parquet_chunks(source, chunksize, columns)
+    elif name.endswith(JSONL_SUFFIXES):
+        yield from _text_chunks(source, _jsonl_reader, chunksize, columns)
+    else:
+        yield from _text_chunks(source, _csv_reader, chunksize, columns)
+
+
+def _parquet_chunks(source, chunksize, columns):
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(source)
+    total = max(parquet.metadata.num_rows, 1)
+    done = 0
+    for batch in parquet.iter_batches(batch_size=chunksize, columns=columns):
+        done += batch.num_rows
+        yield batch.to_pandas(), done / total
+
+
+def _csv_reader(handle, chunksize, columns):
+    return pd.read_csv(handle, chunksize=chunksize, usecols=columns, dtype=str)
+
+
+def _jsonl_reader(handle, chunksize, columns):
+    # One JSON object per line. dtype=object keeps values as written (a 1
+    # next to a null stays 1, not 1.0), so the label encoders see the same
+    # spellings as in a CSV.
+    while True:
+        lines = list(itertools.islice(handle, chunksize))
+        if not lines:
+            return
+        records = [json.loads(line) for line in lines if line.strip()]
+        if records:
+            yield pd.DataFrame(records, columns=columns, dtype=object)
+
+
+def _text_chunks(source, reader, chunksize, columns):
+    if isinstance(source, (str, Path)):
+        size = Path(source).stat().st_size
+        handle = open(source, "rb")
+    else:
+        handle = source
+        size = handle.seek(0, io.SEEK_END)
+        handle.seek(0)
+    try:
+        for chunk in reader(handle, chunksize, columns):
+            # The parser reads ahead, so the position is an estimate
+            yield chunk, min(handle.tell() / max(size, 1), 1.0)
+    finally:
+        if handle is not source:
+            handle.close()
@@ -0,0 +1,156 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from core import blue_ocean
+from core.answer_store import connect
+
+# ---------------------------------------------------------
+# SHARED LIBRARY OF BLUE OCEAN VALUE CURVES
+# ---------------------------------------------------------
+# Every learner's latest curve per industry is kept in SQLite, next to
+# the reference cases from the canvas file. Per industry, the unit-length
+# move vectors live in a CurveIndex; saving a curve updates one row of it
+# and nearest-neighbour search never rescans the table.
+# Other processes' saves are picked up by `seq`, a counter taken under
+# the write lock: unlike wall-clock stamps it grows in commit order.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS value_curves (
+    industry TEXT NOT NULL,
+    author   TEXT NOT NULL,
+    label    TEXT NOT NULL,
+    moves    TEXT NOT NULL,
+    updated  REAL NOT NULL,
+    seq      INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (industry, author)
+) WITHOUT ROWID
+"""
+ADD_SEQ = "ALTER TABLE value_curves ADD COLUMN seq INTEGER NOT NULL DEFAULT 0"
+SEQ_INDEX = "CREATE INDEX IF NOT EXISTS value_curves_seq ON value_curves (seq)"
+NEXT_SEQ = "SELECT COALESCE(MAX(seq), 0) + 1 FROM value_curves"
+UPSERT = """
+INSERT INTO value_curves (industry, author, label, moves, updated, seq) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (industry, author) DO UPDATE SET
+    label = excluded.label, moves = excluded.moves, updated = excluded.updated, seq = excluded.seq
+"""
+REFERENCE = "reference"
+
+
+class CurveIndex:
+    # Unit vectors in a preallocated float32 matrix that doubles when full,
+    # so an insert is amortised O(dims). A search is one matrix-vector
+    # product over the filled rows plus an argpartition.
+
+    def __init__(self, dims, capacity=1024):
+        self._matrix = np.zeros((capacity, dims), dtype=np.float32)
+        self._keys = []
+        self._rows = {}
+        self._lock = threading.Lock()
+
+    def put(self, key, vector):
+        norm = np.linalg.norm(vector)
+        unit = vector / norm if norm else vector
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                row = len(self._keys)
+                if row == len(self._matrix):
+                    grown = np.zeros((2 * len(self._matrix), self._matrix.shape[1]), dtype=np.float32)
+                    grown[:row] = self._matrix
+                    self._matrix = grown
+                self._keys.append(key)
+                self._rows[key] = row
+            self._matrix[row] = unit
+
+    def search(self, vector, k=5, exclude=None):
+        # [(key, cosine similarity), ...] best first
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return []
+        with self._lock:
+            n = len(self._keys)
+            similarity = self._matrix[:n] @ (vector / norm).astype(np.float32)
+            skip = self._rows.get(exclude)
+            keys = self._keys[:n]
+        if skip is not None:
+            similarity[skip] = -np.inf
+        k = min(k, n - (skip is not None))
+        if k <= 0:
+            return []
+        top = np.argpartition(-similarity, k - 1)[:k]
+        top = top[np.argsort(-similarity[top], kind="stable")]
+        return [(keys[i], float(similarity[i])) for i in top]
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class CurveLibrary:
+    def __init__(self, path, canvas, refresh_interval=5.0):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.canvas = canvas
+        self.refresh_interval = refresh_interval
+        self._conn = connect(str(path))
+        self._conn.execute(SCHEMA)
+        # Tables created before `seq` existed
+        if "seq" not in {row[1] for row in self._conn.execute("PRAGMA table_info(value_curves)")}:
+            self._conn.execute(ADD_SEQ)
+        self._conn.execute(SEQ_INDEX)
+        self._db_lock = threading.Lock()
+        self._entries = {}   # (industry, author) -> {"label", "moves"}
+        self._indexes = {
+            name: CurveIndex(len(spec["factors"])) for name, spec in canvas["industries"].items()
+        }
+        for case in canvas["references"]:
+            self._add(case["industry"], f"{REFERENCE}:{case['name']}", case["name"], case["moves"])
+        self._seen = -1
+        self.refresh()
+
+    def _add(self, industry, author, label, moves):
+        if industry not in self._indexes:
+            return
+        self._entries[(industry, author)] = {"label": label, "moves": moves}
+        self._indexes[industry].put(author, blue_ocean.move_vector(self.canvas, industry, moves))
+
+    def refresh(self):
+        # Picks up curves saved since the last look, by any server process
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT industry, author, label, moves, seq FROM value_curves WHERE seq > ?",
+                (self._seen,),
+            ).fetchall()
+            self._checked = time.monotonic()
+        for industry, author, label, moves, seq in rows:
+            self._add(industry, author, label, json.loads(moves))
+            self._seen = max(self._seen, seq)
+        return len(rows)
+
+    def save(self, industry, author, label, moves):
+        with self._db_lock, self._conn:
+            # IMMEDIATE takes the write lock first, so no other process
+            # can commit between reading the next seq and using it
+            self._conn.execute("BEGIN IMMEDIATE")
+            seq = self._conn.execute(NEXT_SEQ).fetchone()[0]
+            self._conn.execute(UPSERT, (industry, author, label, json.dumps(moves), time.time(), seq))
+        self._add(industry, author, label, moves)
+
+    def get(self, industry, author):
+        return self._entries.get((industry, author))
+
+    def search(self, industry, moves, k=5, author=None):
+        # Nearest saved curves to `moves`, leaving out the author's own
+        if time.monotonic() - self._checked > self.refresh_interval:
+            self.refresh()
+        vector = blue_ocean.move_vector(self.canvas, industry, moves)
+        return [
+            {"author": key, "similarity": similarity, **self._entries[(industry, key)]}
+            for key, similarity in self._indexes[industry].search(vector, k, exclude=author)
+        ]
+
+    def size(self, industry=None):
+        if industry is not None:
+            return len(self._indexes[industry])
+        return sum(len(index) for index in self._indexes.values())
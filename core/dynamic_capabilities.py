@@ -0,0 +1,43 @@
+import numpy as np
+
+from core.labels import encode
+
+# ---------------------------------------------------------
+# SENSING / SEIZING / RECONFIGURING
+# ---------------------------------------------------------
+TAGS = ["Sensing", "Seizing", "Reconfiguring"]
+
+correct_map = {
+    "Launch an internal market scanning unit for AI trends": "Sensing",
+    "Invest heavily in a new subscription-based product": "Seizing",
+    "Shut down a legacy division and retrain employees": "Reconfiguring",
+    "Run surveys to understand changing customer needs": "Sensing",
+}
+
+
+def is_correct_tag(action, tag):
+    return correct_map[action] == tag
+
+
+# Batch tagging: one row per (action, tag) submission
+COLUMNS = ["action", "tag"]
+ACTIONS = list(correct_map)
+EXPECTED = np.array([TAGS.index(correct_map[action]) for action in ACTIONS], dtype=np.int8)
+
+
+def tag_codes(frame):
+    # Per row: 1 = right tag, 0 = wrong tag, -1 = unknown action or tag
+    missing = [col for col in COLUMNS if col not in frame.columns]
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(missing)}")
+    action = encode(frame["action"], ACTIONS)
+    tag = encode(frame["tag"], TAGS)
+    codes = (tag == EXPECTED[action]).astype(np.int8)
+    codes[(action < 0) | (tag < 0)] = -1
+    return codes
+
+
+def expected_tags(frame):
+    # The framework's tag per row ("" for an unknown action)
+    labels = np.asarray(TAGS + [""], dtype=object)
+    return labels[np.append(EXPECTED, -1)[encode(frame["action"], ACTIONS)]]
@@ -0,0 +1,145 @@
+import bisect
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# FIVE FORCES DATASET
+# ---------------------------------------------------------
+DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "industries.csv"
+
+FORCES = ["Threat of new entrants",
+          "Bargaining power of suppliers",
+          "Bargaining power of buyers",
+          "Threat of substitutes",
+          "Rivalry among existing firms"]
+FORCE_COLUMNS = ["new_entrants", "supplier_power", "buyer_power", "substitutes", "rivalry"]
+LEVELS = ["Low", "Medium", "High"]
+
+
+def read_table(path):
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, memory_map=True)
+    dtypes = {col: pd.CategoricalDtype(LEVELS, ordered=True) for col in FORCE_COLUMNS}
+    return pd.read_csv(path, dtype={"industry": str, "sector": str, **dtypes})
+
+
+def attractiveness(codes):
+    # 100 = every force Low, 0 = every force High
+    return 100.0 * (1.0 - codes.sum(axis=-1, dtype=np.float32) / (2 * codes.shape[-1]))
+
+
+def load_industries(path=DATA_PATH):
+    table = read_table(path)
+    # Force levels as an (n_industries, 5) int8 matrix: 0=Low, 1=Medium, 2=High
+    codes = np.empty((len(table), len(FORCE_COLUMNS)), dtype=np.int8)
+    for j, col in enumerate(FORCE_COLUMNS):
+        codes[:, j] = pd.Categorical(table[col], categories=LEVELS, ordered=True).codes
+    if (codes < 0).any():
+        raise ValueError(f"{path}: force levels must be one of {LEVELS}")
+
+    score = attractiveness(codes).astype(np.float32)
+    order = np.argsort(-score, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(1, len(order) + 1)
+    names = table["industry"].to_numpy(dtype=object)
+    return {
+        "names": names,
+        "sectors": table["sector"].to_numpy(dtype=object),
+        "codes": codes,
+        "score": score,
+        "order": order,   # industry ids, most attractive first
+        "rank": rank,     # 1-based attractiveness rank per industry id
+        "index": SearchIndex(names),
+    }
+
+
+def force_levels(dataset, i):
+    return [LEVELS[c] for c in dataset["codes"][i]]
+
+
+def ranked_ids(dataset, n=20, least_attractive=False):
+    order = dataset["order"][::-1] if least_attractive else dataset["order"]
+    return order[:n]
+
+
+def ranking(dataset, n=20, least_attractive=False):
+    ids = ranked_ids(dataset, n, least_attractive)
+    return pd.DataFrame(
+        {
+            "Rank": dataset["rank"][ids],
+            "Industry": dataset["names"][ids],
+            "Sector": dataset["sectors"][ids],
+            "Attractiveness": dataset["score"][ids].round(1),
+            "High forces": (dataset["codes"][ids] == 2).sum(axis=1),
+        }
+    )
+
+
+# ---------------------------------------------------------
+# INDUSTRY LIFE CYCLE
+# ---------------------------------------------------------
+stage_names = {1: "Introduction", 2: "Growth", 3: "Maturity", 4: "Decline"}
+stage_notes = {
+    1: "Few players, lots of uncertainty, experimentation, low profits but big upside.",
+    2: "Demand exploding, many entrants, capacity expansion, still good profitability.",
+    3: "Market saturates; rivalry intensifies; focus on efficiency and differentiation.",
+    4: "Shrinking demand, excess capacity, price wars, many exits or consolidation.",
+}
+
+
+# ---------------------------------------------------------
+# NAME SEARCH
+# ---------------------------------------------------------
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    # Prefix lookups go through a sorted list of lower-cased names
+    # (bisect, O(log n)); anything else falls back to a trigram inverted
+    # index, scored by trigram overlap, so typos still find a match.
+
+    def __init__(self, names):
+        self.names = list(names)
+        lowered = [name.lower() for name in self.names]
+        self._sorted_ids = sorted(range(len(lowered)), key=lowered.__getitem__)
+        self._sorted_keys = [lowered[i] for i in self._sorted_ids]
+
+        postings = defaultdict(list)
+        for i, name in enumerate(lowered):
+            for gram in trigrams(name):
+                postings[gram].append(i)
+        self._postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._gram_counts = np.array([len(trigrams(name)) for name in lowered], dtype=np.int32)
+
+    def prefix(self, query, limit=50):
+        query = query.lower()
+        lo = bisect.bisect_left(self._sorted_keys, query)
+        hi = bisect.bisect_right(self._sorted_keys, query + "\uffff", lo)
+        return self._sorted_ids[lo:min(hi, lo + limit)]
+
+    def fuzzy(self, query, limit=50, min_score=0.3):
+        grams = [self._postings[g] for g in trigrams(query.lower()) if g in self._postings]
+        if not grams:
+            return []
+        hits = np.bincount(np.concatenate(grams), minlength=len(self.names))
+        # Dice coefficient between query and name trigram sets
+        score = 2 * hits / (len(trigrams(query.lower())) + self._gram_counts)
+        top = np.argpartition(-score, min(limit, len(score) - 1))[:limit]
+        top = top[np.argsort(-score[top], kind="stable")]
+        return [int(i) for i in top if score[i] >= min_score]
+
+    def search(self, query, limit=50):
+        query = query.strip()
+        if not query:
+            return []
+        found = self.prefix(query, limit)
+        if len(found) < limit:
+            seen = set(found)
+            found += [i for i in self.fuzzy(query, limit) if i not in seen][:limit - len(found)]
+        return found
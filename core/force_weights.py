@@ -0,0 +1,129 @@
+import itertools
+
+import numpy as np
+
+from core.five_forces import FORCE_COLUMNS, LEVELS
+
+# ---------------------------------------------------------
+# WEIGHTED FIVE FORCES ATTRACTIVENESS (Monte Carlo)
+# ---------------------------------------------------------
+# Attractiveness = 100 x (1 - weighted force pressure / maximum), where a
+# force presses 0 (Low) .. 2 (High). Equal weights give the dataset's own
+# score (five_forces.attractiveness).
+# A score only depends on the industry's force profile, and there are
+# just 3^5 = 243 profiles, so everything here works on profiles plus the
+# number of industries per profile: ranking every industry under 20,000
+# weight vectors is a (20000, 243) problem, not (20000, 4485).
+PROFILES = np.array(list(itertools.product(range(len(LEVELS)), repeat=len(FORCE_COLUMNS))), dtype=np.int8)
+PLACE = len(LEVELS) ** np.arange(len(FORCE_COLUMNS) - 1, -1, -1)   # profile id = base-3 number
+MAX_PRESSURE = len(LEVELS) - 1
+
+BATCH = 4096             # weight vectors ranked per vectorized step
+MIN_ALPHA = 1e-3         # Dirichlet parameters must be > 0 (weight 0 -> almost never drawn)
+
+DEFAULT_PARAMS = {
+    "concentration": 20.0,   # how closely sampled weights follow the chosen ones
+    "samples": 20_000,
+    "top_share": 0.1,        # "top" = the most attractive 10% of industries
+}
+
+
+def profile_ids(codes):
+    return codes.astype(np.int64) @ PLACE
+
+
+def profile_counts(codes):
+    return np.bincount(profile_ids(codes), minlength=len(PROFILES))
+
+
+def scores(weights):
+    # weights (..., 5), any positive scale -> (..., 243) score per profile
+    weights = np.asarray(weights, dtype=np.float32)
+    pressure = weights @ PROFILES.T.astype(np.float32) / weights.sum(axis=-1, keepdims=True)
+    return 100.0 * (1.0 - pressure / MAX_PRESSURE)
+
+
+def ranks(profile_scores, counts):
+    # (k, 243) scores -> (k, 243) rank of each profile's industries: 1 +
+    # the number of industries strictly more attractive, so industries
+    # with equal scores share a rank
+    s = np.atleast_2d(profile_scores)
+    order = np.argsort(-s, axis=1, kind="stable")
+    ordered = np.take_along_axis(s, order, axis=1)
+    sorted_counts = counts[order]
+    before = np.cumsum(sorted_counts, axis=1) - sorted_counts
+    # A run of equal scores takes the count before its first member
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    first = np.maximum.accumulate(np.where(starts, np.arange(s.shape[1]), 0), axis=1)
+    result = np.empty_like(before)
+    np.put_along_axis(result, order, np.take_along_axis(before, first, axis=1) + 1, axis=1)
+    return result
+
+
+def weighted_ranking(dataset, weights):
+    # score / rank / order per industry under fixed weights, the same
+    # fields load_industries() provides for equal weights
+    ids = profile_ids(dataset["codes"])
+    counts = np.bincount(ids, minlength=len(PROFILES))
+    profile_scores = scores(weights)
+    score = profile_scores[ids]
+    return {
+        "score": score,
+        "rank": ranks(profile_scores, counts)[0][ids],
+        "order": np.argsort(-score, kind="stable"),
+        "profiles": ids,
+        "counts": counts,
+    }
+
+
+def dirichlet_alpha(weights, concentration):
+    weights = np.asarray(weights, dtype=np.float64)
+    return np.maximum(concentration * len(weights) * weights / weights.sum(), MIN_ALPHA)
+
+
+def simulate(counts, weights, concentration=20.0, samples=20_000, seed=0):
+    # Draws `samples` weight vectors around `weights` (Dirichlet; higher
+    # concentration = closer) and ranks every profile under each one
+    rng = np.random.default_rng(seed)
+    alpha = dirichlet_alpha(weights, concentration)
+    dtype = np.int16 if counts.sum() < np.iinfo(np.int16).max else np.int32
+    drawn = np.empty((samples, len(FORCE_COLUMNS)), dtype=np.float32)
+    ranked = np.empty((samples, len(PROFILES)), dtype=dtype)
+    for start in range(0, samples, BATCH):
+        stop = min(start + BATCH, samples)
+        drawn[start:stop] = rng.dirichlet(alpha, size=stop - start)
+        ranked[start:stop] = ranks(scores(drawn[start:stop]), counts)
+    return {"weights": drawn, "ranks": ranked, "counts": counts.copy()}
+
+
+def move(sim, a, b):
+    # One industry changes profile a -> b. Per sample, every profile's
+    # rank shifts by at most one (losing a from the industries above it,
+    # gaining b), so nothing is re-sorted and the old ranks stay valid
+    if a == b:
+        return sim
+    s = scores(sim["weights"])
+    ranked = sim["ranks"] - (s[:, [a]] > s) + (s[:, [b]] > s)
+    counts = sim["counts"].copy()
+    counts[a] -= 1
+    counts[b] += 1
+    return {"weights": sim["weights"], "ranks": ranked.astype(sim["ranks"].dtype), "counts": counts}
+
+
+def summarize(sim, top_share=0.1):
+    # Per profile: 5th / 50th / 95th percentile rank over the samples and
+    # the share of samples that put it in the top `top_share` industries
+    ranked = sim["ranks"]
+    n = int(sim["counts"].sum())
+    cells = np.arange(len(PROFILES)) * (n + 1) + ranked
+    hist = np.bincount(cells.ravel(), minlength=len(PROFILES) * (n + 1)).reshape(len(PROFILES), n + 1)
+    cumulative = np.cumsum(hist, axis=1) / len(ranked)
+    top_n = max(1, round(top_share * n))
+    return {
+        "p5": np.argmax(cumulative >= 0.05, axis=1),
+        "median": np.argmax(cumulative >= 0.5, axis=1),
+        "p95": np.argmax(cumulative >= 0.95, axis=1),
+        "top": cumulative[:, top_n],
+        "top_n": top_n,
+    }
@@ -0,0 +1,74 @@
+import numpy as np
+
+from core.labels import encode
+
+# ---------------------------------------------------------
+# GENERIC STRATEGY CLASSIFIER
+# ---------------------------------------------------------
+LEVELS = ["Lower", "Similar", "Higher"]
+SCOPES = ["Broad market", "Niche / focused"]
+STRATEGIES = [
+    "Differentiation strategy",
+    "Cost leadership strategy",
+    "Focused differentiation",
+    "Focused low-cost",
+    "Potentially stuck in the middle 😬",
+]
+STUCK = len(STRATEGIES) - 1
+INVALID = "Invalid input"
+COLUMNS = ["wtp_level", "cost_level", "scope"]
+
+
+def classify(wtp_level, cost_level, scope):
+    if wtp_level == "Higher" and cost_level in ["Similar", "Higher"]:
+        return "Differentiation strategy"
+    elif cost_level == "Lower" and wtp_level in ["Similar", "Lower"]:
+        return "Cost leadership strategy"
+    elif scope == "Niche / focused" and wtp_level == "Higher":
+        return "Focused differentiation"
+    elif scope == "Niche / focused" and cost_level == "Lower":
+        return "Focused low-cost"
+    else:
+        return "Potentially stuck in the middle 😬"
+
+
+def classify_codes(wtp, cost, scope):
+    # Same decision order as classify(), as boolean masks over whole
+    # columns: np.select takes the first condition that holds per row.
+    wtp_higher = wtp == 2
+    cost_lower = cost == 0
+    niche = scope == 1
+    strategy = np.select(
+        [
+            wtp_higher & ((cost == 1) | (cost == 2)),
+            cost_lower & ((wtp == 1) | (wtp == 0)),
+            niche & wtp_higher,
+            niche & cost_lower,
+        ],
+        [0, 1, 2, 3],
+        default=STUCK,
+    ).astype(np.int8)
+    invalid = (wtp < 0) | (cost < 0) | (scope < 0)
+    strategy[invalid] = -1
+    return strategy
+
+
+def classify_frame(frame):
+    missing = [col for col in COLUMNS if col not in frame.columns]
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(missing)}")
+    return classify_codes(
+        encode(frame["wtp_level"], LEVELS),
+        encode(frame["cost_level"], LEVELS),
+        encode(frame["scope"], SCOPES),
+    )
+
+
+def strategy_labels(codes):
+    labels = np.asarray(STRATEGIES + [INVALID], dtype=object)
+    return labels[codes]   # code -1 picks the trailing INVALID label
+
+
+def count_codes(codes):
+    # Counts per strategy, invalid rows last
+    return np.bincount(codes.astype(np.int64) % (len(STRATEGIES) + 1), minlength=len(STRATEGIES) + 1)
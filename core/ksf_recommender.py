@@ -0,0 +1,216 @@
+import atexit
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from core.answer_store import connect
+
+# ---------------------------------------------------------
+# SEGMENT -> KSF RECOMMENDER (hashed co-occurrence counts)
+# ---------------------------------------------------------
+# A segment name is reduced to features: its words plus the whole
+# normalised phrase. Each feature hashes to one of BUCKETS rows of a
+# fixed (BUCKETS + 1, KSFs + 1) count matrix: per row, how many recorded
+# selections had the feature and how many of them chose each KSF; the
+# extra row counts every selection. Memory stays bounded by BUCKETS
+# however many distinct segments are recorded, and SQLite stores only
+# the non-zero cells. As in AnswerStats, record() adjusts the matrix and
+# queues deltas that a background thread writes in one transaction.
+EXAMPLES_PATH = Path(__file__).resolve().parent.parent / "data" / "ksf_segments.json"
+KSFS = [
+    "Brand & lifestyle fit",
+    "Physical convenience / locations",
+    "Digital channels & loyalty app",
+    "Price sensitivity",
+    "Product customization",
+    "Local adaptation",
+    "Operational efficiency",
+]
+BUCKETS = 1 << 16
+OVERALL = -1             # bucket of the all-selections row in SQLite
+SELECTIONS = "*"         # ksf of the selection-count column in SQLite
+PHRASE_WEIGHT = 2.0      # the exact segment name counts double
+SMOOTHING = 2.0          # pseudo-selections at the overall KSF rates
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ksf_counts (
+    bucket INTEGER NOT NULL,
+    ksf    TEXT NOT NULL,
+    count  INTEGER NOT NULL,
+    PRIMARY KEY (bucket, ksf)
+) WITHOUT ROWID
+"""
+ADD = """
+INSERT INTO ksf_counts (bucket, ksf, count) VALUES (?, ?, ?)
+ON CONFLICT (bucket, ksf) DO UPDATE SET count = count + excluded.count
+"""
+
+
+def features(segment):
+    # [(feature, weight)]: the whole phrase, then each distinct word
+    words = re.findall(r"[a-z0-9]+", segment.lower())
+    if not words:
+        return []
+    return [("=" + " ".join(words), PHRASE_WEIGHT)] + [(word, 1.0) for word in dict.fromkeys(words)]
+
+
+def bucket(feature, buckets=BUCKETS):
+    # crc32, not hash(): must agree across processes and restarts
+    return zlib.crc32(feature.encode()) % buckets
+
+
+def load_examples(path=EXAMPLES_PATH):
+    with open(path, encoding="utf-8") as f:
+        return [(example["segment"], example["ksfs"]) for example in json.load(f)["examples"]]
+
+
+class KsfRecommender:
+    def __init__(self, path, examples=(), ksfs=KSFS, buckets=BUCKETS, flush_interval=2.0):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ksfs = list(ksfs)
+        self.buckets = buckets
+        self.flush_interval = flush_interval
+        self._column = {ksf: j for j, ksf in enumerate(self.ksfs)}
+        self._column[SELECTIONS] = len(self.ksfs)
+
+        # Built-in examples are a prior: counted in memory, never written
+        self._examples = Counter()
+        for selection in examples:
+            for cell in self._cells(selection):
+                self._examples[cell] += 1
+
+        self._conn = connect(str(path))
+        self._conn.execute(SCHEMA)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = Counter()
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        self._counts = self._load()
+        self._closed = False
+        self._wake = threading.Event()
+        self._writer = threading.Thread(target=self._run, name="ksf-recommender-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _cells(self, selection):
+        # (row, column) cells one (segment, ksfs) selection adds 1 to
+        if not selection:
+            return []
+        segment, ksfs = selection
+        columns = [self._column[ksf] for ksf in dict.fromkeys(ksfs) if ksf in self._column and ksf != SELECTIONS]
+        rows = {bucket(feature, self.buckets) for feature, _ in features(segment)}
+        if not rows:
+            return []
+        rows.add(self.buckets)
+        return [(row, column) for row in rows for column in columns + [len(self.ksfs)]]
+
+    def _load(self):
+        counts = np.zeros((self.buckets + 1, len(self.ksfs) + 1), dtype=np.int32)
+        for (row, column), n in self._examples.items():
+            counts[row, column] += n
+        for row, ksf, n in self._conn.execute("SELECT bucket, ksf, count FROM ksf_counts"):
+            column = self._column.get(ksf)
+            if column is not None and row < self.buckets:
+                counts[self.buckets if row == OVERALL else row, column] += n
+        return counts
+
+    # -- writes ------------------------------------------------
+    def record(self, old, new):
+        # A learner's selection moved from `old` to `new`; each is a
+        # (segment, ksfs) pair or None
+        if old == new:
+            return
+        with self._lock:
+            for sign, selection in ((-1, old), (1, new)):
+                for cell in self._cells(selection):
+                    self._counts[cell] += sign
+                    self._pending[cell] += sign
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, Counter()
+            rows = [
+                (OVERALL if row == self.buckets else row, self.ksfs[column] if column < len(self.ksfs) else SELECTIONS, delta)
+                for (row, column), delta in pending.items() if delta
+            ]
+            try:
+                if rows:
+                    with self._conn:
+                        self._conn.execute("BEGIN")
+                        self._conn.executemany(ADD, rows)
+            except sqlite3.Error:
+                with self._lock:
+                    self._pending.update(pending)
+                raise
+            # data_version moves only when another connection (another
+            # server process) committed: only then reload the counts
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._data_version:
+                self._data_version = version
+                counts = self._load()
+                with self._lock:
+                    for cell, delta in self._pending.items():
+                        counts[cell] += delta
+                    self._counts = counts
+            return len(rows)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error:
+                time.sleep(self.flush_interval)
+
+    # -- reads -------------------------------------------------
+    def _rows(self, rows, exclude):
+        # Count rows, minus the `exclude` selection (the asking learner's own)
+        with self._lock:
+            counts = self._counts[rows].astype(np.float64)
+        position = {row: i for i, row in enumerate(rows)}
+        for row, column in self._cells(exclude):
+            if row in position:
+                counts[position[row], column] -= 1
+        return np.maximum(counts, 0)
+
+    def suggest(self, segment, exclude=None):
+        # [(ksf, estimated share of similar segments choosing it)], best
+        # first; with no evidence for any feature, the overall rates
+        found = features(segment)
+        rows = [bucket(feature, self.buckets) for feature, _ in found]
+        counts = self._rows(rows + [self.buckets], exclude)
+        overall = counts[-1]
+        prior = overall[:-1] / max(overall[-1], 1)
+        weight = np.array([w for _, w in found]) * counts[:-1, -1] / (counts[:-1, -1] + SMOOTHING)
+        if weight.sum() > 0:
+            rates = (counts[:-1, :-1] + SMOOTHING * prior) / (counts[:-1, -1:] + SMOOTHING)
+            share = weight @ rates / weight.sum()
+        else:
+            share = prior
+        order = np.argsort(-share, kind="stable")
+        return [(self.ksfs[j], float(share[j])) for j in order]
+
+    def evidence(self, segment, exclude=None):
+        # Recorded selections sharing the exact segment name
+        found = features(segment)
+        if not found:
+            return 0
+        return int(self._rows([bucket(found[0][0], self.buckets)], exclude)[0, -1])
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join(timeout=5)
+        self.flush()
+        self._conn.close()
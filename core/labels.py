@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# LABEL ENCODING FOR UPLOADED COLUMNS
+# ---------------------------------------------------------
+TRUE_WORDS = ["1", "true", "yes", "y", "x", "✓", "✅"]
+FALSE_WORDS = ["0", "false", "no", "n", "", "-"]
+
+
+def encode(values, labels):
+    # Case/whitespace-insensitive label -> code (-1 for anything else).
+    # Only the handful of distinct spellings go through string handling.
+    lookup = pd.Index([label.lower() for label in labels])
+    positions, uniques = pd.factorize(np.asarray(values, dtype=object))
+    unique_codes = lookup.get_indexer(pd.Index(uniques.astype(str)).str.strip().str.lower())
+    return np.append(unique_codes, -1)[positions]   # NaN rows (position -1) stay invalid
+
+
+def encode_flags(values):
+    # Yes/no style column -> 1 / 0, or -1 if the value is not recognised.
+    # Blank cells (NaN once read) count as "no", like an unticked box.
+    codes = encode(pd.Series(values, dtype=object).fillna(""), TRUE_WORDS + FALSE_WORDS)
+    return np.where(codes < 0, -1, (codes < len(TRUE_WORDS)).astype(np.int8))
@@ -0,0 +1,147 @@
+import zlib
+
+import numpy as np
+
+from core.five_forces import FORCE_COLUMNS, stage_names
+
+# ---------------------------------------------------------
+# INDUSTRY LIFE CYCLE (Bass diffusion)
+# ---------------------------------------------------------
+# Every industry follows a Bass curve: p = innovation (adopters who come
+# on their own), q = imitation (adopters who follow others). The stage
+# boundaries are the curve's closed-form landmarks: the two inflection
+# points of the adoption rate around its peak (Mahajan, Muller and
+# Srivastava 1990). Introduction ends at t1, growth at the peak, maturity
+# at t2, and adoption then declines.
+# All functions work on every industry at once: per-industry arrays are
+# (n,), curves are (n, len(GRID)).
+STAGES = [stage_names[k] for k in sorted(stage_names)]
+
+# Per sector: p, q, and how far past its peak the typical industry is
+# (age / peak time at the base p and q)
+SECTOR_DIFFUSION = {
+    "Technology": (0.030, 0.50, 0.8),
+    "Telecom & Media": (0.020, 0.45, 1.0),
+    "Health": (0.010, 0.30, 1.0),
+    "Consumer": (0.020, 0.35, 1.0),
+    "Services": (0.020, 0.35, 1.1),
+    "Finance": (0.010, 0.30, 1.1),
+    "Transport": (0.010, 0.25, 1.25),
+    "Industrials": (0.010, 0.20, 1.2),
+    "Energy & Utilities": (0.005, 0.20, 1.3),
+}
+OTHER_SECTOR = (0.020, 0.35, 1.0)
+
+# Force level (0=Low .. 2=High, centred on Medium) -> relative change:
+# easy entry speeds up imitation; intense rivalry and many substitutes
+# mean an older industry
+ENTRY_IMITATION = 0.25
+RIVALRY_AGE = 0.3
+SUBSTITUTES_AGE = 0.2
+AGE_SPREAD = 0.6         # industries in a sector spread over ±60% of its age
+
+EARLY_COST = 0.3         # margin lost before the market has scale
+HORIZON = 40             # years shown on the curves
+GRID = np.linspace(0.0, HORIZON, 2 * HORIZON + 1)
+INFLECTION = np.log(2 + np.sqrt(3))
+
+DEFAULT_PARAMS = {
+    "p_scale": 1.0,      # multiplies every industry's p
+    "q_scale": 1.0,      # multiplies every industry's q
+    "years": 0.0,        # look ahead (or back) from today
+    "crowding": 0.5,     # share of the margin competed away at saturation
+}
+
+
+def industry_parameters(dataset):
+    # Base p, q, age (years) and margin per industry, from the sector and
+    # the Five Forces profile
+    sectors = dataset["sectors"]
+    table = np.array([SECTOR_DIFFUSION.get(s, OTHER_SECTOR) for s in sectors])
+    p, q, maturity = table[:, 0], table[:, 1], table[:, 2]
+    force = dataset["codes"].astype(np.float64) - 1
+    q = q * (1 + ENTRY_IMITATION * force[:, FORCE_COLUMNS.index("new_entrants")])
+
+    # Stable per-name jitter in [-1, 1), so ages do not change between runs
+    jitter = np.array([zlib.crc32(name.encode()) for name in dataset["names"]]) / 2 ** 31 - 1
+    age = (
+        maturity * peak_time(p, q)
+        * (1 + RIVALRY_AGE * force[:, FORCE_COLUMNS.index("rivalry")])
+        * (1 + SUBSTITUTES_AGE * force[:, FORCE_COLUMNS.index("substitutes")])
+        * (1 + AGE_SPREAD * jitter)
+    )
+    return {"p": p, "q": q, "age": age, "margin": dataset["score"] / 100.0}
+
+
+def peak_time(p, q):
+    return np.maximum(np.log(q / p), 0) / (p + q)
+
+
+def bass(p, q, t):
+    # Cumulative adoption F and adoption rate f (share of the eventual
+    # market per year); p, q and t broadcast against each other
+    decay = np.exp(-(p + q) * t)
+    spread = 1 + (q / p) * decay
+    adoption = (1 - decay) / spread
+    rate = (p + q) ** 2 / p * decay / spread ** 2
+    return adoption, rate
+
+
+def diffusion(base, p_scale=1.0, q_scale=1.0):
+    p = base["p"] * p_scale
+    q = base["q"] * q_scale
+    peak = peak_time(p, q)
+    # Without enough imitation the curve has no introduction phase
+    t1 = np.maximum(np.log(q / p) - INFLECTION, 0) / (p + q)
+    t2 = np.maximum(np.log(q / p) + INFLECTION, 0) / (p + q)
+    adoption, rate = bass(p[:, None], q[:, None], GRID)
+    return {
+        "p": p,
+        "q": q,
+        "t1": t1,
+        "peak": peak,
+        "t2": t2,
+        "adoption": adoption.astype(np.float32),
+        "rate": rate.astype(np.float32),
+    }
+
+
+def stage_at(curves, t):
+    # 0-3 (index into STAGES); t is (n,) or broadcastable to (n, k)
+    t = np.asarray(t)
+    shape = (-1,) + (1,) * (t.ndim - 1)
+    return (
+        (t >= curves["t1"].reshape(shape)).astype(np.int8)
+        + (t >= curves["peak"].reshape(shape))
+        + (t >= curves["t2"].reshape(shape))
+    )
+
+
+def position(base, curves, years=0.0):
+    # Where every industry is `years` from today
+    t = np.maximum(base["age"] + years, 0)
+    adoption, rate = bass(curves["p"], curves["q"], t)
+    return {"t": t, "stage": stage_at(curves, t), "adoption": adoption, "rate": rate}
+
+
+def margin(base_margin, adoption, crowding):
+    # Thin while the market lacks scale, competed away as it saturates
+    return base_margin * (1 - crowding * adoption) - EARLY_COST * (1 - adoption)
+
+
+def profits(base, curves, crowding=0.5):
+    # Profit proxy = adoption rate x margin, over GRID; plus its average
+    # per stage across all industries
+    curve = curves["rate"] * margin(base["margin"][:, None], curves["adoption"], crowding)
+    stages = stage_at(curves, np.broadcast_to(GRID, curve.shape))
+    by_stage = np.bincount(stages.ravel(), weights=curve.ravel(), minlength=len(STAGES))
+    cells = np.bincount(stages.ravel(), minlength=len(STAGES))
+    return {
+        "curve": curve.astype(np.float32),
+        "peak_year": GRID[np.argmax(curve, axis=1)],
+        "by_stage": by_stage / np.maximum(cells, 1),
+    }
+
+
+def current_profit(base, now, crowding=0.5):
+    return now["rate"] * margin(base["margin"], now["adoption"], crowding)
@@ -0,0 +1,179 @@
+import functools
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# PESTEL THREAT / OPPORTUNITY RULES
+# ---------------------------------------------------------
+RULES_PATH = Path(__file__).resolve().parent.parent / "data" / "pestel_rules.json"
+
+# Cell codes in the compiled matrix (threat bit | opportunity bit << 1)
+IMPACT_LABELS = ["No clear impact", "Threat", "Opportunity", "Threat & opportunity"]
+
+
+def load_rules(path=RULES_PATH):
+    with open(path, encoding="utf-8") as f:
+        return compile_rules(json.load(f))
+
+
+def compile_rules(spec):
+    # Turns the declarative table into dense (industry x trend) matrices.
+    # Each rule names one trend (or "*") and one industry, a list of
+    # industries, or "*". More specific rules win, later ones break ties:
+    #   default < both "*" < trend "*" < industry "*" < exact (industry, trend)
+    industries = list(spec["industries"])
+    trends = list(spec["trends"])
+    industry_index = {name: i for i, name in enumerate(industries)}
+    trend_index = {name: j for j, name in enumerate(trends)}
+
+    explanations = [spec["default"]["explanation"]]
+    shape = (len(industries), len(trends))
+    threat = np.full(shape, bool(spec["default"]["threat"]))
+    opportunity = np.full(shape, bool(spec["default"]["opportunity"]))
+    explanation_id = np.zeros(shape, dtype=np.int32)
+    specificity = np.zeros(shape, dtype=np.int8)
+
+    for rule in spec["rules"]:
+        rows = _select(rule["industry"], industry_index)
+        cols = _select(rule["trend"], trend_index)
+        level = 1 + (rule["industry"] != "*") + 2 * (rule["trend"] != "*")
+        cells = np.ix_(rows, cols)
+        wins = specificity[cells] <= level
+
+        explanations.append(rule["explanation"])
+        threat[cells] = np.where(wins, bool(rule["threat"]), threat[cells])
+        opportunity[cells] = np.where(wins, bool(rule["opportunity"]), opportunity[cells])
+        explanation_id[cells] = np.where(wins, len(explanations) - 1, explanation_id[cells])
+        specificity[cells] = np.where(wins, level, specificity[cells])
+
+    return {
+        "industries": industries,
+        "trends": trends,
+        "industry_index": industry_index,
+        "trend_index": trend_index,
+        "threat": threat,
+        "opportunity": opportunity,
+        "explanation_id": explanation_id,
+        "explanations": explanations,
+    }
+
+
+def _select(names, index):
+    if names == "*":
+        return np.arange(len(index))
+    if isinstance(names, str):
+        names = [names]
+    missing = [name for name in names if name not in index]
+    if missing:
+        raise ValueError(f"PESTEL rule refers to unknown entries: {missing}")
+    return np.array([index[name] for name in names])
+
+
+def evaluate(rules, industry, trend):
+    i = rules["industry_index"][industry]
+    j = rules["trend_index"][trend]
+    return (
+        bool(rules["threat"][i, j]),
+        bool(rules["opportunity"][i, j]),
+        rules["explanations"][rules["explanation_id"][i, j]],
+    )
+
+
+def impact_codes(rules):
+    return rules["threat"].astype(np.int8) | (rules["opportunity"].astype(np.int8) << 1)
+
+
+def impact_frame(rules):
+    # Long-form industry x trend table of the whole cross-product, for plotting
+    codes = impact_codes(rules)
+    i, j = np.indices(codes.shape)
+    return pd.DataFrame(
+        {
+            "Industry": np.asarray(rules["industries"], dtype=object)[i.ravel()],
+            "Trend": np.asarray(rules["trends"], dtype=object)[j.ravel()],
+            "Impact": np.asarray(IMPACT_LABELS, dtype=object)[codes.ravel()],
+            "Explanation": np.asarray(rules["explanations"], dtype=object)[rules["explanation_id"].ravel()],
+        }
+    )
+
+
+# ---------------------------------------------------------
+# PESTEL AUTO-CLASSIFIER (free-text trend -> dimension)
+# ---------------------------------------------------------
+CORPUS_PATH = Path(__file__).resolve().parent.parent / "data" / "pestel_corpus.json"
+DIMENSIONS = ["Political", "Economic", "Sociocultural", "Technological", "Environmental", "Legal"]
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in into is it its new of on or over than that the their "
+    "to up with".split()
+)
+# Longest first; "ies" becomes "y"
+SUFFIXES = ("ations", "ation", "ings", "ing", "ies", "s")
+
+
+def stem(word):
+    # Crude suffix stripping: enough for "regulations" to match "regulation"
+    for suffix in SUFFIXES:
+        if len(word) > len(suffix) + 2 and word.endswith(suffix) and not word.endswith("ss"):
+            return word[:-len(suffix)] + ("y" if suffix == "ies" else "")
+    return word
+
+
+def tokens(text):
+    return [stem(word) for word in re.findall(r"[a-z0-9]+", text.lower()) if word not in STOPWORDS]
+
+
+def load_classifier(path=CORPUS_PATH):
+    with open(path, encoding="utf-8") as f:
+        return TrendClassifier(json.load(f)["examples"])
+
+
+class TrendClassifier:
+    # One TF-IDF centroid per dimension over the labelled examples, kept as
+    # an inverted index: token -> its weight in every dimension. Scoring a
+    # trend only touches the trend's own tokens, and repeated inputs are
+    # answered from an LRU memo.
+
+    def __init__(self, examples, memo_size=4096):
+        self.dimensions = list(examples)
+        docs = [(d, tokens(text)) for d, dim in enumerate(self.dimensions) for text in examples[dim]]
+        vocabulary = sorted({token for _, words in docs for token in words})
+        column = {token: j for j, token in enumerate(vocabulary)}
+
+        counts = np.zeros((len(self.dimensions), len(vocabulary)))
+        df = np.zeros(len(vocabulary))
+        for d, words in docs:
+            for token in words:
+                counts[d, column[token]] += 1
+            for token in set(words):
+                df[column[token]] += 1
+        idf = np.log((1 + len(docs)) / (1 + df)) + 1
+        centroids = counts * idf
+        centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+        self._idf = dict(zip(vocabulary, idf.tolist()))
+        self._weights = {token: centroids[:, j] for token, j in column.items()}
+        self.suggest = functools.lru_cache(maxsize=memo_size)(self._suggest)
+
+    def scores(self, text):
+        # Cosine similarity between the trend's TF-IDF vector and each centroid
+        known = [token for token in tokens(text) if token in self._weights]
+        total = np.zeros(len(self.dimensions))
+        norm = 0.0
+        for token in set(known):
+            weight = known.count(token) * self._idf[token]
+            total += weight * self._weights[token]
+            norm += weight ** 2
+        return total / np.sqrt(norm) if norm else total
+
+    def _suggest(self, text):
+        # ((dimension, share of the total score), ...) best first; empty
+        # when no word of the trend occurs in the corpus
+        score = self.scores(text)
+        if not score.any():
+            return ()
+        order = np.argsort(-score, kind="stable")
+        return tuple((self.dimensions[d], float(score[d] / score.sum())) for d in order if score[d] > 0)
@@ -0,0 +1,117 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# QUIZ BANK
+# ---------------------------------------------------------
+BANK_PATH = Path(__file__).resolve().parent.parent / "data" / "quiz_bank.json"
+
+# Grades: one int8 per question
+UNANSWERED = -1
+WRONG = 0
+RIGHT = 1
+UNKNOWN = -2         # batch grading: the question id is not in the bank
+
+INDEXED_FIELDS = ("page", "topic", "difficulty")
+# Submission rows for batch grading: question id + the chosen option's text
+COLUMNS = ["question_id", "answer"]
+
+
+def load_bank(path=BANK_PATH):
+    with open(path, encoding="utf-8") as f:
+        return compile_bank(json.load(f)["questions"])
+
+
+def compile_bank(questions):
+    # Questions keep their file order; each indexed field maps a value to
+    # the sorted positions of its questions, so a lookup touches only the
+    # matching questions however large the bank gets.
+    questions = list(questions)
+    position = {}
+    for i, q in enumerate(questions):
+        if q["id"] in position:
+            raise ValueError(f"Duplicate question id {q['id']!r}")
+        if not 0 <= q["answer"] < len(q["options"]):
+            raise ValueError(f"Question {q['id']!r}: answer index out of range")
+        position[q["id"]] = i
+
+    index = {}
+    for field in INDEXED_FIELDS:
+        groups = {}
+        for i, q in enumerate(questions):
+            groups.setdefault(q[field], []).append(i)
+        index[field] = {value: np.array(rows, dtype=np.int32) for value, rows in groups.items()}
+
+    return {
+        "questions": questions,
+        "ids": [q["id"] for q in questions],
+        "position": position,
+        "answer": np.array([q["answer"] for q in questions], dtype=np.int16),
+        "index": index,
+    }
+
+
+def select(bank, page=None, topic=None, difficulty=None):
+    # Intersects the index entries of the given filters, smallest first
+    wanted = [(field, value) for field, value in zip(INDEXED_FIELDS, (page, topic, difficulty)) if value is not None]
+    if not wanted:
+        return np.arange(len(bank["questions"]), dtype=np.int32)
+    empty = np.empty(0, dtype=np.int32)
+    groups = sorted((bank["index"][field].get(value, empty) for field, value in wanted), key=len)
+    rows = groups[0]
+    for other in groups[1:]:
+        rows = np.intersect1d(rows, other, assume_unique=True)
+    return rows
+
+
+def answer_index(question, answer):
+    try:
+        return question["options"].index(answer)
+    except ValueError:
+        return UNANSWERED
+
+
+def grade(bank, rows, answers):
+    # rows: question positions, answers: chosen option index per row
+    # (UNANSWERED if none). One vectorized pass for the whole batch.
+    answers = np.asarray(answers, dtype=np.int16)
+    right = answers == bank["answer"][rows]
+    return np.where(answers < 0, UNANSWERED, right).astype(np.int8)
+
+
+def correct_answer(question):
+    return question["options"][question["answer"]]
+
+
+def grade_frame(bank, frame):
+    # One grade per submission row. Only the distinct (question, answer)
+    # pairs are looked up; options match case- and space-insensitively.
+    missing = [col for col in COLUMNS if col not in frame.columns]
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(missing)}")
+    id_codes, ids = pd.factorize(frame["question_id"].fillna("").astype(str).str.strip())
+    answer_codes, answers = pd.factorize(frame["answer"].fillna("").astype(str).str.strip().str.lower())
+    width = max(len(answers), 1)
+    positions, pairs = pd.factorize(id_codes.astype(np.int64) * width + answer_codes)
+    pair_ids, pair_answers = np.divmod(pairs, width)
+    answers = answers.tolist()
+
+    rows = np.array([bank["position"].get(qid, -1) for qid in ids.tolist()], dtype=np.int64)[pair_ids]
+    known = rows >= 0
+    chosen = np.full(len(pairs), UNANSWERED, dtype=np.int16)
+    options = {}
+    for k in np.flatnonzero(known):
+        text = answers[pair_answers[k]]
+        if not text:
+            continue
+        row = rows[k]
+        if row not in options:
+            options[row] = [option.strip().lower() for option in bank["questions"][row]["options"]]
+        # An answer that is not one of the options is simply wrong
+        chosen[k] = options[row].index(text) if text in options[row] else len(options[row])
+    grades = np.full(len(pairs), UNKNOWN, dtype=np.int8)
+    grades[known] = grade(bank, rows[known], chosen[known])
+    return grades[positions]
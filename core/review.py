@@ -0,0 +1,123 @@
+import numpy as np
+
+# ---------------------------------------------------------
+# SPACED REPETITION (SM-2)
+# ---------------------------------------------------------
+# One fixed-width card per bank question and learner (18 bytes), so a
+# 10k-question bank costs ~180 KB per active learner and choosing the
+# next question is a single vectorized pass over contiguous arrays.
+CARD_DTYPE = np.dtype([
+    ("due", np.uint32),        # minutes since the Unix epoch, 0 = never seen
+    ("interval", np.float32),  # days until the next review
+    ("ease", np.float32),
+    ("reps", np.uint16),       # correct reviews in a row
+    ("seen", np.uint16),
+    ("wrong", np.uint16),
+])
+NEW_EASE = 2.5
+MIN_EASE = 1.3
+RIGHT_QUALITY = 4
+WRONG_QUALITY = 1
+
+# A missed question comes back within the same sitting
+RELEARN_MINUTES = 10
+MAX_INTERVAL_DAYS = 3650
+# A question's past error rate scales its distance from "now" by up to
+# this fraction: overdue ones move further ahead, waiting ones sooner
+ERROR_WEIGHT = 0.5
+# Equal priorities (e.g. all new questions) keep bank order
+TIE_BREAK = 1e-9
+MINUTES_PER_DAY = 24 * 60
+
+RECORD_FIELDS = CARD_DTYPE.names
+
+
+def new_cards(n):
+    cards = np.zeros(n, dtype=CARD_DTYPE)
+    cards["ease"] = NEW_EASE
+    return cards
+
+
+def minutes(now):
+    return int(now // 60)
+
+
+def priority(cards, now):
+    # Lower comes first: overdue reviews (negative), then new questions
+    # (0), then reviews that are not due yet, each adjusted by the
+    # learner's error rate on that question.
+    seen = cards["seen"]
+    wait = np.where(seen > 0, cards["due"].astype(np.float64) - minutes(now), 0.0)
+    error_rate = cards["wrong"] / np.maximum(seen, 1)
+    return wait - ERROR_WEIGHT * error_rate * np.abs(wait)
+
+
+def next_questions(cards, now, k=1, rows=None):
+    # rows restricts the choice (e.g. quiz.select() for one page);
+    # argpartition keeps this O(n) instead of sorting the whole bank
+    if rows is None:
+        rows = np.arange(len(cards), dtype=np.int32)
+        score = priority(cards, now)
+    else:
+        score = priority(cards[rows], now)
+    k = min(k, len(rows))
+    if k == 0:
+        return rows[:0]
+    score += rows * TIE_BREAK
+    top = np.argpartition(score, k - 1)[:k]
+    return rows[top[np.argsort(score[top])]]
+
+
+def review(cards, row, quality, now):
+    # Classic SM-2 update for one answer of quality 0-5
+    ease = cards["ease"][row]
+    if quality >= 3:
+        reps = cards["reps"][row]
+        interval = 1.0 if reps == 0 else 6.0 if reps == 1 else cards["interval"][row] * ease
+        interval = min(interval, MAX_INTERVAL_DAYS)
+        cards["reps"][row] = reps + 1
+        cards["interval"][row] = interval
+        cards["due"][row] = minutes(now) + int(interval * MINUTES_PER_DAY)
+    else:
+        cards["reps"][row] = 0
+        cards["interval"][row] = 1.0
+        cards["wrong"][row] += 1
+        cards["due"][row] = minutes(now) + RELEARN_MINUTES
+    cards["ease"][row] = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    cards["seen"][row] += 1
+
+
+def counts(cards, now, rows=None):
+    if rows is not None:
+        cards = cards[rows]
+    seen = cards["seen"] > 0
+    due = seen & (cards["due"] <= minutes(now))
+    return {
+        "due": int(due.sum()),
+        "new": int((~seen).sum()),
+        "scheduled": int((seen & ~due).sum()),
+    }
+
+
+# -- storage ---------------------------------------------------
+def to_record(cards, ids):
+    # Only questions the learner has seen, as plain lists (JSON-friendly)
+    seen = np.flatnonzero(cards["seen"])
+    record = {"id": [ids[i] for i in seen]}
+    for field in RECORD_FIELDS:
+        record[field] = cards[field][seen].tolist()
+    return record
+
+
+def from_record(record, position, n):
+    # position: question id -> row in the current bank; questions that
+    # were removed from the bank since are dropped
+    cards = new_cards(n)
+    if not record:
+        return cards
+    keep = [k for k, qid in enumerate(record["id"]) if qid in position]
+    rows = [position[record["id"][k]] for k in keep]
+    for field in RECORD_FIELDS:
+        values = np.asarray(record[field])[keep] if keep else []
+        cards[field][rows] = values
+    return cards
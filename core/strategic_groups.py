@@ -0,0 +1,128 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# STRATEGIC GROUPS ON LARGE FIRM PANELS
+# ---------------------------------------------------------
+# Synthetic panel: stylised group centres on the (price, service) map,
+# loosely following the airline toy example.
+PANEL_GROUPS = {
+    "ULCC": (1.0, 1.0),
+    "Low-cost": (2.0, 2.5),
+    "Legacy": (3.5, 3.3),
+    "Premium": (4.7, 4.8),
+}
+
+
+def synthetic_panel(n=100_000, seed=0):
+    rng = np.random.default_rng(seed)
+    names = list(PANEL_GROUPS)
+    centres = np.array([PANEL_GROUPS[name] for name in names], dtype=np.float32)
+    group = rng.choice(len(names), size=n, p=[0.2, 0.35, 0.3, 0.15])
+    points = centres[group] + rng.normal(0.0, 0.35, size=(n, 2)).astype(np.float32)
+    points = np.clip(points, 0.5, 5.5)
+    return pd.DataFrame(
+        {
+            "Firm": np.char.add("Firm ", np.arange(n).astype(str)),
+            "Price_level": points[:, 0],
+            "Service_level": points[:, 1],
+        }
+    )
+
+
+def points_hash(points):
+    points = np.ascontiguousarray(points)
+    return hashlib.sha1(points.tobytes() + str(points.shape).encode()).hexdigest()
+
+
+def standardize(points):
+    mean = points.mean(axis=0)
+    std = points.std(axis=0)
+    std[std == 0] = 1.0
+    return (points - mean) / std
+
+
+def assign(points, centers):
+    # Squared distances via |x|^2 - 2 x.c + |c|^2, one (n, k) matrix
+    d2 = (
+        (points ** 2).sum(axis=1)[:, None]
+        - 2.0 * points @ centers.T
+        + (centers ** 2).sum(axis=1)[None, :]
+    )
+    return d2.argmin(axis=1)
+
+
+def kmeans_pp_init(points, k, rng):
+    centers = [points[rng.integers(len(points))]]
+    d2 = ((points - centers[0]) ** 2).sum(axis=1)
+    for _ in range(1, k):
+        total = d2.sum()
+        i = rng.choice(len(points), p=d2 / total) if total > 0 else rng.integers(len(points))
+        centers.append(points[i])
+        d2 = np.minimum(d2, ((points - points[i]) ** 2).sum(axis=1))
+    return np.array(centers)
+
+
+def kmeans(points, k, n_iter=50, tol=1e-4, seed=0, init_sample=10_000):
+    # Lloyd's algorithm, fully vectorized: assignment is one matrix
+    # product, the centre update one bincount per dimension. k-means++
+    # seeding runs on a random sample so it stays cheap on 100k+ rows.
+    rng = np.random.default_rng(seed)
+    x = np.asarray(points, dtype=np.float64)
+    sample = x[rng.choice(len(x), size=min(len(x), init_sample), replace=False)]
+    centers = kmeans_pp_init(sample, k, rng)
+
+    for _ in range(n_iter):
+        labels = assign(x, centers)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.stack([np.bincount(labels, weights=x[:, j], minlength=k) for j in range(x.shape[1])], axis=1)
+        new = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centers)
+        shift = np.abs(new - centers).max()
+        centers = new
+        if shift < tol:
+            break
+    return assign(x, centers), centers
+
+
+def strategic_groups(points, k, seed=0):
+    # Cluster on standardised price/service, report centres in raw units,
+    # with groups numbered from cheapest to most expensive. There are at
+    # most as many groups as firms.
+    points = np.asarray(points, dtype=np.float64)
+    if not len(points):
+        raise ValueError("no firms to cluster")
+    k = min(k, len(points))
+    labels, _ = kmeans(standardize(points), k, seed=seed)
+    counts = np.bincount(labels, minlength=k)
+    centers = np.stack(
+        [np.bincount(labels, weights=points[:, j], minlength=k) for j in range(2)], axis=1
+    ) / np.maximum(counts, 1)[:, None]
+
+    order = np.argsort(centers[:, 0], kind="stable")
+    relabel = np.empty(k, dtype=np.int32)
+    relabel[order] = np.arange(k)
+    return relabel[labels], centers[order], counts[order]
+
+
+def stratified_sample(labels, max_points, min_per_group=25, seed=0):
+    # Bernoulli sample with a per-group rate, so small groups stay visible
+    rng = np.random.default_rng(seed)
+    counts = np.bincount(labels)
+    rate = np.minimum(1.0, np.maximum(max_points / len(labels), min_per_group / np.maximum(counts, 1)))
+    return np.flatnonzero(rng.random(len(labels)) < rate[labels])
+
+
+def density_grid(points, bins=40):
+    counts, x_edges, y_edges = np.histogram2d(points[:, 0], points[:, 1], bins=bins)
+    ix, iy = np.nonzero(counts)
+    return pd.DataFrame(
+        {
+            "x": x_edges[ix],
+            "x2": x_edges[ix + 1],
+            "y": y_edges[iy],
+            "y2": y_edges[iy + 1],
+            "Firms": counts[ix, iy].astype(np.int64),
+        }
+    )
@@ -0,0 +1,161 @@
+import numpy as np
+
+# ---------------------------------------------------------
+# STRATEGY CLOCK COMPETITION (Monte Carlo)
+# ---------------------------------------------------------
+# Each run is one market: firms start somewhere on the clock (price,
+# perceived benefit, both on a 0-1 scale) and compete for three customer
+# segments period after period. Losing firms cut prices, rivals copy
+# whatever makes a firm stand out (eroding above-average benefit), and a
+# firm whose cash runs out exits.
+# A batch of runs is simulated at once on (runs, firms, segments) arrays.
+ZONES = [
+    "Low price / no-frills",
+    "Standard low price",
+    "Hybrid (good value for money)",
+    "Differentiation (no premium)",
+    "Differentiation with premium",
+    "Focused differentiation (luxury)",
+    "Overpriced (failure zone)",
+]
+# (price, benefit) at the centre of each zone
+ZONE_CENTERS = np.array([
+    [0.20, 0.20],
+    [0.30, 0.50],
+    [0.45, 0.65],
+    [0.50, 0.75],
+    [0.70, 0.80],
+    [0.90, 0.95],
+    [0.75, 0.45],
+])
+POSITION_SPREAD = 0.04
+
+# Segments: share of buyers, weight on benefit, weight on price
+SEGMENTS = np.array([
+    [0.35, 3.0, 12.0],   # price-driven
+    [0.45, 7.0, 7.0],    # mainstream
+    [0.20, 14.0, 3.0],   # premium
+])
+
+START_CASH = 0.5
+FIXED_COST = 0.1         # per firm per period; the market buys one unit per firm
+SHOCK = 0.01             # random drift of benefit per period
+
+DEFAULT_PARAMS = {
+    "firms": 30,
+    "periods": 40,
+    "price_war": 0.10,   # share of its margin a losing firm gives up
+    "imitation": 0.05,   # share of its lead over the average benefit a firm loses
+    "focus_zone": None,  # zone index that gets `focus_share` of the firms
+    "focus_share": 0.0,
+}
+
+# Outcome histograms: per run and zone, share of final sales and
+# survival rate, in BINS equal-width bins over [0, 1]
+BINS = 10
+
+
+def unit_cost(benefit):
+    return 0.1 + 0.6 * benefit ** 2
+
+
+def starting_zones(rng, runs, params):
+    zones = rng.integers(len(ZONES), size=(runs, params["firms"]))
+    if params["focus_zone"] is not None and params["focus_share"] > 0:
+        focused = rng.random((runs, params["firms"])) < params["focus_share"]
+        zones[focused] = params["focus_zone"]
+    return zones
+
+
+def simulate(runs, params, seed):
+    rng = np.random.default_rng(seed)
+    firms = params["firms"]
+    zones = starting_zones(rng, runs, params)
+    start = ZONE_CENTERS[zones] + rng.normal(0, POSITION_SPREAD, (runs, firms, 2))
+    price = start[..., 0].clip(0.05, 1.0)
+    benefit = start[..., 1].clip(0.05, 1.0)
+    cash = np.full((runs, firms), START_CASH)
+    alive = np.ones((runs, firms), dtype=bool)
+    seg_share, benefit_weight, price_weight = (SEGMENTS[:, i] for i in range(3))
+    units = np.zeros((runs, firms))
+
+    for _ in range(params["periods"]):
+        # Logit demand per segment among the surviving firms
+        utility = benefit[..., None] * benefit_weight - price[..., None] * price_weight
+        utility = np.where(alive[..., None], utility, -np.inf)
+        # Runs where every firm has exited are all -inf: shift them by 0
+        # and divide by 1 so they get zero shares instead of NaN + warnings
+        top = np.where(alive.any(axis=1)[:, None, None], utility.max(axis=1, keepdims=True), 0.0)
+        weight = np.exp(utility - top)
+        total = weight.sum(axis=1, keepdims=True)
+        share = weight / np.where(total > 0, total, 1.0)
+        units = firms * (share * seg_share).sum(axis=2)
+
+        margin = price - unit_cost(benefit)
+        cash += np.where(alive, units * margin - FIXED_COST, 0.0)
+        alive &= cash > 0
+        units = np.where(alive, units, 0.0)
+
+        # Below-average sellers cut price; imitation erodes benefit leads
+        n_alive = np.maximum(alive.sum(axis=1, keepdims=True), 1)
+        losing = alive & (units < units.sum(axis=1, keepdims=True) / n_alive)
+        price = np.where(losing, price - params["price_war"] * np.maximum(margin, 0), price)
+        mean_benefit = (benefit * alive).sum(axis=1, keepdims=True) / n_alive
+        lead = np.maximum(benefit - mean_benefit, 0)
+        benefit = benefit - params["imitation"] * lead + rng.normal(0, SHOCK, benefit.shape)
+        benefit = benefit.clip(0.05, 1.0)
+
+    return outcome(zones, alive, units)
+
+
+def outcome(zones, alive, units):
+    # Per-zone sums and histograms; adding two outcomes merges them
+    n_zones = len(ZONES)
+    runs = len(zones)
+    started = _per_zone(zones, np.ones_like(units))
+    survived = _per_zone(zones, alive)
+    sales = _per_zone(zones, units)
+    total = np.maximum(sales.sum(axis=1, keepdims=True), 1e-12)
+    run_share = sales / total
+    present = started > 0
+    run_survival = np.where(present, survived / np.maximum(started, 1), 0.0)
+    return {
+        "runs": runs,
+        "firms": started.sum(axis=0),
+        "survivors": survived.sum(axis=0),
+        "share": run_share.sum(axis=0),
+        "share_hist": _histogram(run_share, np.ones_like(present)),
+        "survival_hist": _histogram(run_survival, present),
+        "zones": n_zones,
+    }
+
+
+def _per_zone(zones, values):
+    # (runs, firms) -> (runs, zones) sums
+    runs = len(zones)
+    flat = (np.arange(runs)[:, None] * len(ZONES) + zones).ravel()
+    sums = np.bincount(flat, weights=np.asarray(values, dtype=np.float64).ravel(), minlength=runs * len(ZONES))
+    return sums.reshape(runs, len(ZONES))
+
+
+def _histogram(values, mask):
+    # (runs, zones) values in [0, 1] -> (zones, BINS) counts of masked cells
+    bins = np.minimum((values * BINS).astype(np.int64), BINS - 1)
+    flat = (np.arange(len(ZONES))[None, :] * BINS + bins)[mask]
+    return np.bincount(flat, minlength=len(ZONES) * BINS).reshape(len(ZONES), BINS)
+
+
+def merge(total, part):
+    if total is None:
+        return dict(part)
+    return {key: total[key] + part[key] if key != "zones" else total[key] for key in total}
+
+
+def run_chunk(runs, params, seed):
+    # Top-level so a process pool can run it
+    return simulate(runs, params, seed)
+
+
+def chunk_plan(runs, chunk=250):
+    # Sizes of the batches a job of `runs` runs is split into
+    return [min(chunk, runs - start) for start in range(0, runs, chunk)]
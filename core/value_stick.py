@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+
+# ---------------------------------------------------------
+# VALUE STICK ARITHMETIC
+# ---------------------------------------------------------
+# Upper ends of the four sliders on the value stick page (all start at 0).
+WTS_MAX = 100
+COST_MAX = 120
+PRICE_MAX = 150
+WTP_MAX = 200
+
+COMPONENTS = ("customer_surplus", "firm_profit", "supplier_surplus", "total_value")
+STATS = ("mean", "min", "max")
+
+# Hard cap on (wts, cost, price, wtp) cells in one grid, so a tiny step
+# cannot allocate gigabytes. Step 4 over the slider ranges is ~1.6M cells.
+MAX_GRID_CELLS = 4_000_000
+
+
+def decompose(wts, cost, price, wtp):
+    # Works on plain numbers and on (broadcastable) NumPy arrays alike.
+    return {
+        "customer_surplus": wtp - price,
+        "firm_profit": price - cost,
+        "supplier_surplus": cost - wts,
+        "total_value": wtp - wts,
+    }
+
+
+def grid_axes(step, wts_max=WTS_MAX, cost_max=COST_MAX, price_max=PRICE_MAX, wtp_max=WTP_MAX):
+    return tuple(
+        np.arange(0, hi + 1, step, dtype=np.int16)
+        for hi in (wts_max, cost_max, price_max, wtp_max)
+    )
+
+
+def grid_cells(step, wts_max=WTS_MAX, cost_max=COST_MAX, price_max=PRICE_MAX, wtp_max=WTP_MAX):
+    return math.prod(hi // step + 1 for hi in (wts_max, cost_max, price_max, wtp_max))
+
+
+def sensitivity_grid(step=5, wts_max=WTS_MAX, cost_max=COST_MAX, price_max=PRICE_MAX, wtp_max=WTP_MAX):
+    # Decompose every valid WTS <= cost <= price <= WTP combination at once.
+    # The four axes are broadcast against each other (order: wts, cost,
+    # price, wtp) and each component is summarised over the two axes the
+    # firm does not control, giving cost x price tables of mean / min / max.
+    n_cells = grid_cells(step, wts_max, cost_max, price_max, wtp_max)
+    if n_cells > MAX_GRID_CELLS:
+        raise ValueError(
+            f"step={step} gives {n_cells:,} grid cells (limit {MAX_GRID_CELLS:,}); use a larger step"
+        )
+
+    wts, cost, price, wtp = grid_axes(step, wts_max, cost_max, price_max, wtp_max)
+    w = wts[:, None, None, None]
+    c = cost[None, :, None, None]
+    p = price[None, None, :, None]
+    v = wtp[None, None, None, :]
+
+    valid = (w <= c) & (c <= p) & (p <= v)
+    count = valid.sum(axis=(0, 3))
+    has_any = count > 0
+
+    result = {
+        "step": step,
+        "cost": cost,
+        "price": price,
+        "count": count,
+        "n_valid": int(count.sum()),
+    }
+    for name, part in decompose(w, c, p, v).items():
+        full = np.broadcast_to(part, valid.shape)
+        total = np.sum(full, axis=(0, 3), where=valid, dtype=np.int64)
+        mean = np.divide(total, count, out=np.full(count.shape, np.nan), where=has_any)
+        lo = np.min(full, axis=(0, 3), where=valid, initial=np.iinfo(np.int16).max).astype(float)
+        hi = np.max(full, axis=(0, 3), where=valid, initial=np.iinfo(np.int16).min).astype(float)
+        lo[~has_any] = np.nan
+        hi[~has_any] = np.nan
+        result[name] = {"mean": mean, "min": lo, "max": hi}
+    return result
@@ -0,0 +1,60 @@
+import numpy as np
+
+from core.labels import encode_flags
+
+# ---------------------------------------------------------
+# VRIO OUTCOMES
+# ---------------------------------------------------------
+# Flags are packed into a 4-bit mask: V=1, R=2, I=4, O=8
+VALUABLE, RARE, INIMITABLE, ORGANIZED = 1, 2, 4, 8
+COLUMNS = ["valuable", "rare", "inimitable", "organized"]
+
+DISADVANTAGE, PARITY, TEMPORARY, MISSED, SUSTAINED = range(5)
+OUTCOMES = [
+    "Competitive disadvantage",
+    "Competitive parity",
+    "Temporary competitive advantage",
+    "Missed opportunity (not organized)",
+    "Sustained competitive advantage",
+]
+INVALID = "Invalid input"
+
+
+def mask(valuable, rare, inimitable, organized):
+    # Works on bools and on 0/1 arrays
+    return valuable * VALUABLE | rare * RARE | inimitable * INIMITABLE | organized * ORGANIZED
+
+
+def _resolve(m):
+    if not m & VALUABLE:
+        return DISADVANTAGE
+    if not m & RARE:
+        return PARITY
+    if not m & INIMITABLE:
+        return TEMPORARY
+    if not m & ORGANIZED:
+        return MISSED
+    return SUSTAINED
+
+
+# All 16 flag combinations resolved once through the VRIO ladder
+OUTCOME_TABLE = np.array([_resolve(m) for m in range(16)], dtype=np.int8)
+
+
+def outcome(valuable, rare, inimitable, organized):
+    return int(OUTCOME_TABLE[mask(bool(valuable), bool(rare), bool(inimitable), bool(organized))])
+
+
+def outcome_codes(frame):
+    missing = [col for col in COLUMNS if col not in frame.columns]
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(missing)}")
+    flags = np.stack([encode_flags(frame[col]) for col in COLUMNS])
+    codes = OUTCOME_TABLE[mask(*flags.clip(0).astype(np.int8))]
+    codes[(flags < 0).any(axis=0)] = -1
+    return codes
+
+
+def count_outcomes(codes):
+    # Counts per outcome, invalid rows last
+    return np.bincount(codes.astype(np.int64) % (len(OUTCOMES) + 1), minlength=len(OUTCOMES) + 1)
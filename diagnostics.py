@@ -0,0 +1,207 @@
+import csv
+import functools
+import io
+import os
+import pickle
+import resource
+import sys
+import time
+from collections import deque
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# ---------------------------------------------------------
+# OPT-IN PERFORMANCE DIAGNOSTICS
+# ---------------------------------------------------------
+# Pages call lap("<section>") right before each section header; the time
+# (and number of deltas sent) since the previous lap is booked on the
+# previous section. Fragments are also wrapped with @timed_fragment(...)
+# since they can rerun on their own. When the sidebar toggle is off, every
+# entry point is a single session_state lookup.
+ENABLED_KEY = "diag_enabled"
+HISTORY_LENGTH = 2_000
+HISTORY_FIELDS = ["run", "time", "page", "section", "wall_ms", "deltas", "session_state_kb", "rss_mb"]
+
+
+def enabled():
+    return st.session_state.get(ENABLED_KEY, False)
+
+
+class _DeltaCounter:
+    # Stands in for the run context's enqueue callback and counts the
+    # delta messages (new or changed elements) on their way out.
+    def __init__(self, enqueue):
+        self.enqueue = enqueue
+        self.deltas = 0
+
+    def __call__(self, msg):
+        if msg.WhichOneof("type") == "delta":
+            self.deltas += 1
+        self.enqueue(msg)
+
+
+# Wraps ScriptRunContext._enqueue, a private Streamlit attribute: it is
+# read without a fallback so a Streamlit upgrade that renames it fails
+# loudly (AttributeError) instead of silently reporting 0 deltas.
+def _delta_counter():
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    enqueue = ctx._enqueue
+    if not isinstance(enqueue, _DeltaCounter):
+        enqueue = _DeltaCounter(enqueue)
+        ctx._enqueue = enqueue
+    return enqueue
+
+
+def _remove_delta_counter():
+    # Puts Streamlit's own callback back
+    ctx = get_script_run_ctx()
+    if ctx is not None and isinstance(ctx._enqueue, _DeltaCounter):
+        ctx._enqueue = ctx._enqueue.enqueue
+
+
+def _toggled():
+    if not enabled():
+        _remove_delta_counter()
+
+
+def _deltas_sent():
+    counter = _delta_counter()
+    return counter.deltas if counter else 0
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        # Peak rather than current RSS; KiB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def session_state_kb():
+    total = 0
+    for key, value in st.session_state.items():
+        if str(key).startswith("diag_"):
+            continue
+        try:
+            total += len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            total += sys.getsizeof(value)
+    return total / 1024
+
+
+def _record(section, wall_s, deltas, **extra):
+    run = st.session_state["diag_run"]
+    st.session_state["diag_history"].append(
+        {
+            "run": run["id"],
+            "time": time.strftime("%H:%M:%S"),
+            "page": run["page"],
+            "section": section,
+            "wall_ms": round(wall_s * 1000, 3),
+            "deltas": deltas,
+            **extra,
+        }
+    )
+
+
+def _close_lap(now):
+    run = st.session_state["diag_run"]
+    name, start, deltas_before = run["lap"]
+    _record(name, now - start, _deltas_sent() - deltas_before)
+
+
+def begin_run(page):
+    if not enabled():
+        return
+    state = st.session_state
+    if "diag_history" not in state:
+        state["diag_history"] = deque(maxlen=HISTORY_LENGTH)
+    previous = state.get("diag_run", {}).get("id", 0)
+    now = time.perf_counter()
+    state["diag_run"] = {"id": previous + 1, "page": page, "start": now, "lap": ("(page import & header)", now, _deltas_sent())}
+
+
+def lap(name):
+    if not enabled() or "diag_run" not in st.session_state:
+        return
+    now = time.perf_counter()
+    _close_lap(now)
+    st.session_state["diag_run"]["lap"] = (name, now, _deltas_sent())
+
+
+def _fragment_rerun():
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
+
+
+def timed_fragment(name):
+    # In a full run the fragment's time is already inside the page's laps;
+    # only fragment-only reruns are booked separately.
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled() or "diag_run" not in st.session_state or not _fragment_rerun():
+                return fn(*args, **kwargs)
+            deltas_before = _deltas_sent()
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(f"{name} (fragment rerun)", time.perf_counter() - start, _deltas_sent() - deltas_before)
+        return wrapper
+    return decorate
+
+
+def end_run():
+    if not enabled() or "diag_run" not in st.session_state:
+        return
+    now = time.perf_counter()
+    _close_lap(now)
+    run = st.session_state["diag_run"]
+    _record(
+        "(whole run)",
+        now - run["start"],
+        _deltas_sent(),
+        session_state_kb=round(session_state_kb(), 1),
+        rss_mb=round(rss_mb(), 1),
+    )
+
+
+def history_csv():
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=HISTORY_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(st.session_state.get("diag_history", ()))
+    return out.getvalue()
+
+
+def sidebar_panel():
+    st.sidebar.toggle("🩺 Performance diagnostics", key=ENABLED_KEY, on_change=_toggled)
+    if not enabled() or "diag_history" not in st.session_state:
+        return
+    history = list(st.session_state["diag_history"])
+    run_id = st.session_state["diag_run"]["id"]
+    rows = [row for row in history if row["run"] == run_id]
+    if not rows:
+        return
+    summary = rows[-1]
+    col1, col2 = st.sidebar.columns(2)
+    col1.metric("Rerun", f"{summary['wall_ms']:.0f} ms")
+    col2.metric("Deltas sent", summary["deltas"])
+    col1.metric("Session state", f"{summary['session_state_kb']:.0f} KB")
+    col2.metric("Process RSS", f"{summary['rss_mb']:.0f} MB")
+    st.sidebar.dataframe(
+        [{"Section": row["section"], "ms": row["wall_ms"], "Deltas": row["deltas"]} for row in rows[:-1]],
+        hide_index=True
+    )
+    st.sidebar.download_button(
+        f"⬇️ Export history ({len(history):,} rows, CSV)",
+        history_csv(),
+        file_name="diagnostics_history.csv",
+        mime="text/csv"
+    )
@@ -0,0 +1,104 @@
+import os
+import uuid
+from pathlib import Path
+
+import streamlit as st
+
+from core.answer_stats import AnswerStats
+from core.answer_store import AnswerStore
+from core.blue_ocean import load_canvas
+from core.curve_library import CurveLibrary
+from core.ksf_recommender import KsfRecommender, load_examples
+
+# ---------------------------------------------------------
+# SAVING LEARNER ANSWERS BETWEEN SESSIONS
+# ---------------------------------------------------------
+DB_PATH = os.environ.get(
+    "COMPETITIVE_STRATEGY_DB",
+    str(Path(__file__).resolve().parent / "state" / "answers.db")
+)
+
+# Keys whose values survive the session: every quiz radio (q_*), the
+# free-text exercises, the segment / KSF choice (and the selection last
+# recorded for the KSF recommender) and the spaced-review cards.
+PERSISTED_PREFIXES = ("q_",)
+PERSISTED_KEYS = {
+    "bo_raise", "bo_reduce", "bo_create", "bo_eliminate",
+    "dc_sensing", "dc_seizing", "dc_reconfig",
+    "ksf_segment", "ksfs", "ksf_recorded",
+    "review_cards",
+}
+
+
+def is_persisted(key):
+    return key in PERSISTED_KEYS or key.startswith(PERSISTED_PREFIXES)
+
+
+@st.cache_resource
+def answer_store():
+    return AnswerStore(DB_PATH)
+
+
+# Cohort counts per quiz option, read by the instructor dashboard
+@st.cache_resource
+def answer_stats():
+    return AnswerStats(DB_PATH)
+
+
+# Segment x KSF co-occurrence counts behind the KSF suggestions
+@st.cache_resource
+def ksf_recommender():
+    return KsfRecommender(DB_PATH, load_examples())
+
+
+# Saved Blue Ocean curves of the whole class plus the reference cases
+@st.cache_resource
+def curve_library():
+    return CurveLibrary(DB_PATH, load_canvas())
+
+
+def learner_id():
+    # Kept in the URL so a bookmark or reload brings the same answers back
+    learner = st.query_params.get("learner")
+    if not learner:
+        learner = uuid.uuid4().hex[:12]
+        st.query_params["learner"] = learner
+    return learner
+
+
+def restore():
+    # Streamlit drops a widget's state when its page is not shown, so this
+    # runs every rerun: any saved answer missing from the session is put
+    # back before the widgets are created. Served from the store's LRU.
+    saved = answer_store().get_all(learner_id())
+    snapshot = st.session_state.setdefault("_persist_snapshot", {})
+    for key, value in saved.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+        snapshot.setdefault(key, value)
+
+
+def save_changes():
+    # Queues only values that changed since the last save; the store
+    # coalesces and writes them in the background.
+    snapshot = st.session_state.setdefault("_persist_snapshot", {})
+    changed = {}
+    for key in list(st.session_state.keys()):
+        if not isinstance(key, str) or not is_persisted(key):
+            continue
+        value = st.session_state[key]
+        if snapshot.get(key) != value:
+            changed[key] = value
+    if changed:
+        answer_store().put_many(learner_id(), changed)
+        for key, value in changed.items():
+            if key.startswith(PERSISTED_PREFIXES):
+                answer_stats().record(key, snapshot.get(key), value)
+        snapshot.update(changed)
+
+
+def sidebar_note():
+    st.sidebar.caption(
+        f"💾 Answers are saved for learner **{learner_id()}** – "
+        "bookmark this page's URL to pick up where you left off."
+    )
@@ -0,0 +1,34 @@
+import importlib
+
+# ---------------------------------------------------------
+# PAGE REGISTRY
+# ---------------------------------------------------------
+# Sidebar label -> module inside this package. A page module is only
+# imported the first time somebody visits it; after that it stays in
+# sys.modules, so its module-level data is built once per process and
+# each rerun only executes the active page's render().
+PAGES = {
+    "Welcome & Course Map": "welcome",
+    "Macro-Environment & PESTEL": "pestel",
+    "Industry Analysis & Five Forces": "five_forces",
+    "Value Stick & Generic Strategies": "value_stick",
+    "Strategy Clock & Blue Ocean": "strategy_clock",
+    "Competitors, Markets & BSG": "competitors",
+    "BSG Market Simulator": "bsg",
+    "Resources, VRIO & RBV": "resources",
+    "Dynamic Capabilities & Adaptation": "dynamic_capabilities",
+    "Adaptive Review": "review",
+    "Instructor Dashboard": "instructor",
+}
+
+# Only listed with ?instructor=1 in the URL – keeps the student sidebar
+# tidy; it is not access control
+INSTRUCTOR_PAGES = {"Instructor Dashboard"}
+
+
+def load_page(label):
+    return importlib.import_module(f"{__name__}.{PAGES[label]}")
+
+
+def render_page(label):
+    load_page(label).render()
@@ -0,0 +1,188 @@
+import time
+
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import diagnostics
+import workers
+from core import bsg
+
+
+# ---------------------------------------------------------
+# 6b. BSG MARKET SIMULATOR
+# ---------------------------------------------------------
+DECISION_LABELS = {
+    "price": "Price ($ per pair)",
+    "sq": "S/Q rating (stars)",
+    "marketing": "Marketing ($M per region per year)",
+    "capacity": "Plant capacity (thousand pairs per year)",
+}
+DECISION_STEPS = {"price": 1.0, "sq": 0.5, "marketing": 0.5, "capacity": 100.0}
+METRIC_LABELS = {
+    "profit": "5-year profit ($M)",
+    "revenue": "5-year revenue ($M)",
+    "share": "Final market share",
+    "image": "Image rating",
+    "utilization": "Capacity utilization",
+    "rank": "Profit rank (of 12)",
+}
+# Lower is better only for the rank
+BEST = {metric: ("min" if metric == "rank" else "max") for metric in bsg.METRICS}
+MAX_STEPS = 15
+MAX_SCENARIOS = MAX_STEPS ** len(bsg.DECISIONS)
+
+
+# Results by decision vector, shared by every session
+@st.cache_resource
+def scenario_cache():
+    return bsg.ScenarioCache()
+
+
+@st.cache_data(max_entries=64)
+def scenario_detail(seed, decision):
+    result, trail = bsg.simulate(bsg.market(seed), [decision], history=True)
+    frame = pd.DataFrame([
+        {
+            "Year": year + 1,
+            "Region": region,
+            "Market share": float(step["share"][0, r]),
+            "Image rating": float(step["image"][0, r]),
+            "Pairs sold (k)": float(step["units"][0, r]),
+        }
+        for year, step in enumerate(trail)
+        for r, region in enumerate(bsg.REGIONS)
+    ])
+    return dict(zip(bsg.METRICS, result[0].tolist())), frame
+
+
+def show_metrics(metrics):
+    cols = st.columns(len(bsg.METRICS))
+    for col, metric in zip(cols, bsg.METRICS):
+        value = metrics[metric]
+        text = f"{value:.1%}" if metric in ("share", "utilization") else f"{value:,.0f}"
+        col.metric(METRIC_LABELS[metric], text)
+
+
+# A fragment: dragging a decision slider reruns only this panel
+@st.fragment
+@diagnostics.timed_fragment("BSG decisions")
+def decision_panel(seed):
+    colA, colB = st.columns(2)
+    decision = []
+    for i, name in enumerate(bsg.DECISIONS):
+        low, high = bsg.DECISION_RANGES[name]
+        with (colA if i % 2 == 0 else colB):
+            decision.append(st.slider(
+                DECISION_LABELS[name], low, high, bsg.DEFAULT_DECISION[name],
+                step=DECISION_STEPS[name], key=f"bsg_{name}"
+            ))
+    metrics, frame = scenario_detail(seed, tuple(decision))
+    show_metrics(metrics)
+    chart = alt.Chart(frame).mark_line(point=True).encode(
+        x=alt.X("Year:O"),
+        y=alt.Y("Market share:Q", axis=alt.Axis(format="%")),
+        color="Region:N",
+        tooltip=["Year:O", "Region:N", alt.Tooltip("Market share:Q", format=".1%"), "Image rating:Q", "Pairs sold (k):Q"],
+    )
+    st.altair_chart(chart, width="stretch")
+
+
+def run_sweep(seed, axes):
+    decisions = bsg.decision_grid(axes)
+    cache = scenario_cache()
+    start = time.perf_counter()
+    results, simulated = bsg.sweep(seed, decisions, cache, executor=workers.process_pool())
+    st.session_state["bsg_sweep"] = {
+        "seed": seed,
+        "frame": pd.DataFrame(
+            np.column_stack([decisions, results]).astype(np.float32),
+            columns=bsg.DECISIONS + bsg.METRICS,
+        ),
+        "seconds": time.perf_counter() - start,
+        "simulated": simulated,
+    }
+
+
+def sweep_form(seed):
+    with st.form("bsg_sweep_form"):
+        axes = {}
+        for name in bsg.DECISIONS:
+            low, high = bsg.DECISION_RANGES[name]
+            colR, colN = st.columns([3, 1])
+            span = colR.slider(
+                DECISION_LABELS[name], low, high, (low, high),
+                step=DECISION_STEPS[name], key=f"bsg_sweep_{name}"
+            )
+            steps = colN.number_input("Steps", 1, MAX_STEPS, 5, key=f"bsg_steps_{name}")
+            axes[name] = np.linspace(span[0], span[1], int(steps))
+        submitted = st.form_submit_button("▶️ Run sweep")
+    if submitted:
+        count = int(np.prod([len(v) for v in axes.values()]))
+        with st.spinner(f"Simulating {count:,} scenarios…"):
+            run_sweep(seed, axes)
+
+
+def sweep_results(seed):
+    sweep = st.session_state.get("bsg_sweep")
+    if sweep is None:
+        st.caption("Pick ranges above and run a sweep to compare scenarios.")
+        return
+    if sweep["seed"] != seed:
+        # Results belong to another market: don't show them as this one's
+        st.caption(f"The last sweep was for market #{sweep['seed']} – run it again for market #{seed}.")
+        return
+    frame = sweep["frame"]
+    st.caption(
+        f"{len(frame):,} scenarios in {sweep['seconds']:.2f} s – "
+        f"{sweep['simulated']:,} newly simulated, the rest served from the scenario cache."
+    )
+
+    metric = st.selectbox("Rank scenarios by:", bsg.METRICS, format_func=METRIC_LABELS.get, key="bsg_metric")
+    ascending = BEST[metric] == "min"
+    st.dataframe(frame.sort_values(metric, ascending=ascending).head(10), hide_index=True)
+
+    colX, colY = st.columns(2)
+    x = colX.selectbox("Heatmap x:", bsg.DECISIONS, index=0, format_func=DECISION_LABELS.get, key="bsg_x")
+    y = colY.selectbox("Heatmap y:", bsg.DECISIONS, index=2, format_func=DECISION_LABELS.get, key="bsg_y")
+    if x == y:
+        st.info("Pick two different decisions for the heatmap.")
+        return
+    # Best achievable value for each (x, y) over the other decisions
+    best = frame.groupby([x, y], as_index=False)[metric].agg(BEST[metric])
+    heatmap = alt.Chart(best).mark_rect().encode(
+        x=alt.X(f"{x}:O", title=DECISION_LABELS[x], axis=alt.Axis(format=",.1f")),
+        y=alt.Y(f"{y}:O", title=DECISION_LABELS[y], sort="descending", axis=alt.Axis(format=",.1f")),
+        color=alt.Color(f"{metric}:Q", title=METRIC_LABELS[metric],
+                        scale=alt.Scale(scheme="redyellowgreen", reverse=ascending)),
+        tooltip=[f"{x}:Q", f"{y}:Q", alt.Tooltip(f"{metric}:Q", format=",.2f")],
+    )
+    st.altair_chart(heatmap, width="stretch")
+
+
+def render():
+    st.title("👟 BSG Market Simulator")
+
+    st.markdown(
+        """
+        A simplified **Business Strategy Game** market: 12 footwear companies sell in 4 regions for 5 years.
+        Buyers compare **price**, **S/Q rating** and **image** (built by S/Q and marketing) against the
+        regional average; your **capacity** caps what you can ship. You are company 1 – the rivals'
+        decisions stay fixed for a given market.
+        """
+    )
+    seed = st.number_input("Market (rival behaviour) #", 0, 999, 0, key="bsg_seed")
+
+    diagnostics.lap("1. Your decisions")
+    st.markdown("### 1. Your decisions")
+    decision_panel(int(seed))
+
+    diagnostics.lap("2. What-if sweep")
+    st.markdown("### 2. What-if sweep")
+    st.write(
+        f"Every combination of the steps below is simulated (up to {MAX_SCENARIOS:,} scenarios). "
+        "Scenarios anyone has already run are served from a shared cache."
+    )
+    sweep_form(int(seed))
+    sweep_results(int(seed))
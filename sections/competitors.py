@@ -0,0 +1,232 @@
+import io
+
+import altair as alt
+import numpy as np
+import streamlit as st
+import pandas as pd
+
+import content
+import diagnostics
+from core import strategic_groups as sg
+from core.ksf_recommender import KSFS
+from persistence import ksf_recommender
+from ui import quiz_block
+
+
+# ---------------------------------------------------------
+# 6. COMPETITORS, MARKETS & BSG
+# ---------------------------------------------------------
+airlines = pd.DataFrame(
+    {
+        "Airline": ["UltraLow", "Ryanair", "EasyJet", "Iberia", "Lufthansa", "Singapore"],
+        "Price_level": [1, 2, 2, 3, 4, 5],
+        "Service_level": [1, 2, 3, 3, 4, 5],
+        "Type": ["ULCC", "Low-cost", "Low-cost", "Legacy", "Legacy", "Premium"]
+    }
+)
+KSF_OPTIONS = KSFS
+SUGGESTED_KSFS = 3
+
+# The browser gets at most this many individual firms, whatever the panel size
+MAX_PLOTTED_FIRMS = 2_000
+# Fewest firms with both values that still make a map (k is clipped to it)
+MIN_FIRMS = 2
+
+
+# Kept as a finished Vega-Lite spec: st.scatter_chart (and Altair) rebuilt
+# and re-validated it on every rerun
+@content.shared
+def airline_chart():
+    return alt.Chart(airlines).mark_circle(size=120).encode(
+        x=alt.X("Price_level:Q"),
+        y=alt.Y("Service_level:Q"),
+        color=alt.Color("Type:N"),
+        tooltip=["Airline:N", "Type:N", "Price_level:Q", "Service_level:Q"],
+    ).interactive().to_dict()
+
+
+# Panels are shared read-only (cache_resource), not copied out per rerun
+@st.cache_resource(max_entries=4, show_spinner="Generating firm panel…")
+def cached_synthetic_panel(n, seed):
+    return sg.synthetic_panel(n, seed)
+
+
+@st.cache_resource(max_entries=4, show_spinner="Reading firm panel…")
+def read_panel(data, name):
+    if name.endswith(".parquet"):
+        return pd.read_parquet(io.BytesIO(data))
+    return pd.read_csv(io.BytesIO(data))
+
+
+# Keyed on the dataset hash: the (potentially huge) points array itself
+# is passed with a leading underscore so Streamlit does not rehash it.
+@st.cache_data(max_entries=16, show_spinner="Detecting strategic groups…")
+def cached_groups(data_hash, k, _points):
+    labels, centers, counts = sg.strategic_groups(_points, k)
+    sample = sg.stratified_sample(labels, MAX_PLOTTED_FIRMS)
+    return {
+        "centers": centers,
+        "counts": counts,
+        "sample_points": _points[sample],
+        "sample_labels": labels[sample],
+        "density": sg.density_grid(_points),
+    }
+
+
+def group_map(groups, x_title, y_title):
+    density = alt.Chart(groups["density"]).mark_rect(opacity=0.5).encode(
+        x=alt.X("x:Q", title=x_title),
+        x2="x2:Q",
+        y=alt.Y("y:Q", title=y_title),
+        y2="y2:Q",
+        color=alt.Color("Firms:Q", scale=alt.Scale(scheme="greys"), legend=None),
+    )
+    sample = pd.DataFrame(
+        {
+            "x": groups["sample_points"][:, 0],
+            "y": groups["sample_points"][:, 1],
+            "Group": (groups["sample_labels"] + 1).astype(str),
+        }
+    )
+    firms = alt.Chart(sample).mark_circle(size=12, opacity=0.5).encode(x="x:Q", y="y:Q", color="Group:N")
+    centers = pd.DataFrame(
+        {
+            "x": groups["centers"][:, 0],
+            "y": groups["centers"][:, 1],
+            "Group": [str(g + 1) for g in range(len(groups["centers"]))],
+            "Firms": groups["counts"],
+        }
+    )
+    centroids = alt.Chart(centers).mark_point(shape="diamond", filled=True, stroke="black").encode(
+        x="x:Q",
+        y="y:Q",
+        color="Group:N",
+        size=alt.Size("Firms:Q", scale=alt.Scale(range=[150, 900]), legend=None),
+        tooltip=["Group:N", "Firms:Q", alt.Tooltip("x:Q", format=".2f"), alt.Tooltip("y:Q", format=".2f")],
+    )
+    return density + firms + centroids
+
+
+def strategic_group_explorer(source):
+    if source == "Synthetic firm panel":
+        n = st.select_slider("Number of firms:", options=[10_000, 50_000, 100_000, 250_000], value=100_000)
+        panel = cached_synthetic_panel(n, 0)
+    else:
+        uploaded = st.file_uploader("Firm panel (CSV or Parquet, one row per firm)", type=["csv", "parquet"])
+        if uploaded is None:
+            st.info("Upload a file with at least two numeric columns, e.g. price level and service level.")
+            return
+        panel = read_panel(uploaded.getvalue(), uploaded.name)
+
+    numeric = list(panel.select_dtypes("number").columns)
+    if len(numeric) < 2:
+        st.error("The panel needs at least two numeric columns (price and service dimensions).")
+        return
+    colX, colY, colK = st.columns(3)
+    x_col = colX.selectbox("Price dimension:", numeric, index=numeric.index("Price_level") if "Price_level" in numeric else 0)
+    y_col = colY.selectbox("Service dimension:", numeric, index=numeric.index("Service_level") if "Service_level" in numeric else 1)
+    k = colK.slider("Number of strategic groups:", 2, 8, 4)
+
+    points = panel[[x_col, y_col]].dropna().to_numpy(dtype=np.float64)
+    if len(points) < MIN_FIRMS:
+        st.error(f"Only {len(points):,} firms have both a {x_col} and a {y_col} value – "
+                 f"at least {MIN_FIRMS} are needed to form groups.")
+        return
+    groups = cached_groups(sg.points_hash(points), k, points)
+    if len(groups["counts"]) < k:
+        st.info(f"Only {len(points):,} firms – showing {len(groups['counts'])} groups.")
+    k = len(groups["counts"])
+    st.altair_chart(group_map(groups, x_col, y_col), width="stretch")
+    st.caption(
+        f"{len(points):,} firms clustered; the map shows firm density, a sample of "
+        f"{len(groups['sample_labels']):,} firms and one ◆ per group (sized by number of firms)."
+    )
+    st.dataframe(
+        pd.DataFrame(
+            {
+                "Group": np.arange(1, k + 1),
+                f"Avg {x_col}": groups["centers"][:, 0].round(2),
+                f"Avg {y_col}": groups["centers"][:, 1].round(2),
+                "Firms": groups["counts"],
+            }
+        ),
+        hide_index=True
+    )
+
+
+def record_ksfs():
+    # Each learner counts once, with the segment they last picked KSFs for
+    segment = st.session_state.get("ksf_segment", "").strip()
+    ksfs = st.session_state.get("ksfs", [])
+    selection = [segment, ksfs] if segment and ksfs else None
+    ksf_recommender().record(st.session_state.get("ksf_recorded"), selection)
+    st.session_state["ksf_recorded"] = selection
+
+
+def use_suggestions(ksfs):
+    st.session_state["ksfs"] = ksfs
+    record_ksfs()
+
+
+def render():
+    st.title("🤝 Competitors, Markets & BSG")
+
+    st.markdown(
+        """
+        Once we know the industry, we zoom in to the **strategic groups** and **segments** where 
+        rivalry is strongest and key success factors (KSFs) differ.
+        """
+    )
+
+    diagnostics.lap("1. Strategic group map")
+    st.markdown("### 1. Strategic group map")
+    source = st.radio(
+        "Data:",
+        ["Toy example (airlines)", "Synthetic firm panel", "Upload a firm panel"],
+        horizontal=True,
+        key="sg_source"
+    )
+    if source == "Toy example (airlines)":
+        st.write("Select-up: service level | Sideways: price level")
+        st.vega_lite_chart(airline_chart(), width="stretch")
+    else:
+        strategic_group_explorer(source)
+    st.caption("Strategic groups form where firms have similar combinations of price and service level.")
+
+    diagnostics.lap("2. Define a segment & KSFs (think Starbucks in China / BSG)")
+    st.markdown("### 2. Define a segment & KSFs (think Starbucks in China / BSG)")
+    st.session_state.setdefault("ksf_segment", "Urban young professionals")
+    # Renaming the segment re-files the learner's recorded selection too
+    segment_name = st.text_input("Name of segment", key="ksf_segment", on_change=record_ksfs)
+    own = st.session_state.get("ksf_recorded")
+    suggestions = ksf_recommender().suggest(segment_name, exclude=own)
+    top = [ksf for ksf, _ in suggestions[:SUGGESTED_KSFS]]
+    # Defaults set via session_state (not default=/value=) so a saved
+    # choice restored by persistence.py does not clash with them
+    st.session_state.setdefault("ksfs", top)
+
+    colS, colU = st.columns([3, 1])
+    evidence = ksf_recommender().evidence(segment_name, exclude=own)
+    colS.caption(
+        "💡 Learners with similar segments chose: "
+        + " · ".join(f"{ksf} ({share:.0%})" for ksf, share in suggestions[:SUGGESTED_KSFS])
+        + (f" – {evidence:,} picked for exactly this segment." if evidence else "")
+    )
+    colU.button("✨ Use these", key="ksf_use_suggestions", on_click=use_suggestions, args=(top,))
+    ksfs = st.multiselect(
+        "Select key success factors for this segment:",
+        KSF_OPTIONS,
+        key="ksfs",
+        on_change=record_ksfs
+    )
+
+    st.markdown(
+        f"""
+        For **{segment_name}**, your chosen KSFs are:
+        - {", ".join(ksfs) if ksfs else "_none yet_"}
+        """
+    )
+
+    diagnostics.lap("3. Quick BSG-style question")
+    st.markdown("### 3. Quick BSG-style question")
+    quiz_block("competitors")
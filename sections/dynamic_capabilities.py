@@ -0,0 +1,68 @@
+import streamlit as st
+
+import diagnostics
+from core import dynamic_capabilities as dc
+from ui import quiz_block
+
+
+# ---------------------------------------------------------
+# 8. DYNAMIC CAPABILITIES & ADAPTATION
+# ---------------------------------------------------------
+DC_ACTIONS = tuple(dc.correct_map)
+
+
+def tag_feedback(action, tag):
+    # (Streamlit alert name, message)
+    if dc.is_correct_tag(action, tag):
+        return "success", "✅ Yes!"
+    return "error", f"❌ More like **{dc.correct_map[action]}** in the Teece framework."
+
+
+def render():
+    st.title("🔄 Dynamic Capabilities & Adaptation")
+
+    st.markdown(
+        """
+        In turbulent environments, it’s not enough to have strong resources today –  
+        you need **dynamic capabilities**: the ability to **sense**, **seize**, and **reconfigure**.
+        """
+    )
+
+    diagnostics.lap("1. Tag actions as Sensing, Seizing or Reconfiguring")
+    st.markdown("### 1. Tag actions as Sensing, Seizing or Reconfiguring")
+    action = st.selectbox(
+        "Pick an action:",
+        DC_ACTIONS
+    )
+
+    user_tag = st.radio(
+        "This is mostly…",
+        dc.TAGS,
+        key="dc_tag"
+    )
+
+    if "submitted" in st.session_state and st.session_state["submitted"]:
+        alert, message = tag_feedback(action, user_tag)
+        getattr(st, alert)(message)
+
+    diagnostics.lap("2. Your adaptation storyline")
+    st.markdown("### 2. Your adaptation storyline")
+    st.write("Imagine a firm facing disruption (e.g., streaming vs DVDs, EVs vs combustion engines).")
+    sensing_text = st.text_area("1️⃣ How do they **sense** the change?", height=80, key="dc_sensing")
+    seizing_text = st.text_area("2️⃣ How do they **seize** the opportunity?", height=80, key="dc_seizing")
+    reconfig_text = st.text_area("3️⃣ How do they **reconfigure** their assets/capabilities?", height=80, key="dc_reconfig")
+
+    if st.button("📖 Build my adaptation story"):
+        st.markdown(
+            f"""
+            **Dynamic capabilities in action:**
+
+            - 👀 *Sensing:* {sensing_text or '_not written yet_'}  
+            - 🎯 *Seizing:* {seizing_text or '_not written yet_'}  
+            - 🛠 *Reconfiguring:* {reconfig_text or '_not written yet_'}  
+            """
+        )
+
+    diagnostics.lap("3. Final check")
+    st.markdown("### 3. Final check")
+    quiz_block("dynamic_capabilities")
@@ -0,0 +1,291 @@
+import altair as alt
+import numpy as np
+import streamlit as st
+import pandas as pd
+
+import content
+import diagnostics
+from core import five_forces as ff
+from core import force_weights as fw
+from core import life_cycle as lc
+from ui import quiz_block
+
+
+# ---------------------------------------------------------
+# 3. INDUSTRY ANALYSIS & FIVE FORCES
+# ---------------------------------------------------------
+# Loaded once per process (and per data version), shared by every session
+@content.shared(show_spinner="Loading industry dataset…")
+def industry_dataset():
+    return ff.load_industries()
+
+
+@content.shared(max_entries=1024)
+def force_table(i):
+    dataset = industry_dataset()
+    return pd.DataFrame({"Force": ff.FORCES, "Intensity": ff.force_levels(dataset, i)})
+
+
+# Life-cycle model, one cached layer per parameter group: moving one
+# slider recomputes only the layer that depends on it
+@content.shared
+def life_cycle_base():
+    return lc.industry_parameters(industry_dataset())
+
+
+@content.shared(max_entries=16)
+def life_cycle_curves(p_scale, q_scale):
+    return lc.diffusion(life_cycle_base(), p_scale, q_scale)
+
+
+@content.shared(max_entries=64)
+def life_cycle_positions(p_scale, q_scale, years):
+    return lc.position(life_cycle_base(), life_cycle_curves(p_scale, q_scale), years)
+
+
+@content.shared(max_entries=64)
+def life_cycle_profits(p_scale, q_scale, crowding):
+    return lc.profits(life_cycle_base(), life_cycle_curves(p_scale, q_scale), crowding)
+
+
+# Force weights: the ranking per weight vector, the Monte Carlo samples per
+# weight distribution (weights, confidence, sample count)
+@content.shared(max_entries=16)
+def weighted_ranking(weights):
+    return fw.weighted_ranking(industry_dataset(), weights)
+
+
+@content.shared(max_entries=4, show_spinner="Sampling force weights…")
+def weight_samples(weights, concentration, samples):
+    return fw.simulate(weighted_ranking(weights)["counts"], weights, concentration, samples)
+
+
+@content.shared(max_entries=16)
+def weight_robustness(weights, concentration, samples):
+    return fw.summarize(weight_samples(weights, concentration, samples), fw.DEFAULT_PARAMS["top_share"])
+
+
+# An edited industry moves from force profile a to b; the cached samples
+# are updated incrementally instead of re-ranked
+@content.shared(max_entries=64)
+def edited_robustness(weights, concentration, samples, a, b):
+    sim = fw.move(weight_samples(weights, concentration, samples), a, b)
+    return fw.summarize(sim, fw.DEFAULT_PARAMS["top_share"])
+
+
+# The five teaching examples open the dataset (ids 0-4)
+CLASSICS = list(range(5))
+STAGE_COLORS = ["#9ecae1", "#74c476", "#fdae6b", "#fc9272"]
+CONFIDENCE = {"Not sure": 2.0, "Fairly sure": fw.DEFAULT_PARAMS["concentration"], "Very sure": 100.0}
+SAMPLE_SIZES = [5_000, 10_000, 20_000, 50_000]
+
+
+def life_cycle_chart(curves, profit, now, i):
+    frame = pd.DataFrame({
+        "Year": lc.GRID,
+        "New adopters (share of market per year)": curves["rate"][i],
+        "Profit index": profit["curve"][i],
+    }).melt("Year", var_name="Curve", value_name="Value")
+    edges = [0.0, curves["t1"][i], curves["peak"][i], curves["t2"][i], float(lc.HORIZON)]
+    bands = pd.DataFrame({
+        "Stage": lc.STAGES,
+        "start": np.minimum(edges[:-1], lc.HORIZON),
+        "end": np.minimum(edges[1:], lc.HORIZON),
+    })
+    stage_scale = alt.Scale(domain=lc.STAGES, range=STAGE_COLORS)
+    background = alt.Chart(bands).mark_rect(opacity=0.25).encode(
+        x="start:Q", x2="end:Q", color=alt.Color("Stage:N", scale=stage_scale, sort=lc.STAGES)
+    )
+    lines = alt.Chart(frame).mark_line().encode(
+        x=alt.X("Year:Q", title="Years since the industry emerged"),
+        y=alt.Y("Value:Q", title=None),
+        strokeDash="Curve:N",
+        tooltip=["Curve:N", "Year:Q", alt.Tooltip("Value:Q", format=".3f")],
+    )
+    today = alt.Chart(pd.DataFrame({"Year": [min(now["t"][i], lc.HORIZON)]})).mark_rule(color="black").encode(x="Year:Q")
+    return background + lines + today
+
+
+def rank_chart(ranks, n):
+    bins = np.linspace(1, n + 1, 41)
+    counts, _ = np.histogram(ranks, bins=bins)
+    frame = pd.DataFrame({"from": bins[:-1], "to": bins[1:], "Share of samples": counts / len(ranks)})
+    return alt.Chart(frame).mark_rect().encode(
+        x=alt.X("from:Q", title="Rank (1 = most attractive)", scale=alt.Scale(domain=[1, n])),
+        x2="to:Q",
+        y=alt.Y("Share of samples:Q", axis=alt.Axis(format="%")),
+        tooltip=[alt.Tooltip("from:Q", format=".0f", title="Ranks from"),
+                 alt.Tooltip("Share of samples:Q", format=".1%")],
+    )
+
+
+def robustness_metrics(summary, p, before=None, q=None):
+    # before / q: the unedited summary and profile, to show the change
+    median_delta = top_delta = None
+    if before is not None:
+        median_delta = f"{int(summary['median'][p]) - int(before['median'][q]):+,}"
+        change = summary["top"][p] - before["top"][q]
+        top_delta = f"{change:+.0%}" if round(change, 2) else None
+    colM, colI, colT = st.columns(3)
+    colM.metric("Median rank", f"{summary['median'][p]:,}", median_delta, delta_color="inverse")
+    colI.metric("90% of samples rank it", f"{summary['p5'][p]:,} – {summary['p95'][p]:,}")
+    colT.metric(f"Chance of the top {summary['top_n']:,}", f"{summary['top'][p]:.0%}", top_delta)
+
+
+# A fragment: moving a weight reruns only the attractiveness block
+@st.fragment
+@diagnostics.timed_fragment("Five Forces weights")
+def weighted_attractiveness(i):
+    dataset = industry_dataset()
+    n = len(dataset["names"])
+    st.write("⚖️ **How much does each force matter?** Relative weights: 2 counts twice as much as 1, 0 ignores the force.")
+    weights = tuple(
+        col.slider(force, 0, 5, 1, key=f"ff_weight_{column}")
+        for col, force, column in zip(st.columns(len(ff.FORCES)), ff.FORCES, ff.FORCE_COLUMNS)
+    )
+    if not any(weights):
+        st.warning("At least one force needs a weight – using equal weights.")
+        weights = (1,) * len(ff.FORCES)
+    ranked = weighted_ranking(weights)
+
+    colS, colR = st.columns(2)
+    colS.metric("Attractiveness score (0–100)", f"{ranked['score'][i]:.0f}")
+    ties = int((ranked["score"] == ranked["score"][i]).sum()) - 1
+    colR.metric("Attractiveness rank", f"{ranked['rank'][i]:,} of {n:,}",
+                help=f"Shared with {ties:,} other industries with the same score" if ties else None)
+    st.caption("High intensity = pressure on profits. The score is 100 when every weighted force is Low "
+               "and 0 when all are High; industries with the same score share a rank.")
+
+    st.write("🎲 **How robust is that rank?** The weights are a judgement call, so the app redraws them "
+             "thousands of times around yours and ranks every industry again.")
+    colC, colN = st.columns(2)
+    confidence = colC.select_slider("How sure are you of the weights?", list(CONFIDENCE), value="Fairly sure",
+                                    key="ff_weight_confidence")
+    samples = colN.select_slider("Monte Carlo samples", SAMPLE_SIZES, value=fw.DEFAULT_PARAMS["samples"],
+                                 key="ff_weight_samples")
+    concentration = CONFIDENCE[confidence]
+    summary = weight_robustness(weights, concentration, samples)
+    p = int(ranked["profiles"][i])
+    robustness_metrics(summary, p)
+    ranks = weight_samples(weights, concentration, samples)["ranks"][:, p]
+    st.altair_chart(rank_chart(ranks, n), width="stretch")
+
+    with st.expander(f"✏️ What if {dataset['names'][i]}'s forces changed?"):
+        cols = st.columns(len(ff.FORCES))
+        levels = [
+            ff.LEVELS.index(col.selectbox(force, ff.LEVELS, index=int(code), key=f"ff_edit_{i}_{column}"))
+            for col, force, column, code in zip(cols, ff.FORCES, ff.FORCE_COLUMNS, dataset["codes"][i])
+        ]
+        b = int(fw.profile_ids(np.array([levels]))[0])
+        if b == p:
+            st.caption("Change a force to see how the industry would rank.")
+        else:
+            edited = edited_robustness(weights, concentration, samples, p, b)
+            score = fw.scores(weights)[b]
+            st.metric("Attractiveness score (0–100)", f"{score:.0f}", f"{score - ranked['score'][i]:+.0f}")
+            robustness_metrics(edited, b, summary, p)
+
+    with st.expander("🏆 Rank all industries by attractiveness"):
+        colN, colDir = st.columns(2)
+        top = colN.slider("How many to show:", 5, 200, 20, step=5)
+        least = colDir.toggle("Least attractive first")
+        weighted = {**dataset, **ranked}
+        ids = ff.ranked_ids(weighted, top, least_attractive=least)
+        table = ff.ranking(weighted, top, least_attractive=least)
+        profiles = ranked["profiles"][ids]
+        table["Median rank (sampled)"] = summary["median"][profiles]
+        table["90% range"] = [f"{lo:,} – {hi:,}" for lo, hi in zip(summary["p5"][profiles].tolist(),
+                                                                  summary["p95"][profiles].tolist())]
+        st.dataframe(table, hide_index=True)
+
+
+# A fragment: moving a model slider reruns only the life-cycle section
+@st.fragment
+@diagnostics.timed_fragment("Industry life cycle")
+def life_cycle(i):
+    dataset = industry_dataset()
+    colP, colQ, colY, colC = st.columns(4)
+    params = {
+        "p_scale": colP.slider("Innovation (p) ×", 0.25, 4.0, lc.DEFAULT_PARAMS["p_scale"], step=0.25, key="lc_p_scale",
+                               help="Buyers who adopt on their own, e.g. through advertising"),
+        "q_scale": colQ.slider("Imitation (q) ×", 0.25, 4.0, lc.DEFAULT_PARAMS["q_scale"], step=0.25, key="lc_q_scale",
+                               help="Buyers who adopt because others did (word of mouth)"),
+        "years": colY.slider("Look ahead (years)", -20, 20, int(lc.DEFAULT_PARAMS["years"]), key="lc_years"),
+        "crowding": colC.slider("Crowding at saturation", 0.0, 1.0, lc.DEFAULT_PARAMS["crowding"], step=0.1, key="lc_crowding",
+                                help="Share of the margin competed away once everyone has adopted"),
+    }
+    curves = life_cycle_curves(params["p_scale"], params["q_scale"])
+    now = life_cycle_positions(params["p_scale"], params["q_scale"], params["years"])
+    profit = life_cycle_profits(params["p_scale"], params["q_scale"], params["crowding"])
+
+    stage = int(now["stage"][i])
+    years = params["years"]
+    when = "today" if years == 0 else f"in {years} years" if years > 0 else f"{-years} years ago"
+    st.write(f"📈 The model places **{dataset['names'][i]}** in the **{lc.STAGES[stage]}** stage {when}.")
+    st.info(ff.stage_notes[stage + 1])
+    colA, colR = st.columns(2)
+    colA.metric("Market already reached", f"{now['adoption'][i]:.0%}")
+    colR.metric("Profits peak (years after emergence)", f"{profit['peak_year'][i]:.0f}")
+    st.altair_chart(life_cycle_chart(curves, profit, now, i), width="stretch")
+
+    with st.expander(f"📊 Compare life-cycle positions across all {len(dataset['names']):,} industries"):
+        sectors, sector_ids = np.unique(dataset["sectors"], return_inverse=True)
+        cells = np.bincount(sector_ids * len(lc.STAGES) + now["stage"], minlength=len(sectors) * len(lc.STAGES))
+        counts = pd.DataFrame(cells.reshape(len(sectors), len(lc.STAGES)), columns=lc.STAGES)
+        counts.insert(0, "Sector", sectors)
+        st.dataframe(counts, hide_index=True)
+        st.caption("Average profit index per stage, over every industry's curve: "
+                   + " · ".join(f"{name} {value:.4f}" for name, value in zip(lc.STAGES, profit["by_stage"])))
+        show = st.selectbox("Industries now in stage:", lc.STAGES, index=stage, key="lc_stage")
+        ids = np.flatnonzero(now["stage"] == lc.STAGES.index(show))
+        current = lc.current_profit(life_cycle_base(), now, params["crowding"])
+        ids = ids[np.argsort(-current[ids], kind="stable")][:50]
+        st.dataframe(pd.DataFrame({
+            "Industry": dataset["names"][ids],
+            "Sector": dataset["sectors"][ids],
+            "Market reached": (100 * now["adoption"][ids]).round(0),
+            "Profit index now": current[ids].round(4),
+        }), hide_index=True)
+
+
+def render():
+    st.title("🏭 Industry Analysis & Five Forces")
+
+    st.markdown(
+        """
+        **Industry analysis** asks: *“Why are some industries systematically more profitable than others?”*  
+        The classic tool is **Porter’s Five Forces**, which explains **industry attractiveness**.
+        """
+    )
+
+    diagnostics.lap("1. Explore Five Forces in different industries")
+    st.markdown("### 1. Explore Five Forces in different industries")
+    dataset = industry_dataset()
+    query = st.text_input(
+        f"Search {len(dataset['names']):,} industries (name or part of it):",
+        placeholder="e.g. Airlines, Premium Coffee, pharma"
+    )
+    matches = dataset["index"].search(query) if query.strip() else CLASSICS
+    if not matches:
+        st.warning("No industry matches that search – showing the classic examples.")
+        matches = CLASSICS
+    i = st.selectbox(
+        "Choose an industry:",
+        matches,
+        format_func=lambda i: dataset["names"][i]
+    )
+
+    st.dataframe(force_table(i), hide_index=True)
+    weighted_attractiveness(i)
+
+    diagnostics.lap("2. Industry life cycle intuition")
+    st.markdown("### 2. Industry life cycle intuition")
+    st.write(
+        "Each industry follows a **Bass diffusion** curve: *innovators* adopt on their own, *imitators* follow "
+        "them. The stages are the curve's turning points; the profit index is new adopters × margin."
+    )
+    life_cycle(i)
+
+    diagnostics.lap("3. Quick Five Forces quiz")
+    st.markdown("### 3. Quick Five Forces quiz")
+    quiz_block("five_forces")
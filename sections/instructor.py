@@ -0,0 +1,80 @@
+import pandas as pd
+import streamlit as st
+
+import diagnostics
+from core import quiz
+from persistence import answer_stats
+from sections import PAGES
+from ui import quiz_bank
+
+
+# ---------------------------------------------------------
+# 10. INSTRUCTOR DASHBOARD (cohort answers per quiz option)
+# ---------------------------------------------------------
+ALL_SECTIONS = "All sections"
+PAGE_LABELS = {module: label for label, module in PAGES.items()}
+REFRESH_SECONDS = 5
+
+
+def option_table(bank, rows, counts):
+    # Built from the pre-aggregated counters: cost depends on the number
+    # of questions shown, never on how many answers were logged
+    records = []
+    for r in rows:
+        question = bank["questions"][r]
+        picked = counts.get(question["id"], {})
+        total = sum(picked.values())
+        for j, option in enumerate(question["options"]):
+            learners = picked.get(option, 0)
+            records.append({
+                "Section": PAGE_LABELS.get(question["page"], question["page"]),
+                "Question": question["question"],
+                "Option": ("✅ " if j == question["answer"] else "") + option,
+                "Learners": learners,
+                "Share": 100 * learners / total if total else 0.0,
+            })
+    return pd.DataFrame(records, columns=["Section", "Question", "Option", "Learners", "Share"])
+
+
+# Re-reads the counters every few seconds without rerunning the page
+@st.fragment(run_every=REFRESH_SECONDS)
+def cohort_answers(rows):
+    bank = quiz_bank()
+    counts = answer_stats().counts()
+    answered = [sum(counts.get(bank["ids"][r], {}).values()) for r in rows]
+    right = [counts.get(bank["ids"][r], {}).get(quiz.correct_answer(bank["questions"][r]), 0) for r in rows]
+
+    colQ, colA, colR = st.columns(3)
+    colQ.metric("Questions", len(rows))
+    colA.metric("Answers held by learners", f"{sum(answered):,}")
+    colR.metric("Currently correct", f"{100 * sum(right) / sum(answered):.0f}%" if sum(answered) else "–")
+
+    st.dataframe(
+        option_table(bank, rows, counts),
+        hide_index=True,
+        column_config={
+            "Share": st.column_config.ProgressColumn(
+                "Share of learners", format="%.0f%%", min_value=0, max_value=100
+            ),
+        },
+    )
+    st.caption(f"Live: refreshes every {REFRESH_SECONDS} s. Each learner counts once per question, with their current answer.")
+
+
+def render():
+    st.title("🧑‍🏫 Instructor Dashboard")
+
+    st.markdown(
+        """
+        How the cohort is answering the quizzes right now: for every question, the share of
+        learners whose current answer is each option (✅ marks the correct one).
+        """
+    )
+
+    diagnostics.lap("1. Cohort answers per quiz option")
+    st.markdown("### 1. Cohort answers per quiz option")
+    bank = quiz_bank()
+    scopes = [ALL_SECTIONS] + [label for label, module in PAGES.items() if module in bank["index"]["page"]]
+    scope = st.selectbox("Section:", scopes, key="instructor_scope")
+    rows = quiz.select(bank) if scope == ALL_SECTIONS else quiz.select(bank, page=PAGES[scope])
+    cohort_answers(rows)
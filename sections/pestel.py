@@ -0,0 +1,109 @@
+import altair as alt
+import streamlit as st
+
+import content
+import diagnostics
+from core import pestel
+from ui import quiz_block
+
+
+# ---------------------------------------------------------
+# 2. MACRO & PESTEL
+# ---------------------------------------------------------
+# Compiled once per process (and per data version) into dense lookup matrices;
+# the heatmap is kept as a finished Vega-Lite spec so Altair does not
+# re-validate it on every rerun
+@content.shared
+def pestel_rules():
+    return pestel.load_rules()
+
+
+@content.shared
+def trend_classifier():
+    return pestel.load_classifier()
+
+
+@content.shared
+def impact_heatmap():
+    rules = pestel_rules()
+    return alt.Chart(pestel.impact_frame(rules)).mark_rect(stroke="white").encode(
+        x=alt.X("Trend:N", sort=rules["trends"], axis=alt.Axis(labelAngle=-30, labelLimit=200)),
+        y=alt.Y("Industry:N", sort=rules["industries"]),
+        color=alt.Color(
+            "Impact:N",
+            scale=alt.Scale(
+                domain=pestel.IMPACT_LABELS,
+                range=["#e0e0e0", "#e45756", "#54a24b", "#f2cf5b"],
+            ),
+        ),
+        tooltip=["Industry:N", "Trend:N", "Impact:N", "Explanation:N"],
+    ).to_dict()
+
+
+def render():
+    st.title("🌍 Macro-Environment & PESTEL")
+
+    st.markdown(
+        """
+        The **macro-environment** is the big context outside the industry – politics, 
+        economy, society, technology, ecology and law.  
+        We use **PESTEL** to structure it and spot **key drivers of change** (the few 
+        variables that really force us to rethink strategy).
+        """
+    )
+
+    diagnostics.lap("1. Classify events with PESTEL")
+    st.markdown("### 1. Classify events with PESTEL")
+    factor = st.text_input(
+        "Type a trend / event (e.g. 'EU carbon tax', 'aging population', 'AI regulation')",
+        value="AI regulation in the EU"
+    )
+    # Memoized per text, so reruns with the same trend cost a dict lookup
+    suggestions = trend_classifier().suggest(factor)
+    if suggestions:
+        st.caption("🤖 Auto-suggest: " + " · ".join(
+            f"**{dimension}** ({share:.0%})" if k == 0 else f"{dimension} ({share:.0%})"
+            for k, (dimension, share) in enumerate(suggestions[:3])
+        ))
+    else:
+        st.caption("🤖 No suggestion – none of these words appear in the example trends.")
+    # The best suggestion is preselected; it changes only when the suggestion does
+    category = st.selectbox(
+        "Which PESTEL dimension fits best?",
+        pestel.DIMENSIONS,
+        index=pestel.DIMENSIONS.index(suggestions[0][0]) if suggestions else 0
+    )
+
+    st.write(f"➡️ You classified **'{factor}'** as **{category}**.")
+    if suggestions and category != suggestions[0][0]:
+        st.caption(f"The auto-suggest leans **{suggestions[0][0]}** – many trends span several dimensions.")
+    st.info("Ask yourself: is this a **threat**, an **opportunity**, or both for a specific industry?")
+
+    diagnostics.lap("2. Threat or Opportunity? Quick scenario")
+    st.markdown("### 2. Threat or Opportunity? Quick scenario")
+    rules = pestel_rules()
+    industry = st.selectbox(
+        "Pick an industry:",
+        rules["industries"]
+    )
+    trend = st.selectbox(
+        "Pick a macro trend:",
+        rules["trends"]
+    )
+
+    threat, opportunity, explanation = pestel.evaluate(rules, industry, trend)
+
+    colT, colO = st.columns(2)
+    with colT:
+        st.metric("Threat?", "✅" if threat else "⚪")
+    with colO:
+        st.metric("Opportunity?", "✅" if opportunity else "⚪")
+
+    st.caption(explanation)
+
+    with st.expander("🗺️ All industries × all trends at once"):
+        st.vega_lite_chart(impact_heatmap(), width="stretch")
+
+    diagnostics.lap("3. Quick check – macro vs micro environment")
+    st.markdown("### 3. Quick check – macro vs micro environment")
+    quiz_block("pestel")
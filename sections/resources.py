@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import diagnostics
+from core import vrio
+from core.chunks import iter_chunks
+from ui import quiz_block
+
+
+# ---------------------------------------------------------
+# 7. RESOURCES, VRIO & RBV
+# ---------------------------------------------------------
+RESOURCE_NOTES = {
+    "Cash reserves": "Tangible, valuable, but usually not rare or inimitable. Necessary, but rarely a source of sustained advantage alone.",
+    "Strong brand reputation": "Intangible, often valuable, rare, and harder to copy. A good candidate for VRIO-based advantage.",
+    "Proprietary algorithm": "Technological, intangible. If protected and hard to imitate, it can be a strong VRIO resource.",
+    "Company culture of experimentation": "Deeply embedded, intangible. Very hard to copy – classic example of a capability behind sustained advantage.",
+    "Standard office building": "Basic tangible resource. Easy to copy and usually not a source of sustained advantage.",
+}
+
+# Feedback per VRIO outcome: (Streamlit alert, message)
+VRIO_FEEDBACK = {
+    vrio.DISADVANTAGE: (st.error, "➡️ Competitive disadvantage or at best wasted resource."),
+    vrio.PARITY: (st.warning, "➡️ Competitive parity – useful, but others have it too."),
+    vrio.TEMPORARY: (st.info, "➡️ Temporary competitive advantage – enjoy it while it lasts."),
+    vrio.MISSED: (st.warning, "➡️ Missed opportunity – you have a potential advantage but are not organized to exploit it."),
+    vrio.SUSTAINED: (st.success, "🏆 Sustained competitive advantage – VRIO satisfied!"),
+}
+
+
+def evaluate_inventory(uploaded):
+    counts = np.zeros(len(vrio.OUTCOMES) + 1, dtype=np.int64)
+    progress = st.progress(0.0, text="Evaluating…")
+    for chunk, done in iter_chunks(uploaded, uploaded.name, columns=vrio.COLUMNS):
+        counts += vrio.count_outcomes(vrio.outcome_codes(chunk))
+        progress.progress(done, text=f"Evaluated {counts.sum():,} resources…")
+    progress.empty()
+    return counts
+
+
+def inventory_evaluator():
+    st.write(
+        "One row per resource with yes/no (or 1/0) columns "
+        + ", ".join(f"`{col}`" for col in vrio.COLUMNS) + "."
+    )
+    uploaded = st.file_uploader("Resource inventory", type=["csv", "parquet"], key="vrio_inventory")
+    if uploaded is None or not st.button("Evaluate inventory"):
+        return
+    try:
+        counts = evaluate_inventory(uploaded)
+    except ValueError as err:
+        st.error(f"Could not evaluate this file: {err}")
+        return
+
+    total = int(counts.sum())
+    labels = vrio.OUTCOMES + [vrio.INVALID]
+    distribution = pd.DataFrame({"Outcome": labels, "Resources": counts, "Share": counts / max(total, 1)})
+    distribution = distribution[distribution["Resources"] > 0]
+    st.bar_chart(distribution, x="Outcome", y="Resources", horizontal=True)
+    st.dataframe(
+        distribution,
+        hide_index=True,
+        column_config={"Share": st.column_config.NumberColumn(format="percent")}
+    )
+
+
+def render():
+    st.title("🏛️ Resources, VRIO & RBV")
+
+    st.markdown(
+        """
+        The **Resource-based View (RBV)** starts from the inside:  
+        *What is our firm uniquely good at?*  
+
+        - **Resources** = what we have  
+        - **Capabilities** = what we can do with what we have  
+        - **VRIO** helps decide which ones can support **sustained competitive advantage**.
+        """
+    )
+
+    diagnostics.lap("1. Classify resources")
+    st.markdown("### 1. Classify resources")
+    res_type = st.selectbox(
+        "Pick a resource example:",
+        list(RESOURCE_NOTES)
+    )
+
+    st.info(RESOURCE_NOTES[res_type])
+
+    diagnostics.lap("2. VRIO mini-evaluator")
+    st.markdown("### 2. VRIO mini-evaluator")
+    st.write("For a chosen resource, tick what applies:")
+    valuable = st.checkbox("Valuable (helps exploit opportunities / neutralize threats)", key="vrio_v")
+    rare = st.checkbox("Rare (few competitors have it)", key="vrio_r")
+    hard_to_imitate = st.checkbox("Costly to imitate (or non-substitutable)", key="vrio_i")
+    organized = st.checkbox("Organized (firm is structured to capture value from it)", key="vrio_o")
+
+    if st.button("Evaluate VRIO"):
+        alert, message = VRIO_FEEDBACK[vrio.outcome(valuable, rare, hard_to_imitate, organized)]
+        alert(message)
+
+    with st.expander("📂 Evaluate a whole resource inventory (CSV / Parquet)"):
+        inventory_evaluator()
+
+    diagnostics.lap("3. Quick RBV quiz")
+    st.markdown("### 3. Quick RBV quiz")
+    quiz_block("resources")
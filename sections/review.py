@@ -0,0 +1,99 @@
+import time
+
+import numpy as np
+import streamlit as st
+
+import diagnostics
+import persistence
+from core import quiz, review
+from sections import PAGES
+from ui import quiz_bank, record_reviews, review_cards
+
+
+# ---------------------------------------------------------
+# 9. ADAPTIVE REVIEW (spaced repetition over the quiz bank)
+# ---------------------------------------------------------
+ALL_SECTIONS = "All sections"
+PAGE_LABELS = {module: label for label, module in PAGES.items()}
+
+
+def submit_answer(bank, row):
+    key = f"review_answer_{bank['ids'][row]}"
+    answer = quiz.answer_index(bank["questions"][row], st.session_state.get(key))
+    if answer == quiz.UNANSWERED:
+        st.session_state["review_last"] = None
+        return
+    grade = int(quiz.grade(bank, np.array([row]), [answer])[0])
+    record_reviews(bank, [row], [grade])
+    st.session_state["review_last"] = (row, grade)
+    # The same question may come straight back (e.g. a one-question scope)
+    del st.session_state[key]
+
+
+# A fragment: answering reruns only the review card, not the page
+@st.fragment
+@diagnostics.timed_fragment("Adaptive review")
+def review_session(rows):
+    bank = quiz_bank()
+    cards = review_cards(bank)
+    now = time.time()
+
+    counts = review.counts(cards, now, rows)
+    colD, colN, colS = st.columns(3)
+    colD.metric("Due now", counts["due"])
+    colN.metric("Not seen yet", counts["new"])
+    colS.metric("Scheduled for later", counts["scheduled"])
+
+    last = st.session_state.get("review_last")
+    if last:
+        row, grade = last
+        if grade == quiz.RIGHT:
+            st.success("✅ Correct! You will see this one again later.")
+        else:
+            st.error(
+                f"❌ Not quite – correct answer: **{quiz.correct_answer(bank['questions'][row])}**. "
+                "It comes back in a few minutes."
+            )
+
+    upcoming = review.next_questions(cards, now, 1, rows)
+    if not len(upcoming):
+        st.info("No questions in this scope yet.")
+        return
+    row = int(upcoming[0])
+    question = bank["questions"][row]
+    if cards["seen"][row] and cards["due"][row] > review.minutes(now):
+        st.info("🎉 Nothing is due right now – here is the next question coming up.")
+
+    st.caption(
+        f"{PAGE_LABELS.get(question['page'], question['page'])} · {question['topic']} · "
+        f"difficulty {question['difficulty']}"
+    )
+    st.write(f"**{question['question']}**")
+    st.radio("Choose one:", question["options"], index=None, key=f"review_answer_{question['id']}")
+    st.button("Submit answer", on_click=submit_answer, args=(bank, row), key="review_submit")
+
+    # Fragment reruns skip app.py, so the updated cards are saved from here
+    persistence.save_changes()
+
+
+def render():
+    st.title("🔁 Adaptive Review")
+
+    st.markdown(
+        """
+        Questions come back **just before you are likely to forget them** (an SM-2 style schedule):
+        the ones you get wrong return within minutes, the ones you know drift further apart.
+        Answers you check on the other pages count too.
+        """
+    )
+
+    diagnostics.lap("1. Choose what to review")
+    st.markdown("### 1. Choose what to review")
+    bank = quiz_bank()
+    scopes = [ALL_SECTIONS] + [label for label, module in PAGES.items() if module in bank["index"]["page"]]
+    scope = st.selectbox("Review questions from:", scopes, key="review_scope")
+    rows = None if scope == ALL_SECTIONS else quiz.select(bank, page=PAGES[scope])
+
+    diagnostics.lap("2. Your next question")
+    st.markdown("### 2. Your next question")
+    review_session(rows)
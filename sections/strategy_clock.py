@@ -0,0 +1,329 @@
+import time
+
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+import diagnostics
+import persistence
+import workers
+from core import blue_ocean, strategy_clock
+from core.curve_library import REFERENCE
+from ui import quiz_block
+
+
+# ---------------------------------------------------------
+# 5. STRATEGY CLOCK & BLUE OCEAN
+# ---------------------------------------------------------
+explanations = {
+    "Low price / no-frills": "Bare minimum benefits, ultra-low price. Works when customers really only care about price.",
+    "Standard low price": "Similar benefits to rivals but lower price – must have a real cost advantage.",
+    "Differentiation (no premium)": "Higher benefits at similar price – gain share by offering more for the same money.",
+    "Differentiation with premium": "Higher benefits and higher price – margin strategy, brand / quality driven.",
+    "Focused differentiation (luxury)": "Extreme benefits, very high price, serving a small segment.",
+    "Hybrid (good value for money)": "Above-average benefits at a reasonable cost – often where ‘best cost’ strategies live.",
+}
+CLOCK_POSITIONS = tuple(explanations)
+
+MAX_RUNS = 20_000
+REFRESH_SECONDS = 0.5
+DISTRIBUTIONS = {
+    "Survival rate": "survival_hist",
+    "Share of final sales": "share_hist",
+}
+
+
+def cancel_simulation():
+    job = st.session_state.get("clock_job")
+    if job:
+        for future in job["futures"]:
+            future.cancel()
+        job["futures"] = [future for future in job["futures"] if not future.cancelled()]
+
+
+def start_simulation(runs, params, seed):
+    cancel_simulation()
+    pool = workers.background_pool()
+    st.session_state["clock_job"] = {
+        "futures": [
+            pool.submit(strategy_clock.run_chunk, size, params, [seed, i])
+            for i, size in enumerate(strategy_clock.chunk_plan(runs))
+        ],
+        "total": runs,
+        "result": None,
+        "started": time.perf_counter(),
+        "seconds": None,
+    }
+
+
+def collect(job):
+    # Merges whatever batches have finished since the last look. A failed
+    # batch (e.g. a killed worker) would fail every poll, so the whole job
+    # is dropped instead and False returned.
+    pending = []
+    for future in job["futures"]:
+        if not future.done():
+            pending.append(future)
+        elif not future.cancelled():
+            try:
+                batch = future.result()
+            except Exception as err:
+                for other in job["futures"]:
+                    other.cancel()
+                workers.discard_if_broken(err)
+                st.session_state.pop("clock_job", None)
+                st.session_state["clock_error"] = f"The simulation failed ({type(err).__name__}) – please run it again."
+                return False
+            job["result"] = strategy_clock.merge(job["result"], batch)
+    job["futures"] = pending
+    if not pending and job["seconds"] is None:
+        job["seconds"] = time.perf_counter() - job["started"]
+    return True
+
+
+def simulation_form(position):
+    focus_zone = strategy_clock.ZONES.index(position)
+    with st.form("clock_simulation_form"):
+        colA, colB = st.columns(2)
+        runs = colA.slider("Monte Carlo runs", 500, MAX_RUNS, 5_000, step=500, key="clock_runs")
+        firms = colA.slider("Firms per market", 10, 60, strategy_clock.DEFAULT_PARAMS["firms"], key="clock_firms")
+        periods = colA.slider("Periods", 10, 80, strategy_clock.DEFAULT_PARAMS["periods"], key="clock_periods")
+        price_war = colB.slider(
+            "Price-war intensity (margin a losing firm gives up)", 0.0, 0.3,
+            strategy_clock.DEFAULT_PARAMS["price_war"], step=0.01, key="clock_price_war"
+        )
+        imitation = colB.slider(
+            "Imitation (benefit lead rivals copy per period)", 0.0, 0.2,
+            strategy_clock.DEFAULT_PARAMS["imitation"], step=0.01, key="clock_imitation"
+        )
+        focus_share = colB.slider(
+            f"Extra firms starting in your zone ({position})", 0.0, 0.8, 0.0, step=0.05, key="clock_focus_share"
+        )
+        seed = st.number_input("Random seed", 0, 9_999, 0, key="clock_seed")
+        submitted = st.form_submit_button("▶️ Run simulation")
+    if submitted:
+        params = {
+            "firms": firms,
+            "periods": periods,
+            "price_war": price_war,
+            "imitation": imitation,
+            "focus_zone": focus_zone,
+            "focus_share": focus_share,
+        }
+        start_simulation(runs, params, int(seed))
+
+
+def zone_frame(result):
+    firms = result["firms"]
+    return pd.DataFrame({
+        "Zone": strategy_clock.ZONES,
+        "Survival rate": result["survivors"] / firms.clip(min=1),
+        "Mean share of final sales": result["share"] / result["runs"],
+        "Firms started": firms.astype(int),
+    })
+
+
+def distribution_frame(result, key):
+    counts = result[key]
+    bins = strategy_clock.BINS
+    labels = [f"{100 * b // bins}–{100 * (b + 1) // bins}%" for b in range(bins)]
+    return pd.DataFrame([
+        {"Zone": zone, "Outcome": labels[b], "Share of runs": counts[z, b] / max(counts[z].sum(), 1)}
+        for z, zone in enumerate(strategy_clock.ZONES)
+        for b in range(bins)
+    ])
+
+
+def show_outcomes(result):
+    frame = zone_frame(result)
+    colS, colM = st.columns(2)
+    for col, metric in ((colS, "Survival rate"), (colM, "Mean share of final sales")):
+        bars = alt.Chart(frame).mark_bar().encode(
+            x=alt.X(f"{metric}:Q", axis=alt.Axis(format="%"), scale=alt.Scale(domain=[0, 1])),
+            y=alt.Y("Zone:N", sort=strategy_clock.ZONES, title=None),
+            tooltip=["Zone:N", alt.Tooltip(f"{metric}:Q", format=".1%"), "Firms started:Q"],
+        ).properties(title=metric, height=240)
+        col.altair_chart(bars, width="stretch")
+
+    distribution = st.radio(
+        "Distribution over runs:", list(DISTRIBUTIONS), horizontal=True, key="clock_distribution"
+    )
+    heatmap = alt.Chart(distribution_frame(result, DISTRIBUTIONS[distribution])).mark_rect().encode(
+        x=alt.X("Outcome:O", title=f"{distribution} of the zone in a run", sort=None),
+        y=alt.Y("Zone:N", sort=strategy_clock.ZONES, title=None),
+        color=alt.Color("Share of runs:Q", scale=alt.Scale(scheme="blues")),
+        tooltip=["Zone:N", "Outcome:O", alt.Tooltip("Share of runs:Q", format=".1%")],
+    ).properties(height=240)
+    st.altair_chart(heatmap, width="stretch")
+
+
+# Polls the running job: finished batches show up without blocking the
+# page, and the whole page reruns once when the last batch is in
+@st.fragment(run_every=REFRESH_SECONDS)
+def live_outcomes():
+    job = st.session_state["clock_job"]
+    if not collect(job) or not job["futures"]:
+        st.rerun()
+    done = job["result"]["runs"] if job["result"] else 0
+    colP, colS = st.columns([5, 1])
+    colP.progress(done / job["total"], text=f"{done:,} of {job['total']:,} runs simulated…")
+    if colS.button("⏹️ Stop", key="clock_stop"):
+        cancel_simulation()
+        collect(job)
+        st.rerun()
+    if job["result"]:
+        show_outcomes(job["result"])
+
+
+def simulation_results():
+    error = st.session_state.pop("clock_error", None)
+    if error:
+        st.error(error)
+    job = st.session_state.get("clock_job")
+    if job is None:
+        st.caption("Set up the market above and run a simulation to see which zones survive.")
+        return
+    if job["futures"]:
+        live_outcomes()
+        return
+    result = job["result"]
+    if result is None:
+        st.caption("The simulation was stopped before any runs finished.")
+        return
+    stopped = " (stopped early)" if result["runs"] < job["total"] else ""
+    st.caption(f"{result['runs']:,} runs in {job['seconds']:.1f} s{stopped}.")
+    show_outcomes(result)
+
+
+CURVE_MOVES = ["Eliminate", "Reduce", "Keep", "Raise"]
+
+
+def curve_chart(spec, moves, industry):
+    frame = pd.DataFrame({
+        "Factor": spec["factors"] * 2,
+        "Offering level": spec["baseline"].tolist() + blue_ocean.value_curve(
+            persistence.curve_library().canvas, industry, moves
+        ).tolist(),
+        "Curve": ["Industry today"] * len(spec["factors"]) + ["Your move"] * len(spec["factors"]),
+    })
+    return alt.Chart(frame).mark_line(point=True).encode(
+        x=alt.X("Factor:N", sort=spec["factors"], axis=alt.Axis(labelAngle=-30, labelLimit=200), title=None),
+        y=alt.Y("Offering level:Q", scale=alt.Scale(domain=[0, blue_ocean.MAX_LEVEL])),
+        color="Curve:N",
+        tooltip=["Curve:N", "Factor:N", "Offering level:Q"],
+    )
+
+
+# A fragment: moving a factor reruns only the value-curve panel
+@st.fragment
+@diagnostics.timed_fragment("Blue Ocean value curve")
+def value_curve_panel(industry):
+    library = persistence.curve_library()
+    spec = library.canvas["industries"][industry]
+    author = persistence.learner_id()
+    saved = library.get(industry, author) or {"label": "", "moves": {}}
+    saved_move = {f: action.capitalize() for action, factors in saved["moves"].items() for f in factors}
+
+    moves = {action: [] for action in blue_ocean.ACTIONS}
+    cols = st.columns(2)
+    for j, factor in enumerate(spec["existing"]):
+        move = cols[j % 2].select_slider(
+            factor, CURVE_MOVES, value=saved_move.get(factor, "Keep"), key=f"bo_curve_{industry}_{factor}"
+        )
+        if move != "Keep":
+            moves[move.lower()].append(factor)
+    moves["create"] = st.multiselect(
+        "Create (factors the industry has never offered):", spec["new"],
+        default=saved["moves"].get("create", []), key=f"bo_curve_{industry}_create"
+    )
+    st.altair_chart(curve_chart(spec, moves, industry), width="stretch")
+
+    if not any(moves.values()):
+        st.caption("Move at least one factor to compare it with the class library.")
+        return
+    colN, colS = st.columns([3, 1])
+    label = colN.text_input(
+        "Name your move (shown to classmates):", value=saved["label"],
+        placeholder="e.g. The no-frills gym", key=f"bo_curve_{industry}_label"
+    )
+    if colS.button("💾 Save to class library", key=f"bo_curve_{industry}_save"):
+        library.save(industry, author, label.strip() or "Untitled move", moves)
+        st.success("Saved – classmates can now find your move.")
+
+    similar = library.search(industry, moves, k=5, author=author)
+    st.markdown("**Most similar moves in the class library**")
+    st.dataframe(pd.DataFrame({
+        "Similarity": [100 * max(match["similarity"], 0) for match in similar],
+        "Move": [match["label"] for match in similar],
+        "By": ["📚 Reference case" if match["author"].startswith(REFERENCE) else "🧑‍🎓 Classmate" for match in similar],
+        "ERRC moves": [blue_ocean.describe(match["moves"]) for match in similar],
+    }), hide_index=True, column_config={
+        "Similarity": st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100),
+    })
+    st.caption(f"{library.size(industry):,} {industry} curves in the library.")
+
+
+def render():
+    st.title("⏰ Strategy Clock & Blue Ocean")
+
+    st.markdown(
+        """
+        The **strategy clock** extends generic strategies by looking at **perceived benefits** 
+        vs **price** from the customer’s point of view.  
+        **Blue Ocean** thinking asks: *Can we change the ‘rules of the game’ and create an uncontested space?*
+        """
+    )
+
+    diagnostics.lap("1. Choose a position on the strategy clock")
+    st.markdown("### 1. Choose a position on the strategy clock")
+    position = st.selectbox(
+        "Which strategic zone are you exploring?",
+        CLOCK_POSITIONS
+    )
+
+    st.info(explanations[position])
+
+    diagnostics.lap("2. Simulate competition on the clock")
+    st.markdown("### 2. Simulate competition on the clock")
+    st.write(
+        "Thousands of simulated markets: firms start in random zones, buyers in three segments "
+        "(price-driven, mainstream, premium) pick the best value, losers cut prices, rivals copy "
+        "what stands out, and firms that run out of cash exit. Results appear while the runs complete."
+    )
+    simulation_form(position)
+    simulation_results()
+
+    diagnostics.lap("3. Mini Blue Ocean exercise – redesign an industry value curve")
+    st.markdown("### 3. Mini Blue Ocean exercise – redesign an industry value curve")
+    st.write("Pick an industry and decide what you would **raise, reduce, create, and eliminate**.")
+    bo_industry = st.selectbox(
+        "Industry:",
+        list(persistence.curve_library().canvas["industries"])
+    )
+
+    colR, colD = st.columns(2)
+    with colR:
+        raise_factors = st.text_area("Raise (do more of):", height=80, key="bo_raise")
+        reduce_factors = st.text_area("Reduce (do less of):", height=80, key="bo_reduce")
+    with colD:
+        create_factors = st.text_area("Create (new factors):", height=80, key="bo_create")
+        eliminate_factors = st.text_area("Eliminate (remove entirely):", height=80, key="bo_eliminate")
+
+    if st.button("🧠 Summarize my Blue Ocean move"):
+        st.markdown(
+            f"""
+            **Your Blue Ocean snapshot for {bo_industry}:**
+
+            - ⬆️ Raise: {raise_factors or '_nothing yet_'}  
+            - ⬇️ Reduce: {reduce_factors or '_nothing yet_'}  
+            - ✨ Create: {create_factors or '_nothing yet_'}  
+            - ❌ Eliminate: {eliminate_factors or '_nothing yet_'}  
+            """
+        )
+
+    st.markdown("#### Plot your value curve and find similar moves")
+    value_curve_panel(bo_industry)
+
+    diagnostics.lap("4. Quick quiz")
+    st.markdown("### 4. Quick quiz")
+    quiz_block("strategy_clock")
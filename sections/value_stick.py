@@ -0,0 +1,285 @@
+import functools
+import os
+import tempfile
+import time
+
+import altair as alt
+import numpy as np
+import streamlit as st
+import pandas as pd
+
+import diagnostics
+from core import generic_strategy as gs
+from core import value_stick as vs
+from core.chunks import iter_chunks
+from ui import quiz_block
+
+
+# ---------------------------------------------------------
+# 4. VALUE STICK & GENERIC STRATEGIES
+# ---------------------------------------------------------
+# The chart frame only depends on the three surpluses, so it is memoized
+# on them instead of rebuilt on every slider release.
+@functools.lru_cache(maxsize=256)
+def decomposition_chart(customer_surplus, firm_profit, supplier_surplus):
+    chart_df = pd.DataFrame(
+        {
+            "Component": ["Customer surplus", "Firm profit", "Supplier surplus"],
+            "Value": [customer_surplus, firm_profit, supplier_surplus],
+        }
+    )
+    return chart_df.set_index("Component")
+
+
+# Sliders, metrics and chart rerun on their own: moving a slider only
+# re-executes (and re-sends) this block, not the strategy map and
+# quizzes below it.
+@st.fragment
+@diagnostics.timed_fragment("1. Play with the value stick")
+def value_stick_playground():
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write("Set the four ‘points’ on the stick:")
+        wts = st.slider("Suppliers’ opportunity cost (WTS / SOC)", 0, 100, 30, step=1)
+        cost = st.slider("Your cost (per unit)", wts, 120, 50, step=1)
+        price = st.slider("Price you charge", cost, 150, 80, step=1)
+        wtp = st.slider("Customer willingness to pay (WTP)", price, 200, 120, step=1)
+
+    with col2:
+        parts = vs.decompose(wts, cost, price, wtp)
+        customer_surplus = parts["customer_surplus"]
+        firm_profit = parts["firm_profit"]
+        supplier_surplus = parts["supplier_surplus"]
+        total_value = parts["total_value"]
+
+        st.subheader("Decomposition")
+        st.metric("Customer surplus", f"{customer_surplus}")
+        st.metric("Firm profit", f"{firm_profit}")
+        st.metric("Supplier surplus", f"{supplier_surplus}")
+        st.metric("Total value created (WTP − WTS)", f"{total_value}")
+
+        st.bar_chart(decomposition_chart(customer_surplus, firm_profit, supplier_surplus))
+
+    st.caption("Try lowering cost vs raising WTP and see how it changes value creation and capture.")
+
+
+COMPONENT_LABELS = {
+    "firm_profit": "Firm profit",
+    "customer_surplus": "Customer surplus",
+    "supplier_surplus": "Supplier surplus",
+    "total_value": "Total value created",
+}
+STRATEGY_MESSAGE = "🧭 This looks like: **{}**"
+STAT_LABELS = {"mean": "Average", "min": "Worst case", "max": "Best case"}
+GRID_STEPS = [10, 5, 4]
+ISO_PROFIT_STEP = 20
+
+
+# One entry per (ranges, step); max_entries keeps memory bounded however
+# many classes poke at it.
+@st.cache_data(max_entries=16, show_spinner="Evaluating the whole grid…")
+def cached_sensitivity_grid(step, wts_max, cost_max, price_max, wtp_max):
+    return vs.sensitivity_grid(step, wts_max, cost_max, price_max, wtp_max)
+
+
+def sensitivity_heatmap(grid, component, stat):
+    step = grid["step"]
+    cost, price = np.meshgrid(grid["cost"], grid["price"], indexing="ij")
+    values = grid[component][stat]
+    keep = ~np.isnan(values)
+    cells = pd.DataFrame(
+        {
+            "Cost": cost[keep] - step / 2,
+            "Cost_end": cost[keep] + step / 2,
+            "Price": price[keep] - step / 2,
+            "Price_end": price[keep] + step / 2,
+            "Value": values[keep],
+            "Combinations": grid["count"][keep],
+        }
+    )
+    heat = alt.Chart(cells).mark_rect().encode(
+        x=alt.X("Cost:Q", title="Your cost (per unit)"),
+        x2="Cost_end:Q",
+        y=alt.Y("Price:Q", title="Price you charge"),
+        y2="Price_end:Q",
+        color=alt.Color("Value:Q", title=COMPONENT_LABELS[component], scale=alt.Scale(scheme="viridis")),
+        tooltip=[
+            alt.Tooltip("Value:Q", format=".1f"),
+            alt.Tooltip("Combinations:Q", title="Valid WTS/WTP combos"),
+        ],
+    )
+
+    # Iso-profit lines: price = cost + profit
+    levels = np.arange(0, vs.PRICE_MAX + 1, ISO_PROFIT_STEP)
+    line_cost = np.stack([np.zeros_like(levels), np.minimum(vs.COST_MAX, vs.PRICE_MAX - levels)], axis=1)
+    lines = pd.DataFrame(
+        {
+            "Cost": line_cost.ravel(),
+            "Price": (line_cost + levels[:, None]).ravel(),
+            "Profit": np.repeat(levels, 2),
+        }
+    )
+    lines["Label"] = "π = " + lines["Profit"].astype(str)
+    iso = alt.Chart(lines).mark_line(color="white", strokeDash=[4, 3], opacity=0.8).encode(
+        x="Cost:Q", y="Price:Q", detail="Profit:Q"
+    )
+    labels = alt.Chart(lines.iloc[1::2]).mark_text(color="white", align="left", dx=4).encode(
+        x="Cost:Q", y="Price:Q", text="Label:N"
+    )
+    return heat + iso + labels
+
+
+@st.fragment
+@diagnostics.timed_fragment("1. Value stick sensitivity grid")
+def value_stick_sensitivity():
+    st.write(
+        "Every valid **WTS ≤ cost ≤ price ≤ WTP** combination in the slider ranges at once, "
+        "summarised over what the firm does not control (WTS and WTP). "
+        "Dashed lines are iso-profit contours."
+    )
+    colA, colB, colC = st.columns(3)
+    with colA:
+        component = st.selectbox("Show:", list(COMPONENT_LABELS), format_func=COMPONENT_LABELS.get)
+    with colB:
+        stat = st.selectbox("Across WTS / WTP:", list(STAT_LABELS), format_func=STAT_LABELS.get)
+    with colC:
+        step = st.select_slider("Grid step:", options=GRID_STEPS, value=5)
+
+    grid = cached_sensitivity_grid(step, vs.WTS_MAX, vs.COST_MAX, vs.PRICE_MAX, vs.WTP_MAX)
+    st.altair_chart(sensitivity_heatmap(grid, component, stat), width="stretch")
+
+    n_valid = grid["n_valid"]
+    avg_profit = np.nansum(grid["firm_profit"]["mean"] * grid["count"]) / n_valid
+    avg_total = np.nansum(grid["total_value"]["mean"] * grid["count"]) / n_valid
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Valid combinations", f"{n_valid:,}")
+    m2.metric("Average firm profit", f"{avg_profit:.1f}")
+    m3.metric("Firm's average share of value", f"{avg_profit / avg_total:.0%}")
+
+
+# Classified portfolios wait in one scratch directory per process until
+# downloaded. TemporaryDirectory removes it (weakref.finalize) when the
+# process exits; files of sessions that ended are swept after a while.
+RESULT_MAX_AGE = 6 * 3600   # seconds
+
+
+@st.cache_resource
+def results_dir():
+    return tempfile.TemporaryDirectory(prefix="gs_portfolios_")
+
+
+def sweep_results(directory, max_age=RESULT_MAX_AGE):
+    cutoff = time.time() - max_age
+    for entry in os.scandir(directory):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def classify_portfolio(uploaded):
+    # Streams the upload chunk by chunk and appends each classified chunk
+    # to a temp CSV, so working memory stays at one chunk whatever the size.
+    directory = results_dir().name
+    sweep_results(directory)
+    counts = np.zeros(len(gs.STRATEGIES) + 1, dtype=np.int64)
+    progress = st.progress(0.0, text="Classifying…")
+    out = tempfile.NamedTemporaryFile("w", suffix=".csv", dir=directory, delete=False, newline="", encoding="utf-8")
+    try:
+        with out:
+            for n, (chunk, done) in enumerate(iter_chunks(uploaded, uploaded.name)):
+                codes = gs.classify_frame(chunk)
+                chunk["strategy"] = gs.strategy_labels(codes)
+                chunk.to_csv(out, header=(n == 0), index=False)
+                counts += gs.count_codes(codes)
+                progress.progress(done, text=f"Classified {counts.sum():,} firms…")
+    except BaseException:
+        # No half-written results left behind
+        os.remove(out.name)
+        raise
+    finally:
+        progress.empty()
+    return out.name, counts
+
+
+def portfolio_classifier():
+    st.write(
+        "One row per firm with columns `wtp_level`, `cost_level` "
+        f"({' / '.join(gs.LEVELS)}) and `scope` ({' / '.join(gs.SCOPES)})."
+    )
+    uploaded = st.file_uploader("Portfolio file", type=["csv", "parquet"], key="gs_portfolio")
+    if uploaded is not None and st.button("🧭 Classify portfolio"):
+        previous = st.session_state.pop("gs_result", None)
+        if previous and os.path.exists(previous["path"]):
+            os.remove(previous["path"])
+        try:
+            path, counts = classify_portfolio(uploaded)
+        except ValueError as err:
+            st.error(f"Could not classify this file: {err}")
+            return
+        st.session_state["gs_result"] = {"path": path, "counts": counts, "name": uploaded.name}
+
+    result = st.session_state.get("gs_result")
+    if not result:
+        return
+    if not os.path.exists(result["path"]):
+        del st.session_state["gs_result"]
+        st.info("That classified portfolio has expired – classify the file again to download it.")
+        return
+    counts = result["counts"]
+    total = int(counts.sum())
+    stuck = int(counts[gs.STUCK])
+    st.metric("Stuck in the middle", f"{stuck:,}", f"{stuck / max(total, 1):.1%} of {total:,} firms", delta_color="off")
+    summary = pd.DataFrame({"Strategy": gs.STRATEGIES + [gs.INVALID], "Firms": counts})
+    st.dataframe(summary[summary["Firms"] > 0], hide_index=True)
+    with open(result["path"], "rb") as f:
+        st.download_button(
+            "⬇️ Download classified portfolio (CSV)",
+            f,
+            file_name=f"{os.path.splitext(result['name'])[0]}_classified.csv",
+            mime="text/csv"
+        )
+
+
+def render():
+    st.title("📏 Value Stick & Generic Strategies")
+
+    st.markdown(
+        """
+        The **value stick** separates total value into four pieces: customer surplus, firm profit, 
+        and supplier surplus.  
+        Your **competitive advantage** comes from creating more total value *(WTP − SOC)* and/or 
+        capturing a bigger slice of it.
+        """
+    )
+
+    diagnostics.lap("1. Play with the value stick")
+    st.markdown("### 1. Play with the value stick")
+    mode = st.radio(
+        "Mode:",
+        ["One position (sliders)", "Whole grid (sensitivity heatmaps)"],
+        horizontal=True,
+        key="vs_mode"
+    )
+    if mode == "One position (sliders)":
+        value_stick_playground()
+    else:
+        value_stick_sensitivity()
+
+    diagnostics.lap("2. Generic strategies – where are you on the map?")
+    st.markdown("### 2. Generic strategies – where are you on the map?")
+    wtp_level = st.selectbox("Relative WTP level vs rivals:", gs.LEVELS)
+    cost_level = st.selectbox("Relative cost level vs rivals:", gs.LEVELS)
+    scope = st.selectbox("Scope of target:", gs.SCOPES)
+
+    base = gs.classify(wtp_level, cost_level, scope)
+    st.success(STRATEGY_MESSAGE.format(base))
+
+    with st.expander("📂 Classify a whole portfolio of firms (CSV / Parquet)"):
+        portfolio_classifier()
+
+    diagnostics.lap("3. Quick check")
+    st.markdown("### 3. Quick check")
+    quiz_block("value_stick")
@@ -0,0 +1,64 @@
+import streamlit as st
+
+import diagnostics
+from ui import info_card
+
+
+# ---------------------------------------------------------
+# 1. WELCOME PAGE
+# ---------------------------------------------------------
+def render():
+    st.title("📊 Competitive Strategy – Interactive Companion")
+    st.markdown(
+        """
+        This app is meant to feel like a tiny “interactive textbook” for the course.  
+        Use the sidebar to move through the big blocks:
+        """
+    )
+
+    diagnostics.lap("Big Questions & how to use this tool")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("🧭 Big Questions")
+        st.markdown(
+            """
+            - **Where do we compete?** (industry, segment, geography)  
+            - **How do we compete?** (cost vs differentiation, generic strategy)  
+            - **With which resources?** (RBV, VRIO, capabilities)  
+            - **How do we adapt over time?** (dynamic capabilities)
+            """
+        )
+    with col2:
+        st.subheader("🎮 How to use this tool")
+        st.markdown(
+            """
+            - Check the **interactive sliders** to see how value is created and captured.  
+            - Use the **quizzes** to test if you really understand the logic.  
+            - Think: *‘How would I use this in a real case or in BSG?’*
+            """
+        )
+
+    diagnostics.lap("Course Roadmap")
+    st.markdown("---")
+    st.subheader("Course Roadmap (mini mental map)")
+    cols = st.columns(4)
+    with cols[0]:
+        info_card(
+            "Macro & Industry",
+            "PESTEL, scenarios, Five Forces, industry life cycle."
+        )
+    with cols[1]:
+        info_card(
+            "Positioning",
+            "Value stick, cost vs differentiation, generic strategies."
+        )
+    with cols[2]:
+        info_card(
+            "Competitors & Markets",
+            "Strategic groups, KSFs, segmentation, Starbucks/BSG."
+        )
+    with cols[3]:
+        info_card(
+            "Inside the Firm",
+            "Resources, VRIO, core competences, dynamic capabilities."
+        )
@@ -0,0 +1,142 @@
+"""Apply the app's grading and analysis rules to whole files, offline.
+
+    quiz       question_id, answer (the chosen option's text) -> grade
+    dc         action, tag -> expected_tag, grade (Teece framework)
+    vrio       valuable, rare, inimitable, organized -> vrio_outcome
+    strategy   wtp_level, cost_level, scope -> strategy
+
+Input is CSV, JSONL or Parquet, read in chunks. Chunks are spread over
+a process pool and the results are appended to the output as they come
+back, in input order. Memory stays at a few chunks per worker whatever
+the file size; every input column is kept, the result columns come last.
+
+    python tools/batch.py quiz submissions.csv                  # -> submissions_quiz.csv
+    python tools/batch.py vrio inventory.jsonl -o out.jsonl --workers 4
+    python tools/batch.py strategy firms.parquet --chunksize 250000
+
+A summary (rows per outcome) is printed at the end. The Streamlit UI is
+never started.
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Chunks queued per worker: keeps the pool busy while the main process
+# reads and writes, without reading the whole file ahead
+IN_FLIGHT = 2
+
+
+class Output:
+    # Appends result chunks as CSV or JSONL (by file suffix)
+    def __init__(self, path):
+        from core.chunks import JSONL_SUFFIXES
+
+        self.path = path
+        self.jsonl = path.suffix in JSONL_SUFFIXES
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.rows = 0
+
+    def write(self, frame):
+        if self.jsonl:
+            frame.to_json(self.file, orient="records", lines=True, force_ascii=False)
+        else:
+            frame.to_csv(self.file, header=self.rows == 0, index=False)
+        self.rows += len(frame)
+
+    def close(self):
+        self.file.close()
+
+
+def default_output(source, task):
+    from core.chunks import JSONL_SUFFIXES
+
+    suffix = ".jsonl" if source.suffix in JSONL_SUFFIXES else ".csv"
+    return source.with_name(f"{source.stem}_{task}{suffix}")
+
+
+def inline(fn, *args):
+    # Stand-in for pool.submit with a single worker
+    future = Future()
+    future.set_result(fn(*args))
+    return future
+
+
+def run(task, source, output, chunksize, workers):
+    # Yields (rows written, fraction of the input read, counts per code)
+    # after every chunk
+    from core.batch import run_chunk
+    from core.chunks import iter_chunks
+
+    counts = Counter()
+    out = Output(output)
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+    submit = pool.submit if pool else inline
+    limit = IN_FLIGHT * workers if pool else 1
+    try:
+        pending = deque()
+        for chunk, done in iter_chunks(source, chunksize=chunksize):
+            pending.append((submit(run_chunk, task, chunk), done))
+            while len(pending) >= limit:
+                yield collect(pending.popleft(), out, counts)
+        while pending:
+            yield collect(pending.popleft(), out, counts)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        out.close()
+
+
+def collect(item, out, counts):
+    future, done = item
+    frame, chunk_counts = future.result()
+    out.write(frame)
+    counts.update(chunk_counts)
+    return out.rows, done, counts
+
+
+def print_summary(labels, counts, seconds):
+    total = sum(counts.values())
+    print(f"{total:,} rows in {seconds:.1f} s ({total / max(seconds, 1e-9):,.0f} rows/s)")
+    for code, label in labels.items():
+        if counts.get(code):
+            print(f"  {label:45s} {counts[code]:>12,}  {counts[code] / total:6.1%}")
+
+
+def main():
+    from core.batch import TASKS
+    from core.chunks import DEFAULT_CHUNKSIZE
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("task", choices=list(TASKS))
+    parser.add_argument("input", type=Path, help="CSV, JSONL or Parquet file")
+    parser.add_argument("-o", "--output", type=Path, help="CSV or JSONL (default: <input>_<task>.csv/.jsonl)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="rows per chunk")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes (1 = no pool)")
+    args = parser.parse_args()
+
+    output = args.output or default_output(args.input, args.task)
+    print(f"{args.task}: {args.input} -> {output} ({args.workers} worker(s))", file=sys.stderr)
+    start = time.perf_counter()
+    counts = Counter()
+    try:
+        for rows, done, counts in run(args.task, args.input, output, args.chunksize, args.workers):
+            print(f"\r  {rows:,} rows ({done:.0%} read)", end="", file=sys.stderr, flush=True)
+    except ValueError as err:
+        output.unlink(missing_ok=True)
+        sys.exit(f"\n{args.input}: {err}")
+    print(file=sys.stderr)
+    print_summary(TASKS[args.task]["labels"], counts, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
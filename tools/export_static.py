@@ -0,0 +1,503 @@
+"""Pre-render the course pages to static HTML/JS.
+
+Every student page is run once, headless, with its default widget values
+and the resulting element tree is written out as plain HTML: text, cards,
+alerts, metrics, tables and charts (Vega-Lite, drawn by vega-embed in the
+browser). Widgets whose outcome is a pure function of a few choices become
+client-side "islands" with the answers computed here, in Python, from the
+same code the live app uses:
+
+    value stick       sliders -> surpluses (core/value_stick.py)
+    quizzes           check / reveal against data/quiz_bank.json
+    lookups           generic strategy, strategy clock zones, resource
+                      examples, VRIO ladder, dynamic-capability tags
+
+Everything else (uploads, simulations, saved answers) shows the default
+example plus a link to the live app.
+
+    python tools/export_static.py                          # -> build/static
+    python tools/export_static.py --out site --live-url https://strategy.example.edu
+
+The output is a self-contained directory for any static file server.
+"""
+import argparse
+import html
+import itertools
+import json
+import math
+import os
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+ASSETS = Path(__file__).resolve().parent / "static_site"
+VEGA_SCRIPTS = [
+    "https://cdn.jsdelivr.net/npm/vega@5",
+    "https://cdn.jsdelivr.net/npm/vega-lite@5",
+    "https://cdn.jsdelivr.net/npm/vega-embed@6",
+]
+MAX_TABLE_ROWS = 50
+ALERTS = ("success", "info", "warning", "error")
+QUIZ_CHECK = "✔️ Check my answers"
+VALUE_STICK_SLIDER = "Suppliers’ opportunity cost (WTS / SOC)"
+LIVE_NOTE = "🔌 Some controls in this part only work in the live app – shown here at their defaults."
+# Pages that are all per-learner state: only a link to the live app
+LIVE_ONLY_PAGES = {"Adaptive Review"}
+LIVE_PAGE_NOTE = "🔌 This page works from your own answer history, so it only runs in the live app."
+CURRENT = ' class="current"'
+
+
+# ---------------------------------------------------------
+# MARKDOWN (the subset the pages use)
+# ---------------------------------------------------------
+INLINE = [
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])"), r"<em>\1</em>"),
+    (re.compile(r"(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)"), r"<em>\1</em>"),
+    (re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)"), r'<a href="\2">\1</a>'),
+]
+LIST_ITEM = re.compile(r"^\s*(?:[-*]|\d+\.)\s+")
+HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+
+
+def inline(text, allow_html=False):
+    if not allow_html:
+        text = html.escape(text, quote=False)
+    for pattern, replacement in INLINE:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def lines_html(lines, allow_html):
+    # Two trailing spaces are a hard line break, as in the app
+    parts = []
+    for i, line in enumerate(lines):
+        parts.append(inline(line.strip(), allow_html))
+        if line.endswith("  ") and i < len(lines) - 1:
+            parts.append("<br>")
+        elif i < len(lines) - 1:
+            parts.append(" ")
+    return "".join(parts)
+
+
+def markdown(text, allow_html=False):
+    out = []
+    blocks = re.split(r"\n\s*\n", dedent(text).strip("\n"))
+    for block in blocks:
+        lines = block.split("\n")
+        first = lines[0].strip()
+        if not first:
+            continue
+        if allow_html and first.startswith("<"):
+            out.append(block.strip())
+        elif first in ("---", "***"):
+            out.append("<hr>")
+        elif HEADING.match(first):
+            hashes, title = HEADING.match(first).groups()
+            out.append(f"<h{len(hashes)}>{inline(title, allow_html)}</h{len(hashes)}>")
+            if len(lines) > 1:
+                out.append(markdown("\n".join(lines[1:]), allow_html))
+        elif LIST_ITEM.match(first):
+            tag = "ol" if first[0].isdigit() else "ul"
+            items = []
+            for line in lines:
+                if LIST_ITEM.match(line):
+                    items.append([LIST_ITEM.sub("", line)])
+                elif items:
+                    items[-1].append(line)
+            out.append(
+                f"<{tag}>" + "".join(f"<li>{lines_html(item, allow_html)}</li>" for item in items) + f"</{tag}>"
+            )
+        else:
+            # A list may start right under a paragraph line
+            cut = next((i for i, line in enumerate(lines) if LIST_ITEM.match(line)), len(lines))
+            out.append(f"<p>{lines_html(lines[:cut], allow_html)}</p>")
+            if cut < len(lines):
+                out.append(markdown("\n".join(lines[cut:]), allow_html))
+    return "\n".join(out)
+
+
+def dedent(text):
+    # Like st.markdown: strip the indentation of triple-quoted strings
+    lines = text.split("\n")
+    indents = [len(line) - len(line.lstrip()) for line in lines if line.strip()]
+    cut = min(indents, default=0)
+    return "\n".join(line[cut:] for line in lines)
+
+
+# ---------------------------------------------------------
+# ISLANDS (widgets answered in the browser)
+# ---------------------------------------------------------
+def island(widget, config):
+    data = json.dumps(config, ensure_ascii=False, default=str).replace("</", "<\\/")
+    return f'<div class="island" data-widget="{widget}"><script type="application/json">{data}</script></div>'
+
+
+def alert_html(kind, message):
+    return f'<div class="alert {kind}">{inline(message)}</div>'
+
+
+def lookup(inputs, answer, button=None):
+    # Precomputes `answer` for every combination of the inputs.
+    # inputs: [(kind, label, options)], kind in select / radio / checkbox
+    options = [opts if kind != "checkbox" else [False, True] for kind, _, opts in inputs]
+    table = {}
+    for combo in itertools.product(*options):
+        key = "|".join(str(int(v)) if isinstance(v, bool) else v for v in combo)
+        table[key] = alert_html(*answer(*combo))
+    return {
+        "inputs": [{"kind": kind, "label": label, "options": opts} for kind, label, opts in inputs],
+        "button": button,
+        "table": table,
+    }
+
+
+def lookup_islands():
+    # First widget label -> (island config, every widget label it replaces).
+    # Alerts right after the replaced widgets are the default answer and
+    # are dropped too.
+    from core import dynamic_capabilities as dc
+    from core import generic_strategy as gs
+    from core import vrio
+    from sections import dynamic_capabilities, resources, strategy_clock, value_stick
+
+    configs = [
+        lookup(
+            [("select", "Which strategic zone are you exploring?", list(strategy_clock.explanations))],
+            lambda zone: ("info", strategy_clock.explanations[zone]),
+        ),
+        lookup(
+            [("select", "Pick a resource example:", list(resources.RESOURCE_NOTES))],
+            lambda example: ("info", resources.RESOURCE_NOTES[example]),
+        ),
+        lookup(
+            [
+                ("select", "Relative WTP level vs rivals:", gs.LEVELS),
+                ("select", "Relative cost level vs rivals:", gs.LEVELS),
+                ("select", "Scope of target:", gs.SCOPES),
+            ],
+            lambda wtp, cost, scope: ("success", value_stick.STRATEGY_MESSAGE.format(gs.classify(wtp, cost, scope))),
+        ),
+        lookup(
+            [
+                ("checkbox", "Valuable (helps exploit opportunities / neutralize threats)", None),
+                ("checkbox", "Rare (few competitors have it)", None),
+                ("checkbox", "Costly to imitate (or non-substitutable)", None),
+                ("checkbox", "Organized (firm is structured to capture value from it)", None),
+            ],
+            lambda *flags: vrio_feedback(resources.VRIO_FEEDBACK[vrio.outcome(*flags)]),
+            button="Evaluate VRIO",
+        ),
+        lookup(
+            [
+                ("select", "Pick an action:", list(dynamic_capabilities.DC_ACTIONS)),
+                ("radio", "This is mostly…", list(dc.TAGS)),
+            ],
+            dynamic_capabilities.tag_feedback,
+            button="✔️ Check",
+        ),
+    ]
+    return {
+        config["inputs"][0]["label"]: (
+            config,
+            {i["label"] for i in config["inputs"]} | ({config["button"]} if config["button"] else set()),
+        )
+        for config in configs
+    }
+
+
+def vrio_feedback(feedback):
+    alert, message = feedback
+    return alert.__name__, message
+
+
+def quiz_island(module):
+    from core import quiz
+    from ui import RIGHT_MESSAGE, WRONG_MESSAGE, quiz_bank
+
+    bank = quiz_bank()
+    questions = []
+    for r in quiz.select(bank, page=module):
+        question = bank["questions"][r]
+        questions.append({
+            "question": inline(question["question"]),
+            "options": question["options"],
+            "answer": question["answer"],
+            "wrong": alert_html("error", WRONG_MESSAGE.format(quiz.correct_answer(question))),
+        })
+    return island("quiz", {
+        "questions": questions,
+        "check": QUIZ_CHECK,
+        "right": alert_html("success", RIGHT_MESSAGE),
+    })
+
+
+def value_stick_island(columns):
+    # Slider labels, ranges and defaults plus the metric labels, read off
+    # the rendered block; the arithmetic is core.value_stick.decompose
+    sliders = [
+        {"label": w.label, "min": w.proto.min, "max": w.proto.max, "value": w.value}
+        for w in descendants(columns) if w.type == "slider"
+    ]
+    metrics = [m.label for m in descendants(columns) if m.type == "metric"]
+    return island("valueStick", {"sliders": sliders, "metrics": metrics})
+
+
+# ---------------------------------------------------------
+# ELEMENT TREE -> HTML
+# ---------------------------------------------------------
+def descendants(node):
+    for child in getattr(node, "children", {}).values():
+        yield child
+        yield from descendants(child)
+
+
+def is_widget(node):
+    from streamlit.testing.v1.element_tree import Widget
+
+    return isinstance(node, Widget) or node.type in ("button", "form_submit_button", "file_uploader")
+
+
+class PageWriter:
+    def __init__(self, module, islands, live_url):
+        self.module = module
+        self.islands = islands
+        self.live_url = live_url
+        self.replaced = set()
+        self.skip_alerts = False
+        self.noted = False
+        self.charts = 0
+
+    def live_note(self, note=LIVE_NOTE):
+        if self.noted:
+            return ""
+        self.noted = True
+        link = f' <a href="{html.escape(self.live_url)}">Open the live app</a>' if self.live_url else ""
+        return f'<p class="live-note">{note}{link}</p>'
+
+    def block(self, node):
+        return "\n".join(filter(None, (self.element(child) for child in node.children.values())))
+
+    def element(self, node):
+        kind = node.type
+        if kind in ALERTS and self.skip_alerts:
+            return ""
+        self.skip_alerts = False
+
+        if is_widget(node):
+            return self.widget(node)
+        if kind in ("column", "flex_container", "form", "expander", "tab"):
+            return self.container(node)
+        # One live-app note per section
+        if kind == "title":
+            self.noted = False
+            return f"<h1>{inline(node.value)}</h1>"
+        if kind in ("header", "subheader"):
+            self.noted = False
+            level = 2 if kind == "header" else 3
+            return f"<h{level}>{inline(node.value)}</h{level}>"
+        if kind == "markdown":
+            if node.value.lstrip().startswith("#"):
+                self.noted = False
+            return markdown(node.value, node.proto.allow_html)
+        if kind == "caption":
+            return f'<div class="caption">{markdown(node.value, node.proto.allow_html)}</div>'
+        if kind == "divider":
+            return "<hr>"
+        if kind in ALERTS:
+            icon = f"{node.proto.icon} " if node.proto.icon else ""
+            return f'<div class="alert {kind}">{icon}{markdown(node.proto.body)}</div>'
+        if kind == "metric":
+            delta = f'<div class="delta">{html.escape(node.proto.delta)}</div>' if node.proto.delta else ""
+            return (
+                f'<div class="metric"><div class="label">{inline(node.label)}</div>'
+                f'<div class="value">{html.escape(node.value)}</div>{delta}</div>'
+            )
+        if kind == "dataframe":
+            return self.table(node)
+        if kind == "vega_lite_chart":
+            return self.chart(node.proto)
+        return ""
+
+    def widget(self, node):
+        label = getattr(node, "label", None)
+        if label in self.islands:
+            config, labels = self.islands[label]
+            self.replaced |= labels
+            self.skip_alerts = True
+            return island("lookup", config)
+        if label in self.replaced:
+            self.skip_alerts = True
+            return ""
+        return self.live_note()
+
+    def container(self, node):
+        kind = node.type
+        widgets = [w for w in descendants(node) if is_widget(w)]
+        labels = {getattr(w, "label", None) for w in widgets}
+        if kind == "flex_container" and VALUE_STICK_SLIDER in labels and all(
+            child.type == "column" for child in node.children.values()
+        ):
+            return value_stick_island(node)
+        if kind == "flex_container" and any(
+            child.type == "button" and child.label == QUIZ_CHECK for child in node.children.values()
+        ):
+            return quiz_island(self.module)
+        if kind == "form" or widgets and all(
+            is_widget(d) or d.type in ("column", "flex_container") for d in descendants(node)
+        ):
+            # Input-only blocks (forms do nothing until submitted)
+            return self.live_note()
+
+        inner = self.block(node)
+        if not inner:
+            return ""
+        if kind == "column":
+            return f'<div class="column">{inner}</div>'
+        if kind == "flex_container" and node.children and all(
+            child.type == "column" for child in node.children.values()
+        ):
+            return f'<div class="columns">{inner}</div>'
+        if kind == "expander":
+            return f"<details><summary>{inline(node.label)}</summary>{inner}</details>"
+        return inner
+
+    def table(self, node):
+        frame = node.value
+        shown = frame.head(MAX_TABLE_ROWS)
+        more = (
+            f'<div class="caption">First {MAX_TABLE_ROWS} of {len(frame):,} rows.</div>'
+            if len(frame) > MAX_TABLE_ROWS else ""
+        )
+        import pandas as pd
+
+        return (
+            '<div class="table">'
+            + shown.to_html(index=not isinstance(shown.index, pd.RangeIndex), border=0, float_format="{:,.4g}".format, na_rep="")
+            + "</div>" + more
+        )
+
+    def chart(self, proto):
+        spec = json.loads(proto.spec)
+        if proto.data.data:
+            spec["data"] = {"values": arrow_rows(proto.data.data)}
+        if proto.datasets:
+            spec["datasets"] = {d.name: arrow_rows(d.data.data) for d in proto.datasets}
+        if proto.use_container_width or "width" not in spec:
+            spec["width"] = "container"
+        self.charts += 1
+        return island("vegaLite", spec)
+
+
+def arrow_rows(data):
+    import pyarrow as pa
+
+    rows = pa.ipc.open_stream(data).read_all().to_pylist()
+    # NaN is not valid JSON
+    return [
+        {k: (None if isinstance(v, float) and math.isnan(v) else v) for k, v in row.items()}
+        for row in rows
+    ]
+
+
+# ---------------------------------------------------------
+# SITE
+# ---------------------------------------------------------
+def render_pages(timeout):
+    # label -> main element tree of the page at its defaults
+    from streamlit.testing.v1 import AppTest
+
+    from sections import INSTRUCTOR_PAGES, PAGES
+
+    trees = {}
+    for label in PAGES:
+        if label in INSTRUCTOR_PAGES:
+            continue
+        at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout)
+        at.run()
+        if label != at.sidebar.radio[0].value:
+            at.sidebar.radio[0].set_value(label).run()
+        if at.exception:
+            raise RuntimeError(f"{label}: {at.exception[0].message}")
+        trees[label] = at.main
+        print(f"  rendered {label}")
+    return trees
+
+
+def page_file(module):
+    return "index.html" if module == "welcome" else f"{module}.html"
+
+
+def page_html(label, body, nav, uses_charts):
+    scripts = "".join(f'<script src="{src}"></script>' for src in VEGA_SCRIPTS) if uses_charts else ""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(label)} – Competitive Strategy Interactive Companion</title>
+<link rel="stylesheet" href="assets/style.css">
+{scripts}<script src="assets/app.js" defer></script>
+</head>
+<body>
+<nav>
+<div class="brand">📚 Competitive Strategy Hub</div>
+<p>A tiny ‘course in a box’ to revise the main ideas.</p>
+{nav}
+</nav>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+def export(out, live_url, timeout):
+    from sections import PAGES
+
+    trees = render_pages(timeout)
+    islands = lookup_islands()
+    out.mkdir(parents=True, exist_ok=True)
+    shutil.copytree(ASSETS, out / "assets", dirs_exist_ok=True)
+
+    for label, tree in trees.items():
+        module = PAGES[label]
+        nav = "<ul>" + "".join(
+            f'<li{CURRENT if other == label else ""}>'
+            f'<a href="{page_file(PAGES[other])}">{html.escape(other)}</a></li>'
+            for other in trees
+        ) + "</ul>"
+        writer = PageWriter(module, islands, live_url)
+        if label in LIVE_ONLY_PAGES:
+            body = f"<h1>{inline(tree.children[0].value)}</h1>" + writer.live_note(LIVE_PAGE_NOTE)
+        else:
+            body = writer.block(tree)
+        path = out / page_file(module)
+        path.write_text(page_html(label, body, nav, writer.charts > 0), encoding="utf-8")
+        print(f"  wrote {path.relative_to(out)} ({path.stat().st_size / 1024:,.0f} KiB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", type=Path, default=ROOT / "build" / "static", help="output directory")
+    parser.add_argument("--live-url", help="URL of the live app, linked from interactive-only parts")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds allowed per page render")
+    args = parser.parse_args()
+
+    # Pages are rendered in throwaway sessions: keep them out of the real
+    # answer store (read when persistence.py is imported)
+    with tempfile.TemporaryDirectory(prefix="export_static_", ignore_cleanup_errors=True) as scratch:
+        os.environ["COMPETITIVE_STRATEGY_DB"] = str(Path(scratch) / "export.db")
+        print(f"Exporting to {args.out}")
+        export(args.out, args.live_url, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
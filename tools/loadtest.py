@@ -0,0 +1,341 @@
+"""Simulate many concurrent students against a real `streamlit run app.py`.
+
+Each simulated session speaks Streamlit's own websocket protocol, like a
+browser tab. It switches pages with the sidebar radio, drags the value
+stick sliders (as fragment reruns), answers quiz radios and presses
+"Reveal quiz answers". For every rerun we time the gap between sending
+the request and receiving script_finished.
+
+    python tools/loadtest.py --sessions 50                 # one level
+    python tools/loadtest.py --sessions 25,50,100,200      # find saturation
+    python tools/loadtest.py --url ws://host:8501 --sessions 20   # existing server
+
+It starts its own server on a free port unless --url is given; memory per
+session is measured from that server's RSS.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover - depends on the Streamlit install
+    sys.exit("tools/loadtest.py needs the 'websockets' package (pip install websockets)")
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGE_RADIO = "Jump to section:"
+REVEAL_BUTTON = "📝 Reveal quiz answers / feedback"
+QUIZ_RADIO = "Choose one:"
+VALUE_STICK_PAGE = "Value Stick & Generic Strategies"
+
+# Relative weights of what a simulated student does next
+ACTIONS = {"navigate": 3, "drag_slider": 4, "answer_quiz": 3, "reveal": 1}
+
+
+# ---------------------------------------------------------
+# ONE SIMULATED BROWSER TAB
+# ---------------------------------------------------------
+class Session:
+    def __init__(self, url, name, rng, stats):
+        self.url = url
+        self.name = name
+        self.rng = rng
+        self.stats = stats
+        self.widgets = {}   # id -> element info from the latest run
+        self.values = {}    # id -> WidgetState we keep re-sending, like the frontend
+        self.page = "Welcome & Course Map"
+
+    async def run(self, actions, think_time):
+        uri = f"{self.url}/_stcore/stream"
+        async with websockets.connect(uri, subprotocols=["streamlit"], max_size=None) as ws:
+            self.ws = ws
+            await self.rerun("connect")
+            for _ in range(actions):
+                await asyncio.sleep(self.rng.expovariate(1 / think_time) if think_time else 0)
+                action = self.rng.choices(list(ACTIONS), weights=list(ACTIONS.values()))[0]
+                await getattr(self, action)()
+
+    # -- actions -----------------------------------------------
+    async def navigate(self):
+        radio = self.find("radio", PAGE_RADIO)
+        if radio:
+            self.page = self.rng.choice([o for o in radio["options"] if o != self.page])
+            self.set_value(radio, "string_value", self.page)
+            await self.rerun("navigate")
+
+    async def drag_slider(self):
+        if self.page != VALUE_STICK_PAGE:
+            self.page = VALUE_STICK_PAGE
+            self.set_value(self.find("radio", PAGE_RADIO), "string_value", self.page)
+            await self.rerun("navigate")
+        sliders = [w for w in self.widgets.values() if w["type"] == "slider"]
+        if not sliders:
+            return
+        slider = self.rng.choice(sliders)
+        # A drag is a short burst of releases at nearby positions
+        for _ in range(self.rng.randint(1, 4)):
+            value = self.rng.uniform(slider["min"], slider["max"])
+            value = slider["min"] + round((value - slider["min"]) / slider["step"]) * slider["step"]
+            self.set_value(slider, "double_array_value", [value])
+            await self.rerun("drag_slider", fragment_id=slider["fragment_id"])
+            slider = self.widgets.get(slider["id"], slider)
+
+    async def answer_quiz(self):
+        quizzes = [w for w in self.widgets.values() if w["type"] == "radio" and w["label"] == QUIZ_RADIO]
+        if not quizzes:
+            await self.navigate()
+            return
+        quiz = self.rng.choice(quizzes)
+        self.set_value(quiz, "string_value", self.rng.choice(quiz["options"]))
+        await self.rerun("answer_quiz", fragment_id=quiz["fragment_id"])
+
+    async def reveal(self):
+        button = self.find("button", REVEAL_BUTTON)
+        if button:
+            await self.rerun("reveal", trigger=button["id"])
+
+    # -- protocol ----------------------------------------------
+    def find(self, kind, label):
+        for widget in self.widgets.values():
+            if widget["type"] == kind and widget["label"] == label:
+                return widget
+        return None
+
+    def set_value(self, widget, field, value):
+        state = BackMsg().rerun_script.widget_states.widgets.add()
+        state.id = widget["id"]
+        if field == "double_array_value":
+            state.double_array_value.data.extend(value)
+        else:
+            setattr(state, field, value)
+        self.values[widget["id"]] = state
+
+    async def rerun(self, action, fragment_id="", trigger=None):
+        msg = BackMsg()
+        msg.rerun_script.query_string = f"learner=loadtest-{self.name}"
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+        for state in self.values.values():
+            msg.rerun_script.widget_states.widgets.add().CopyFrom(state)
+        if trigger:
+            msg.rerun_script.widget_states.widgets.add(id=trigger, trigger_value=True)
+        if not fragment_id:
+            self.widgets = {}
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta":
+                self.on_delta(fwd)
+            elif kind == "script_finished":
+                break
+        self.stats.record(action, time.perf_counter() - start)
+
+    def on_delta(self, fwd):
+        delta = fwd.delta
+        if delta.WhichOneof("type") != "new_element":
+            return
+        kind = delta.new_element.WhichOneof("type")
+        if kind == "exception":
+            self.stats.errors += 1
+            return
+        element = getattr(delta.new_element, kind)
+        widget_id = getattr(element, "id", "")
+        if not widget_id.startswith("$$ID"):
+            return
+        info = {
+            "id": widget_id,
+            "type": kind,
+            "label": getattr(element, "label", ""),
+            "fragment_id": fwd.delta.fragment_id,
+        }
+        if kind == "radio":
+            info["options"] = list(element.options)
+        elif kind == "slider":
+            info.update(min=element.min, max=element.max, step=element.step or 1)
+        self.widgets[widget_id] = info
+
+
+# ---------------------------------------------------------
+# MEASUREMENT
+# ---------------------------------------------------------
+class Stats:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = 0
+
+    def record(self, action, seconds):
+        self.latencies[action].append(seconds)
+
+    def all(self):
+        return sorted(s for samples in self.latencies.values() for s in samples)
+
+
+def percentile(sorted_samples, q):
+    if not sorted_samples:
+        return float("nan")
+    return sorted_samples[min(len(sorted_samples) - 1, int(q * len(sorted_samples)))]
+
+
+def rss_mb(pid):
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+async def sample_rss(pid, peak, stop):
+    while not stop.is_set():
+        value = rss_mb(pid)
+        if value is not None:
+            peak[0] = max(peak[0], value)
+        await asyncio.sleep(0.2)
+
+
+async def run_level(url, n_sessions, args, pid):
+    stats = Stats()
+    rng = random.Random(args.seed)
+    sessions = [Session(url, f"{n_sessions}-{i}", random.Random(rng.random()), stats) for i in range(n_sessions)]
+
+    baseline = rss_mb(pid) if pid else None
+    peak, stop = [baseline or 0.0], asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(pid, peak, stop)) if pid else None
+
+    async def start(i, session):
+        await asyncio.sleep(args.ramp * i / max(n_sessions, 1))
+        try:
+            await session.run(args.actions, args.think)
+        except (OSError, websockets.WebSocketException) as err:
+            stats.errors += 1
+            print(f"  session {session.name} failed: {err}", file=sys.stderr)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(start(i, s) for i, s in enumerate(sessions)))
+    wall = time.perf_counter() - started
+    stop.set()
+    if sampler:
+        await sampler
+
+    samples = stats.all()
+    result = {
+        "sessions": n_sessions,
+        "reruns": len(samples),
+        "errors": stats.errors,
+        "wall_s": wall,
+        "throughput_rps": len(samples) / wall if wall else 0.0,
+        "p50_ms": percentile(samples, 0.50) * 1000,
+        "p95_ms": percentile(samples, 0.95) * 1000,
+        "p99_ms": percentile(samples, 0.99) * 1000,
+        "by_action_p95_ms": {
+            action: percentile(sorted(s), 0.95) * 1000 for action, s in sorted(stats.latencies.items())
+        },
+    }
+    if baseline is not None:
+        result["rss_baseline_mb"] = baseline
+        result["rss_peak_mb"] = peak[0]
+        result["mb_per_session"] = (peak[0] - baseline) / n_sessions
+    return result
+
+
+# ---------------------------------------------------------
+# LOCAL SERVER
+# ---------------------------------------------------------
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, state_dir):
+    env = dict(os.environ, COMPETITIVE_STRATEGY_DB=str(Path(state_dir) / "answers.db"))
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", str(ROOT / "app.py"),
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.3)
+    proc.kill()
+    sys.exit("streamlit server did not come up within 60 s")
+
+
+def print_table(results):
+    header = f"{'sessions':>8} {'reruns':>7} {'err':>4} {'rps':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'MB/sess':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        per_session = f"{r['mb_per_session']:8.2f}" if "mb_per_session" in r else f"{'n/a':>8}"
+        print(
+            f"{r['sessions']:8d} {r['reruns']:7d} {r['errors']:4d} {r['throughput_rps']:7.1f} "
+            f"{r['p50_ms']:8.1f} {r['p95_ms']:8.1f} {r['p99_ms']:8.1f} {per_session}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", default="20", help="comma-separated concurrency levels, e.g. 25,50,100")
+    parser.add_argument("--actions", type=int, default=20, help="actions per session")
+    parser.add_argument("--think", type=float, default=0.5, help="mean think time between actions (s)")
+    parser.add_argument("--ramp", type=float, default=2.0, help="seconds over which sessions connect")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="existing server, e.g. ws://localhost:8501 (no memory numbers)")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+    levels = [int(n) for n in args.sessions.split(",")]
+
+    proc = None
+    with tempfile.TemporaryDirectory() as state_dir:
+        if args.url:
+            url, pid = args.url.rstrip("/"), None
+        else:
+            port = free_port()
+            proc = start_server(port, state_dir)
+            url, pid = f"ws://127.0.0.1:{port}", proc.pid
+            # Warm-up session so imports and caches are not billed to level 1
+            asyncio.run(run_level(url, 1, argparse.Namespace(**{**vars(args), "actions": 10, "think": 0}), None))
+        try:
+            results = []
+            for n in levels:
+                print(f"running {n} concurrent sessions x {args.actions} actions…", file=sys.stderr)
+                results.append(asyncio.run(run_level(url, n, args, pid)))
+        finally:
+            if proc:
+                proc.terminate()
+                proc.wait(timeout=10)
+
+    print_table(results)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
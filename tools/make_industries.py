@@ -0,0 +1,116 @@
+"""Regenerate data/industries.csv, the Five Forces dataset.
+
+The five classic teaching examples are kept verbatim. The rest of the
+file is stylised variants of a few dozen base industries (by segment
+and region), with force levels nudged at random from the base profile.
+The output is deterministic for a given seed.
+
+    python tools/make_industries.py [--seed 7] [--out data/industries.csv]
+"""
+import argparse
+import csv
+import random
+from pathlib import Path
+
+LEVELS = ["Low", "Medium", "High"]
+COLUMNS = ["industry", "sector", "new_entrants", "supplier_power", "buyer_power", "substitutes", "rivalry"]
+
+# Hand-picked teaching examples, written out exactly as on the original page
+CLASSICS = {
+    "Airlines":          ("Transport",   ["High", "High", "High", "High", "Low"]),
+    "Soft Drinks":       ("Consumer",    ["Low", "Medium", "Medium", "Medium", "High"]),
+    "Fast Food":         ("Consumer",    ["Medium", "Medium", "High", "Medium", "Medium"]),
+    "Pharmaceuticals":   ("Health",      ["Low", "Medium", "Low", "Medium", "High"]),
+    "Consulting":        ("Services",    ["Medium", "Low", "Low", "Medium", "Medium"]),
+}
+
+# Base profiles: entrants, suppliers, buyers, substitutes, rivalry (0=Low, 2=High)
+BASES = {
+    "Transport": {
+        "Rail Freight": (0, 1, 1, 1, 1), "Trucking": (2, 1, 2, 1, 2), "Container Shipping": (0, 1, 2, 0, 2),
+        "Car Rental": (1, 1, 2, 2, 2), "Ride Hailing": (1, 0, 2, 2, 2), "Courier & Parcel": (1, 1, 1, 1, 2),
+    },
+    "Consumer": {
+        "Bottled Water": (1, 0, 2, 2, 2), "Breweries": (1, 1, 1, 1, 2), "Coffee Chains": (1, 1, 1, 2, 2),
+        "Fast Fashion": (1, 0, 2, 1, 2), "Luxury Goods": (0, 0, 0, 1, 1), "Sportswear": (1, 0, 1, 1, 2),
+        "Toys": (1, 0, 2, 2, 2), "Cosmetics": (1, 0, 1, 1, 2), "Packaged Snacks": (1, 1, 2, 2, 2),
+        "Plant-based Food": (2, 1, 1, 2, 1), "Furniture Retail": (1, 1, 1, 1, 2), "Grocery Retail": (0, 1, 2, 1, 2),
+    },
+    "Technology": {
+        "Cloud Computing": (0, 1, 1, 0, 2), "Semiconductors": (0, 2, 1, 0, 2), "Mobile Operating Systems": (0, 0, 0, 0, 1),
+        "Video Games": (1, 1, 1, 2, 2), "Social Media": (0, 0, 0, 1, 1), "Cybersecurity Software": (1, 0, 1, 1, 1),
+        "Consumer Electronics": (1, 2, 2, 1, 2), "Online Marketplaces": (0, 0, 1, 1, 1), "Streaming Video": (1, 2, 2, 2, 2),
+        "Web Hosting": (2, 1, 2, 1, 2),
+    },
+    "Health": {
+        "Generic Drugs": (1, 1, 2, 0, 2), "Medical Devices": (0, 1, 1, 1, 1), "Hospitals": (0, 2, 1, 0, 1),
+        "Dental Clinics": (1, 1, 1, 0, 1), "Fitness Clubs": (2, 0, 2, 2, 2), "Biotech": (1, 1, 1, 1, 1),
+    },
+    "Services": {
+        "Law Firms": (1, 1, 1, 0, 1), "Advertising Agencies": (2, 0, 2, 1, 2), "Hotels": (1, 1, 2, 2, 2),
+        "Private Education": (1, 1, 1, 2, 1), "Accounting & Audit": (0, 1, 1, 0, 1), "Restaurants": (2, 1, 2, 2, 2),
+        "Staffing Agencies": (2, 1, 2, 1, 2), "Wine Production": (2, 1, 2, 2, 2),
+    },
+    "Industrials": {
+        "Commercial Aircraft": (0, 2, 2, 0, 1), "Steel": (0, 2, 2, 1, 2), "Cement": (0, 1, 1, 0, 1),
+        "Industrial Machinery": (0, 1, 1, 1, 1), "Chemicals": (0, 1, 1, 1, 2), "Construction": (2, 1, 2, 1, 2),
+    },
+    "Energy & Utilities": {
+        "Oil & Gas": (0, 1, 1, 1, 2), "Solar Panels": (1, 1, 2, 1, 2), "Electric Utilities": (0, 1, 0, 0, 0),
+        "Water Utilities": (0, 0, 0, 0, 0), "Wind Power": (1, 2, 1, 1, 1),
+    },
+    "Finance": {
+        "Retail Banking": (1, 0, 1, 1, 1), "Insurance": (1, 0, 1, 0, 1), "Payments": (1, 0, 1, 1, 1),
+        "Asset Management": (1, 1, 2, 1, 2), "Fintech Lending": (2, 1, 2, 2, 2),
+    },
+    "Telecom & Media": {
+        "Mobile Telecom": (0, 1, 2, 1, 2), "Broadband": (0, 1, 1, 1, 1), "Newspapers": (1, 1, 2, 2, 2),
+        "Music Labels": (0, 2, 1, 2, 1), "Book Publishing": (1, 2, 1, 2, 1), "Cinemas": (1, 2, 1, 2, 1),
+    },
+}
+
+SEGMENTS = ["", "Premium ", "Budget ", "Online ", "B2B ", "Specialty ", "Regional "]
+REGIONS = ["North America", "Europe", "Latin America", "China", "India", "Southeast Asia",
+           "Middle East", "Africa", "Japan", "Oceania"]
+
+
+def jitter(profile, rng):
+    # Each force drifts one level up or down with a small probability
+    out = []
+    for level in profile:
+        roll = rng.random()
+        if roll < 0.15:
+            level = max(0, level - 1)
+        elif roll > 0.85:
+            level = min(2, level + 1)
+        out.append(LEVELS[level])
+    return out
+
+
+def build_rows(seed):
+    rng = random.Random(seed)
+    rows = [[name, sector, *levels] for name, (sector, levels) in CLASSICS.items()]
+    for sector, bases in BASES.items():
+        for base, profile in bases.items():
+            for segment in SEGMENTS:
+                for region in REGIONS:
+                    rows.append([f"{segment}{base} ({region})", sector, *jitter(profile, rng)])
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", default=str(Path(__file__).resolve().parent.parent / "data" / "industries.csv"))
+    args = parser.parse_args()
+
+    rows = build_rows(args.seed)
+    with open(args.out, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+    print(f"wrote {len(rows):,} industries to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+// Client-side widgets for the static export (tools/export_static.py).
+// Each <div class="island" data-widget=...> carries its config as JSON;
+// every answer is precomputed in Python, except the value stick sums.
+(function () {
+  "use strict";
+
+  function el(tag, attrs, children) {
+    var node = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (k) {
+      if (k === "html") node.innerHTML = attrs[k];
+      else if (k === "text") node.textContent = attrs[k];
+      else node.setAttribute(k, attrs[k]);
+    });
+    (children || []).forEach(function (c) { node.appendChild(c); });
+    return node;
+  }
+
+  var uid = 0;
+  function nextId() { uid += 1; return "w" + uid; }
+
+  // -------------------------------------------------------
+  // VALUE STICK: WTS <= cost <= price <= WTP (core/value_stick.py)
+  // -------------------------------------------------------
+  function valueStick(root, config) {
+    var inputs = [], outputs = [], readouts = [];
+    var left = el("div", { "class": "column" }, [el("p", { text: "Set the four ‘points’ on the stick:" })]);
+    config.sliders.forEach(function (s) {
+      var id = nextId();
+      var readout = el("span", { "class": "readout", text: s.value });
+      var input = el("input", { type: "range", id: id, min: s.min, max: s.max, step: 1, value: s.value });
+      left.appendChild(el("label", { "for": id }, [document.createTextNode(s.label + " "), readout]));
+      left.appendChild(input);
+      inputs.push(input);
+      readouts.push(readout);
+    });
+    var right = el("div", { "class": "column" }, [el("h3", { text: "Decomposition" })]);
+    var bars = el("div", { "class": "bars" });
+    config.metrics.forEach(function (label, i) {
+      var value = el("div", { "class": "value" });
+      right.appendChild(el("div", { "class": "metric" }, [el("div", { "class": "label", text: label }), value]));
+      outputs.push(value);
+      if (i < 3) {
+        var bar = el("div", { "class": "bar" });
+        bars.appendChild(el("div", { "class": "bar-row" }, [el("span", { text: label }), bar]));
+        outputs[i].bar = bar;
+      }
+    });
+    right.appendChild(bars);
+
+    function update(changed) {
+      // Each slider starts where the previous one sits, as in the app
+      for (var i = 1; i < inputs.length; i++) {
+        var floor = Number(inputs[i - 1].value);
+        inputs[i].min = floor;
+        if (Number(inputs[i].value) < floor) inputs[i].value = floor;
+      }
+      var v = inputs.map(function (x) { return Number(x.value); });
+      var wts = v[0], cost = v[1], price = v[2], wtp = v[3];
+      var parts = [wtp - price, price - cost, cost - wts, wtp - wts];
+      var total = Math.max(parts[3], 1);
+      parts.forEach(function (p, i) {
+        outputs[i].textContent = p;
+        if (outputs[i].bar) outputs[i].bar.style.width = (100 * p / total) + "%";
+      });
+      readouts.forEach(function (r, i) { r.textContent = v[i]; });
+    }
+    inputs.forEach(function (x) { x.addEventListener("input", update); });
+    root.appendChild(el("div", { "class": "columns" }, [left, right]));
+    update();
+  }
+
+  // -------------------------------------------------------
+  // QUIZ: check / reveal against the answer key
+  // -------------------------------------------------------
+  function quiz(root, config) {
+    var slots = [];
+    config.questions.forEach(function (q) {
+      var name = nextId();
+      var block = el("fieldset", { "class": "question" }, [el("legend", { html: "<strong>" + q.question + "</strong>" })]);
+      q.options.forEach(function (option, i) {
+        var id = nextId();
+        block.appendChild(el("div", {}, [
+          el("input", { type: "radio", name: name, id: id, value: i }),
+          el("label", { "for": id, text: " " + option })
+        ]));
+      });
+      var slot = el("div", { "class": "feedback" });
+      block.appendChild(slot);
+      root.appendChild(block);
+      slots.push({ q: q, name: name, slot: slot });
+    });
+    var button = el("button", { type: "button", text: config.check });
+    button.addEventListener("click", function () {
+      slots.forEach(function (s) {
+        var picked = root.querySelector('input[name="' + s.name + '"]:checked');
+        if (!picked) { s.slot.innerHTML = ""; return; }
+        s.slot.innerHTML = Number(picked.value) === s.q.answer ? config.right : s.q.wrong;
+      });
+    });
+    root.appendChild(button);
+  }
+
+  // -------------------------------------------------------
+  // LOOKUP: inputs -> precomputed feedback
+  // -------------------------------------------------------
+  function lookup(root, config) {
+    var readers = [];
+    config.inputs.forEach(function (input) {
+      var id = nextId();
+      if (input.kind === "checkbox") {
+        var box = el("input", { type: "checkbox", id: id });
+        root.appendChild(el("div", {}, [box, el("label", { "for": id, text: " " + input.label })]));
+        readers.push(function () { return box.checked ? "1" : "0"; });
+      } else if (input.kind === "radio") {
+        var group = el("fieldset", {}, [el("legend", { text: input.label })]);
+        input.options.forEach(function (option, i) {
+          var optionId = nextId();
+          var radio = el("input", { type: "radio", name: id, id: optionId, value: option });
+          if (i === 0) radio.checked = true;
+          group.appendChild(el("div", {}, [radio, el("label", { "for": optionId, text: " " + option })]));
+        });
+        root.appendChild(group);
+        readers.push(function () { return group.querySelector("input:checked").value; });
+      } else {
+        var select = el("select", { id: id }, input.options.map(function (option) {
+          return el("option", { value: option, text: option });
+        }));
+        root.appendChild(el("label", { "for": id, text: input.label }));
+        root.appendChild(select);
+        readers.push(function () { return select.value; });
+      }
+    });
+    var out = el("div", { "class": "feedback" });
+    function show() {
+      out.innerHTML = config.table[readers.map(function (r) { return r(); }).join("|")] || "";
+    }
+    if (config.button) {
+      var button = el("button", { type: "button", text: config.button });
+      button.addEventListener("click", show);
+      root.appendChild(button);
+      root.addEventListener("change", function () { out.innerHTML = ""; });
+    } else {
+      root.addEventListener("change", show);
+      show();
+    }
+    root.appendChild(out);
+  }
+
+  function vegaLite(root, spec) {
+    if (window.vegaEmbed) window.vegaEmbed(root, spec, { actions: false });
+    else root.textContent = "(chart needs an internet connection)";
+  }
+
+  var WIDGETS = { valueStick: valueStick, quiz: quiz, lookup: lookup, vegaLite: vegaLite };
+
+  document.querySelectorAll(".island").forEach(function (root) {
+    var config = JSON.parse(root.querySelector("script").textContent);
+    var widget = WIDGETS[root.getAttribute("data-widget")];
+    if (widget) widget(root, config);
+  });
+})();
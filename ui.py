@@ -0,0 +1,115 @@
+import functools
+import time
+
+import streamlit as st
+
+import content
+import diagnostics
+import persistence
+from core import quiz, review
+
+
+# ---------------------------------------------------------
+# SMALL HELPERS (shared by all pages)
+# ---------------------------------------------------------
+# Card HTML depends only on its text, so one rendering per process is enough
+@functools.lru_cache(maxsize=256)
+def card_html(title, body):
+    return f"""
+            <div style="border-radius: 12px; padding: 0.8rem 1rem; 
+                        border: 1px solid #e0e0e0; background-color: #fafafa;">
+                <h4 style="margin-bottom: 0.3rem;">{title}</h4>
+                <p style="margin-top: 0.1rem; margin-bottom: 0rem;">{body}</p>
+            </div>
+            """
+
+
+def info_card(title, body):
+    with st.container():
+        st.markdown(card_html(title, body), unsafe_allow_html=True)
+
+
+# ---------------------------------------------------------
+# QUIZZES (questions come from data/quiz_bank.json)
+# ---------------------------------------------------------
+RIGHT_MESSAGE = "✅ Correct!"
+WRONG_MESSAGE = "❌ Not quite – correct answer: **{}**"
+
+
+@content.shared(show_spinner="Loading quiz bank…")
+def quiz_bank():
+    return quiz.load_bank()
+
+
+def graded(bank, rows, answers):
+    # Grades are cached per question in the session and only questions
+    # whose answer changed are regraded, in one batched pass. The cache
+    # is dropped when the bank (content version) changes.
+    cache = st.session_state.get("quiz_grades")
+    if cache is None or cache["version"] != content.version():
+        cache = st.session_state["quiz_grades"] = {"version": content.version(), "grades": {}}
+    grades = cache["grades"]
+    ids = [bank["ids"][r] for r in rows]
+    stale = [k for k, qid in enumerate(ids) if grades.get(qid, (None,))[0] != answers[k]]
+    if stale:
+        fresh = quiz.grade(bank, rows[stale], [answers[k] for k in stale])
+        for k, grade in zip(stale, fresh):
+            grades[ids[k]] = (answers[k], int(grade))
+        # Every newly graded answer is also a review for the scheduler
+        record_reviews(bank, rows[stale], fresh)
+    return [grades[qid][1] for qid in ids]
+
+
+# A fragment: answering or checking reruns only this block, not the page
+@st.fragment
+@diagnostics.timed_fragment("Quiz")
+def quiz_block(page, topic=None, difficulty=None):
+    bank = quiz_bank()
+    rows = quiz.select(bank, page=page, topic=topic, difficulty=difficulty)
+    answers, feedback = [], []
+    for r in rows:
+        question = bank["questions"][r]
+        st.write(f"**{question['question']}**")
+        answer = st.radio("Choose one:", question["options"], index=None, key=question["id"])
+        answers.append(quiz.answer_index(question, answer))
+        feedback.append(st.empty())
+
+    checked = st.button("✔️ Check my answers", key=f"quiz_check_{page}")
+    if checked:
+        st.session_state[f"quiz_checked_{page}"] = True
+    if st.session_state.get("submitted") or st.session_state.get(f"quiz_checked_{page}"):
+        for r, grade, slot in zip(rows, graded(bank, rows, answers), feedback):
+            if grade == quiz.RIGHT:
+                slot.success(RIGHT_MESSAGE)
+            elif grade == quiz.WRONG:
+                slot.error(WRONG_MESSAGE.format(quiz.correct_answer(bank["questions"][r])))
+
+    # Fragment reruns skip app.py, so answers are saved from here too
+    # (in a full run app.py's own save then finds nothing new)
+    persistence.save_changes()
+
+
+# ---------------------------------------------------------
+# SPACED REVIEW STATE (scheduling lives in core/review.py)
+# ---------------------------------------------------------
+def review_cards(bank):
+    # The learner's cards stay in the session as one fixed-width array.
+    # The saved sparse record ("review_cards", put back by persistence.py)
+    # is only decoded when the session starts or the bank changes.
+    state = st.session_state.get("review_state")
+    if state is None or state["version"] != content.version():
+        cards = review.from_record(st.session_state.get("review_cards"), bank["position"], len(bank["ids"]))
+        state = st.session_state["review_state"] = {"version": content.version(), "cards": cards}
+    return state["cards"]
+
+
+def record_reviews(bank, rows, grades):
+    cards = review_cards(bank)
+    now = time.time()
+    for row, grade in zip(rows, grades):
+        if grade == quiz.UNANSWERED:
+            continue
+        quality = review.RIGHT_QUALITY if grade == quiz.RIGHT else review.WRONG_QUALITY
+        review.review(cards, row, quality, now)
+    # A new record object, so persistence.save_changes() sees the change
+    st.session_state["review_cards"] = review.to_record(cards, bank["ids"])
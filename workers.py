@@ -0,0 +1,42 @@
+import multiprocessing
+import os
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import streamlit as st
+
+# ---------------------------------------------------------
+# BACKGROUND WORKERS (shared by the simulator pages)
+# ---------------------------------------------------------
+MAX_PROCESSES = 4
+
+
+def cpu_count():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@st.cache_resource
+def process_pool():
+    # None on a single CPU, where shipping work to a process only adds cost.
+    # spawn, not fork: the server process runs Streamlit's own threads.
+    cpus = cpu_count()
+    if cpus < 2:
+        return None
+    return ProcessPoolExecutor(min(MAX_PROCESSES, cpus), mp_context=multiprocessing.get_context("spawn"))
+
+
+@st.cache_resource
+def background_pool():
+    # For jobs that must not block a rerun even on one CPU: the process
+    # pool when there is one, otherwise a worker thread (NumPy releases
+    # the GIL for most of the heavy lifting)
+    return process_pool() or ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation")
+
+
+def discard_if_broken(err):
+    # A pool whose worker died refuses all new work: drop the cached pools
+    # so the next job starts fresh ones
+    if isinstance(err, BrokenExecutor):
+        process_pool.clear()
+        background_pool.clear()